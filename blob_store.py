@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Blob Store for the RPA Benchmark Test Runner
+Keeps iteration stdout/stderr and artifacts out of the result records
+
+Blobs are addressed by the SHA-256 of their uncompressed content, so the
+identical banners and tracebacks printed by hundreds of iterations are
+stored once. Objects are compressed with zstd when the `zstandard` package
+is installed and with gzip otherwise; the file extension records which.
+Result records keep only the "sha256:<hex>" digests.
+
+Print a stored blob:
+    python3 blob_store.py results/blobs sha256:<hex>
+"""
+
+import gzip
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODECS = (".zst", ".gz")
+
+
+class BlobStore:
+    """Deduplicating, compressed object directory keyed by SHA-256"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.extension = ".zst" if zstandard else ".gz"
+        # Statistics for blobs put during this run
+        self.puts = 0
+        self.deduplicated = 0
+        self.logical_bytes = 0
+        self.stored_bytes = 0
+
+    def _object_path(self, hexdigest: str, extension: str) -> Path:
+        return self.root / hexdigest[:2] / (hexdigest[2:] + extension)
+
+    def _find(self, hexdigest: str) -> Optional[Path]:
+        for extension in CODECS:
+            path = self._object_path(hexdigest, extension)
+            if path.exists():
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.extension == ".zst":
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6, mtime=0)
+
+    def put(self, data: Union[bytes, str]) -> str:
+        """Store `data` (str is UTF-8 encoded) and return its digest"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        hexdigest = hashlib.sha256(data).hexdigest()
+        self.puts += 1
+        self.logical_bytes += len(data)
+
+        if self._find(hexdigest) is not None:
+            self.deduplicated += 1
+            return f"sha256:{hexdigest}"
+
+        path = self._object_path(hexdigest, self.extension)
+        path.parent.mkdir(exist_ok=True)
+        compressed = self._compress(data)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        self.stored_bytes += len(compressed)
+        return f"sha256:{hexdigest}"
+
+    def put_file(self, path: Union[str, Path]) -> str:
+        with open(path, "rb") as f:
+            return self.put(f.read())
+
+    def get(self, digest: str) -> bytes:
+        """Return the uncompressed content of a stored blob"""
+        hexdigest = digest.split(":", 1)[-1]
+        path = self._find(hexdigest)
+        if path is None:
+            raise KeyError(digest)
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        return gzip.decompress(data)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "puts": self.puts,
+            "deduplicated": self.deduplicated,
+            "logical_mb": round(self.logical_bytes / 1024 / 1024, 3),
+            "stored_mb": round(self.stored_bytes / 1024 / 1024, 3),
+        }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Usage: python3 blob_store.py <store-dir> <sha256:digest>")
+        return 1
+    try:
+        sys.stdout.buffer.write(BlobStore(argv[0]).get(argv[1]))
+    except KeyError:
+        print(f"✗ Blob not found: {argv[1]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
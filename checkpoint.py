@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Campaign Checkpoints for the RPA Benchmark Test Runner
+Lets an interrupted benchmark campaign resume where it stopped
+
+The checkpoint is an append-only JSON Lines file in the output directory.
+The first line describes the campaign (config hash, base seed, results
+file); every finished iteration appends one line with its
+(tool, scenario, iteration) key, the seed it ran with and its result.
+Each line is flushed and fsynced, so a crash or preemption loses at most
+the iteration that was running. `--resume` reloads the file, refuses to
+continue a campaign whose configuration changed, and skips finished work.
+"""
+
+import hashlib
+import json
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CHECKPOINT_FILE = "campaign_checkpoint.jsonl"
+
+
+def config_hash(config: Any) -> str:
+    """Stable hash of the campaign configuration (JSON-serializable)"""
+    encoded = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CheckpointMismatch(Exception):
+    """The checkpoint on disk belongs to a different campaign configuration"""
+
+
+class CampaignCheckpoint:
+    """Completed iterations, seeds and results of one benchmark campaign"""
+
+    def __init__(self, output_dir: str, campaign_hash: str, resume: bool = False,
+                 results_file: Optional[str] = None):
+        self.path = Path(output_dir) / CHECKPOINT_FILE
+        self.campaign_hash = campaign_hash
+        self.completed: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        self.results: List[Dict[str, Any]] = []
+        self.resumed = False
+
+        if resume and self.path.exists() and self._load():
+            self.resumed = True
+        else:
+            self.base_seed = random.SystemRandom().randrange(2 ** 32)
+            self.results_file = results_file
+            header = {
+                "type": "campaign",
+                "config_hash": campaign_hash,
+                "base_seed": self.base_seed,
+                "results_file": results_file,
+                "started": datetime.utcnow().isoformat() + "Z",
+            }
+            with open(self.path, "w") as f:
+                f.write(json.dumps(header) + "\n")
+
+    def _load(self) -> bool:
+        """Read the checkpoint; False if it has no complete header line
+
+        Only newline-terminated lines that parse are kept. A torn final line
+        from a crash mid-write is cut off the file, so record() appends the
+        next entry on a line of its own.
+        """
+        with open(self.path, "rb") as f:
+            data = f.read()
+        entries = []
+        good_end = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+            good_end += len(line)
+        if good_end < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+                f.flush()
+                os.fsync(f.fileno())
+        if not entries:
+            # Crashed before the header was written: nothing to resume
+            return False
+
+        header = entries[0]
+        if header["config_hash"] != self.campaign_hash:
+            raise CheckpointMismatch(
+                f"{self.path} was written for config {header['config_hash'][:12]}, "
+                f"current config is {self.campaign_hash[:12]}")
+        self.base_seed = header["base_seed"]
+        self.results_file = header.get("results_file")
+
+        for entry in entries[1:]:
+            key = (entry["tool"], entry["scenario"], entry["iteration"])
+            self.completed[key] = entry["result"]
+            self.results.append(entry["result"])
+        return True
+
+    def seed_for(self, tool: str, scenario: str, iteration: int) -> int:
+        """Deterministic per-iteration seed derived from the campaign seed"""
+        digest = hashlib.sha256(f"{self.base_seed}:{tool}:{scenario}:{iteration}".encode("utf-8"))
+        return int.from_bytes(digest.digest()[:4], "big")
+
+    def is_done(self, tool: str, scenario: str, iteration: int) -> bool:
+        return (tool, scenario, iteration) in self.completed
+
+    def result_for(self, tool: str, scenario: str, iteration: int) -> Optional[Dict[str, Any]]:
+        return self.completed.get((tool, scenario, iteration))
+
+    def record(self, result: Dict[str, Any], seed: Optional[int] = None):
+        """Durably mark an iteration as finished"""
+        key = (result["tool"], result["scenario"], result["iteration"])
+        entry = {
+            "type": "iteration",
+            "tool": key[0],
+            "scenario": key[1],
+            "iteration": key[2],
+            "seed": seed,
+            "result": result,
+        }
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed[key] = result
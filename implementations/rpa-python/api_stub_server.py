@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Local JSON API Stub for the API Integration scenario
+A jsonplaceholder-style REST service served from memory
+
+Endpoints (all require "Authorization: Bearer <API_TOKEN>"):
+    GET    /posts               all posts, ?userId=N filters
+    GET    /posts?id=1&id=2     batch lookup of several posts in one call
+    GET    /posts/<id>
+    POST   /posts               create, returns 201 with the new id
+    PUT    /posts/<id>          replace
+    DELETE /posts/<id>
+
+Run standalone with `python3 api_stub_server.py --port 8000`, or start it
+in-process through APIStub (see local_server.LocalServer).
+"""
+
+import argparse
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from local_server import LocalServer, QuietHandler
+
+API_TOKEN = "rpa-benchmark-token"
+
+POST_COUNT = 100
+USERS = 10
+
+
+def seed_posts():
+    return {
+        i: {
+            "userId": (i - 1) // (POST_COUNT // USERS) + 1,
+            "id": i,
+            "title": f"Post {i} title",
+            "body": f"Body of post {i}. " * 4,
+        }
+        for i in range(1, POST_COUNT + 1)
+    }
+
+
+class APIStubHandler(QuietHandler):
+    # Set on the subclass APIStub creates, so each server has its own data
+    posts = {}
+    lock = threading.Lock()
+    latency_s = 0.0
+
+    def route(self):
+        """Return (post_id or None, query) for /posts paths, or None on 404"""
+        parts = urlsplit(self.path)
+        segments = [s for s in parts.path.split("/") if s]
+        if not segments or segments[0] != "posts" or len(segments) > 2:
+            return None
+        if len(segments) == 2:
+            if not segments[1].isdigit():
+                return None
+            return int(segments[1]), {}
+        return None, parse_qs(parts.query)
+
+    def handle_request(self):
+        # Every early reply drains the request body first, or the next
+        # request on this keep-alive connection would be parsed from it
+        if self.headers.get("Authorization") != f"Bearer {API_TOKEN}":
+            self.read_body()
+            self.send_body(401, json.dumps({"error": "missing or invalid token"}))
+            return
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        route = self.route()
+        if route is None:
+            self.read_body()
+            self.send_body(404, json.dumps({"error": "not found"}))
+            return
+        post_id, query = route
+        method = self.command
+
+        with self.lock:
+            if method == "GET" and post_id is None:
+                posts = list(self.posts.values())
+                if "id" in query:
+                    ids = {int(i) for i in query["id"]}
+                    posts = [p for p in posts if p["id"] in ids]
+                if "userId" in query:
+                    posts = [p for p in posts if str(p["userId"]) in query["userId"]]
+                self.send_body(200, json.dumps(posts))
+            elif method == "POST" and post_id is None:
+                post = json.loads(self.read_body() or b"{}")
+                post["id"] = max(self.posts, default=0) + 1
+                self.posts[post["id"]] = post
+                self.send_body(201, json.dumps(post))
+            elif post_id not in self.posts:
+                self.read_body()
+                self.send_body(404, json.dumps({"error": f"post {post_id} not found"}))
+            elif method == "GET":
+                self.send_body(200, json.dumps(self.posts[post_id]))
+            elif method == "PUT":
+                post = json.loads(self.read_body() or b"{}")
+                post["id"] = post_id
+                self.posts[post_id] = post
+                self.send_body(200, json.dumps(post))
+            elif method == "DELETE":
+                del self.posts[post_id]
+                self.send_body(200, "{}")
+            else:
+                self.read_body()
+                self.send_body(405, json.dumps({"error": f"{method} not allowed"}))
+
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+
+class APIStub(LocalServer):
+    """LocalServer running a fresh copy of the stub data"""
+
+    def __init__(self, latency_ms=0.0, host="127.0.0.1", port=0):
+        handler = type("APIStubHandler", (APIStubHandler,), {
+            "posts": seed_posts(),
+            "lock": threading.Lock(),
+            "latency_s": latency_ms / 1000,
+        })
+        super().__init__(handler, host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSON API stub")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated server processing time per request")
+    args = parser.parse_args()
+
+    stub = APIStub(latency_ms=args.latency_ms, port=args.port)
+    print(f"API stub listening on {stub.url} (token: {API_TOKEN})")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+API Integration Test for RPA Python
+REST calls against a bundled local JSON stub, with client throughput
+
+Follows Test Scenario 5 (GET /posts, filter by userId, POST, PUT, DELETE,
+authentication headers, status codes) against api_stub_server.APIStub, so
+no public service is involved. It then issues the same GET workload
+through competing clients:
+  - naive: a fresh requests.get per call (new TCP connection every time)
+  - session: one pooled requests.Session reusing keep-alive connections
+  - async: asyncio client with a bounded pool of keep-alive connections
+  - async-batched: the async client fetching posts in batched calls
+    (GET /posts?id=1&id=2...)
+Each client reports req/s plus p50/p99 latency per HTTP request, and all
+results are written to an Excel workbook.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import benchmark_report
+from api_stub_server import API_TOKEN, POST_COUNT, APIStub
+
+AUTH_HEADERS = {"Authorization": f"Bearer {API_TOKEN}"}
+
+
+def latency_stats(latencies_ms):
+    if not latencies_ms:
+        return {"p50_ms": None, "p99_ms": None}
+    if len(latencies_ms) == 1:
+        return {"p50_ms": round(latencies_ms[0], 3), "p99_ms": round(latencies_ms[0], 3)}
+    cuts = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+    return {"p50_ms": round(cuts[49], 3), "p99_ms": round(cuts[98], 3)}
+
+
+class AsyncHTTPPool:
+    """Minimal asyncio HTTP/1.1 client over a bounded pool of keep-alive connections
+
+    At most `size` requests are in flight; each one borrows a connection
+    from the pool and returns it when the response body has been read.
+    """
+
+    def __init__(self, base_url, size, headers):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.ssl = parts.scheme == "https"
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.size = size
+        self.header_block = "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+        self.idle = None
+        self.connections = []
+
+    async def __aenter__(self):
+        self.idle = asyncio.Queue()
+        for _ in range(self.size):
+            self.idle.put_nowait(None)  # connected lazily on first use
+        return self
+
+    async def __aexit__(self, *exc):
+        for _, writer in self.connections:
+            writer.close()
+
+    async def connect(self):
+        conn = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+        self.connections.append(conn)
+        return conn
+
+    async def read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed before response")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                body += await reader.readexactly(size)
+                await reader.readline()
+            body = bytes(body)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return status, body, headers.get("connection", "").lower() == "close"
+
+    async def get(self, path):
+        """GET path; returns (status, body bytes, latency ms)"""
+        conn = await self.idle.get()
+        try:
+            start = time.perf_counter()
+            if conn is None:
+                conn = await self.connect()
+            reader, writer = conn
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                         f"{self.header_block}\r\n".encode("latin-1"))
+            await writer.drain()
+            status, body, close = await self.read_response(reader)
+            latency_ms = (time.perf_counter() - start) * 1000
+            if close:
+                writer.close()
+                conn = None
+            return status, body, latency_ms
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            if conn is not None:
+                conn[1].close()
+            conn = None
+            raise
+        finally:
+            self.idle.put_nowait(conn)
+
+
+class APIIntegrationTest:
+    def __init__(self, calls=2000, concurrency=16, batch_size=50, latency_ms=1.0,
+                 base_url=None, output_dir="test-data/api"):
+        self.calls = calls
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.latency_ms = latency_ms
+        self.base_url = base_url
+        self.output_dir = Path(output_dir)
+        self.output_file = self.output_dir / "api_results.xlsx"
+        self.created_dir = False
+
+        self.endpoints = []
+        self.clients = {}
+        self.status_errors = 0
+
+    def call(self, session, method, path, expected, **kwargs):
+        """One timed Scenario 5 request, checked against the expected status"""
+        kwargs.setdefault("headers", AUTH_HEADERS)
+        start = time.perf_counter()
+        response = session.request(method, self.base_url + path, timeout=10, **kwargs)
+        latency_ms = (time.perf_counter() - start) * 1000
+        ok = response.status_code == expected
+        self.endpoints.append({
+            "method": method,
+            "path": path,
+            "status": response.status_code,
+            "expected": expected,
+            "latency_ms": round(latency_ms, 3),
+        })
+        mark = "✓" if ok else "✗"
+        print(f"{mark} {method:<6} {path:<20} {response.status_code} ({latency_ms:.2f} ms)")
+        if not ok:
+            self.status_errors += 1
+        return response
+
+    def run_crud_steps(self):
+        import requests
+
+        print("\nScenario steps:")
+        with requests.Session() as session:
+            # Steps 1-2: GET /posts and parse JSON
+            posts = self.call(session, "GET", "/posts", 200).json()
+            assert len(posts) >= POST_COUNT, f"Expected {POST_COUNT} posts, got {len(posts)}"
+
+            # Step 3: filter posts by userId = 1
+            user_posts = [p for p in posts if p["userId"] == 1]
+            filtered = self.call(session, "GET", "/posts", 200, params={"userId": 1}).json()
+            assert [p["id"] for p in filtered] == [p["id"] for p in user_posts], \
+                "Server-side userId filter disagrees with client-side filter"
+            print(f"  userId=1 has {len(user_posts)} posts")
+
+            # Step 4: POST a new post
+            new_post = {"userId": 1, "title": "RPA benchmark post", "body": "Created by api_test"}
+            created = self.call(session, "POST", "/posts", 201, json=new_post).json()
+            post_id = created["id"]
+
+            # Step 5: PUT an update
+            updated = dict(created, title="RPA benchmark post (updated)")
+            result = self.call(session, "PUT", f"/posts/{post_id}", 200, json=updated).json()
+            assert result["title"] == updated["title"], "PUT did not apply the update"
+
+            # Step 6: DELETE it, then confirm it is gone
+            self.call(session, "DELETE", f"/posts/{post_id}", 200)
+            self.call(session, "GET", f"/posts/{post_id}", 404)
+
+            # Step 7: authentication headers are enforced
+            self.call(session, "GET", "/posts/1", 401, headers={})
+            self.call(session, "GET", "/posts/1", 401,
+                      headers={"Authorization": "Bearer wrong-token"})
+
+        # Step 8: every status code matched
+        assert self.status_errors == 0, f"{self.status_errors} unexpected status code(s)"
+
+    def post_paths(self):
+        return [f"/posts/{i % POST_COUNT + 1}" for i in range(self.calls)]
+
+    def record_client(self, name, seconds, latencies_ms, errors, requests_made=None):
+        requests_made = requests_made if requests_made is not None else len(latencies_ms)
+        stats = {
+            "calls": self.calls,
+            "requests": requests_made,
+            "errors": errors,
+            "seconds": round(seconds, 3),
+            "req_per_s": round(self.calls / seconds, 1) if seconds else None,
+            **latency_stats(latencies_ms),
+        }
+        self.clients[name] = stats
+        print(f"  {name:<14} {stats['req_per_s']:>10,.0f} req/s  "
+              f"p50 {stats['p50_ms']:.2f} ms  p99 {stats['p99_ms']:.2f} ms"
+              + (f"  ({errors} errors)" if errors else ""))
+        return stats
+
+    def bench_naive(self):
+        import requests
+
+        latencies, errors = [], 0
+        start = time.perf_counter()
+        for path in self.post_paths():
+            t = time.perf_counter()
+            # Connection: close keeps requests from reusing anything behind our back
+            response = requests.get(self.base_url + path, timeout=10,
+                                    headers={**AUTH_HEADERS, "Connection": "close"})
+            latencies.append((time.perf_counter() - t) * 1000)
+            errors += response.status_code != 200
+        self.record_client("naive", time.perf_counter() - start, latencies, errors)
+
+    def bench_session(self):
+        import requests
+
+        latencies, errors = [], 0
+        start = time.perf_counter()
+        with requests.Session() as session:
+            session.headers.update(AUTH_HEADERS)
+            for path in self.post_paths():
+                t = time.perf_counter()
+                response = session.get(self.base_url + path, timeout=10)
+                latencies.append((time.perf_counter() - t) * 1000)
+                errors += response.status_code != 200
+        self.record_client("session", time.perf_counter() - start, latencies, errors)
+
+    async def fetch_all(self, paths):
+        async with AsyncHTTPPool(self.base_url, self.concurrency, AUTH_HEADERS) as pool:
+            return await asyncio.gather(*(pool.get(path) for path in paths),
+                                        return_exceptions=True)
+
+    def bench_async(self, name, paths, expected_counts=None):
+        """Run paths through the async pool; expected_counts maps path -> posts in the reply"""
+        start = time.perf_counter()
+        responses = asyncio.run(self.fetch_all(paths))
+        seconds = time.perf_counter() - start
+
+        latencies, errors = [], 0
+        for path, response in zip(paths, responses):
+            if isinstance(response, Exception):
+                errors += 1
+                continue
+            status, body, latency_ms = response
+            latencies.append(latency_ms)
+            if status != 200:
+                errors += 1
+            elif expected_counts and len(json.loads(body)) != expected_counts[path]:
+                errors += 1
+        self.record_client(name, seconds, latencies, errors, requests_made=len(paths))
+
+    def bench_async_batched(self):
+        ids = [i % POST_COUNT + 1 for i in range(self.calls)]
+        batches = [ids[i:i + self.batch_size] for i in range(0, len(ids), self.batch_size)]
+        # Posts repeat across the workload, so a batch asks for each id once
+        paths = ["/posts?" + "&".join(f"id={i}" for i in sorted(set(batch))) for batch in batches]
+        expected = {path: len(set(batch)) for path, batch in zip(paths, batches)}
+        self.bench_async("async-batched", paths, expected)
+
+    def run_client_comparison(self):
+        print(f"\nClient comparison ({self.calls:,} calls, concurrency {self.concurrency}, "
+              f"batch size {self.batch_size}):")
+        self.bench_naive()
+        self.bench_session()
+        self.bench_async("async", self.post_paths())
+        self.bench_async_batched()
+
+    def write_workbook(self):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        self.created_dir = not self.output_dir.exists()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        wb = Workbook()
+
+        ws = wb.active
+        ws.title = "Endpoints"
+        ws.append(["Method", "Path", "Status", "Expected", "Latency (ms)"])
+        for endpoint in self.endpoints:
+            ws.append([endpoint["method"], endpoint["path"], endpoint["status"],
+                       endpoint["expected"], endpoint["latency_ms"]])
+
+        ws_clients = wb.create_sheet("Clients")
+        ws_clients.append(["Client", "Calls", "HTTP Requests", "Errors", "Seconds",
+                           "Req/s", "p50 (ms)", "p99 (ms)"])
+        for name, stats in self.clients.items():
+            ws_clients.append([name, stats["calls"], stats["requests"], stats["errors"],
+                               stats["seconds"], stats["req_per_s"], stats["p50_ms"], stats["p99_ms"]])
+
+        for sheet in (ws, ws_clients):
+            for cell in sheet[1]:
+                cell.font = Font(bold=True)
+        wb.save(self.output_file)
+        print(f"\n✓ Results written to {self.output_file}")
+
+    def cleanup(self):
+        benchmark_report.discard(self.output_file)
+        if self.created_dir:
+            # Only removed when empty, so files placed there meanwhile survive
+            try:
+                self.output_dir.rmdir()
+            except OSError:
+                pass
+
+    def run(self):
+        print("\n" + "="*60)
+        print("API INTEGRATION TEST")
+        print("="*60)
+
+        stub = None
+        if self.base_url is None:
+            stub = APIStub(latency_ms=self.latency_ms).start()
+            self.base_url = stub.url
+            print(f"Local API stub: {self.base_url} ({self.latency_ms:g} ms per request)")
+
+        start_time = time.perf_counter()
+        try:
+            self.run_crud_steps()
+            self.run_client_comparison()
+            self.write_workbook()
+        except (AssertionError, OSError) as e:
+            print(f"\n✗ Test failed: {e}")
+            benchmark_report.record("api", {"status_errors": self.status_errors,
+                                            "endpoints": self.endpoints, "clients": self.clients})
+            return 1
+        finally:
+            self.cleanup()
+            if stub is not None:
+                stub.stop()
+
+        total_ms = (time.perf_counter() - start_time) * 1000
+        fastest = max(self.clients, key=lambda c: self.clients[c]["req_per_s"] or 0)
+        client_errors = sum(stats["errors"] for stats in self.clients.values())
+        benchmark_report.record("api", {
+            "calls": self.calls,
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "server_latency_ms": self.latency_ms,
+            "status_errors": self.status_errors,
+            "client_errors": client_errors,
+            "endpoints": self.endpoints,
+            "clients": self.clients,
+            "fastest": fastest
+        })
+
+        print("\n" + "="*60)
+        print("TEST SUMMARY")
+        print("="*60)
+        print(f"Total Duration: {total_ms / 1000:.2f} seconds")
+        print(f"Endpoint checks: {len(self.endpoints)}, unexpected status codes: {self.status_errors}")
+        print(f"Fastest client: {fastest} ({self.clients[fastest]['req_per_s']:,.0f} req/s)")
+
+        if client_errors:
+            print(f"\n⚠ API TEST COMPLETED WITH {client_errors} FAILED CALLS")
+            return 1
+        print("\n✓ All API integration tests passed!")
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API integration benchmark")
+    parser.add_argument("--calls", type=int, default=2000,
+                        help="GET calls per client in the comparison (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="Connections in the async client pool (default: 16)")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Posts per batched call (default: 50)")
+    parser.add_argument("--server-latency-ms", type=float, default=1.0,
+                        help="Simulated processing time of the bundled stub (default: 1.0)")
+    parser.add_argument("--url",
+                        help="Use an already running API stub instead of starting one")
+    parser.add_argument("--output-dir", default="test-data/api",
+                        help="Directory for the results workbook, removed afterwards")
+    args = parser.parse_args()
+
+    test = APIIntegrationTest(calls=args.calls, concurrency=args.concurrency,
+                              batch_size=args.batch_size, latency_ms=args.server_latency_ms,
+                              base_url=args.url.rstrip("/") if args.url else None,
+                              output_dir=args.output_dir)
+    return test.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
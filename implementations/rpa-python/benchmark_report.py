@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark Report Channel for RPA Python tests
+Hands structured metrics from a test script back to test_runner.py
+
+test_runner.py points RPA_BENCH_REPORT at a JSON file before launching a
+test. Scripts call record() with any metrics they collect (phase times,
+memory profiles, throughput figures) and the report is written when the
+interpreter exits. When the variable is unset, e.g. a script run by hand,
+recording still works but nothing is written.
+
+With a blob store enabled the runner also sets RPA_BENCH_ARTIFACT_DIR;
+artifact() copies produced files there before the script cleans them up.
+discard() does both for a script's own files, and never removes a
+directory, which may be one the user passed in.
+"""
+
+import atexit
+import json
+import os
+import shutil
+from typing import Any, Dict, Optional
+
+REPORT_ENV = "RPA_BENCH_REPORT"
+SEED_ENV = "RPA_BENCH_SEED"
+ARTIFACT_ENV = "RPA_BENCH_ARTIFACT_DIR"
+
+_report: Dict[str, Any] = {}
+
+
+def enabled() -> bool:
+    """Return True when running under test_runner.py"""
+    return bool(os.environ.get(REPORT_ENV))
+
+
+def record(key: str, value: Any):
+    """Store a JSON-serialisable value under `key` in the report"""
+    _report[key] = value
+
+
+def get(key: str, default: Any = None) -> Any:
+    """Return a previously recorded value"""
+    return _report.get(key, default)
+
+
+def seed(default: Optional[int] = None) -> Optional[int]:
+    """Seed the runner assigned to this iteration, for repeatable randomness"""
+    value = os.environ.get(SEED_ENV)
+    return int(value) if value else default
+
+
+def artifact(path):
+    """Keep a copy of a produced file (e.g. an xlsx) for the runner's blob store"""
+    directory = os.environ.get(ARTIFACT_ENV)
+    if not directory or not os.path.isfile(path):
+        return
+    shutil.copy2(path, os.path.join(directory, os.path.basename(path)))
+
+
+def discard(*paths, keep: bool = True):
+    """Delete files a test produced, first copying them to the blob store
+    unless `keep` is False; files that do not exist are skipped"""
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        if keep:
+            artifact(path)
+        os.remove(path)
+
+
+def save():
+    """Write the report to the path given by RPA_BENCH_REPORT"""
+    path = os.environ.get(REPORT_ENV)
+    if not path or not _report:
+        return
+    with open(path, 'w') as f:
+        json.dump(_report, f, indent=2, default=str)
+
+
+atexit.register(save)
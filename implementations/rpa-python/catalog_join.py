@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Keyed Catalog Join for RPA Python tests
+Matches product catalog rows to scraped market rows by product key
+
+Phase 3 used to pair catalog and market rows by position ("Widget A" is
+row 2 in both sheets), which breaks once the sources are unordered or
+larger than 26 items. CatalogJoin builds a hash index on the catalog (the
+build side) and probes it with market rows one at a time, so the market
+side can be streamed and memory stays proportional to the catalog.
+
+Run directly to benchmark join throughput:
+    python3 catalog_join.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# "Premium Widget A" and "Widget A" both identify product WIDGET A
+WIDGET_KEY = re.compile(r"\bwidget\s+([a-z0-9]+)\s*$", re.IGNORECASE)
+
+# Unmatched market keys are counted, but only this many are kept as examples
+UNMATCHED_SAMPLE_SIZE = 20
+
+
+def item_label(index: int) -> str:
+    """Spreadsheet-style label for a 1-based index: 1 -> A, 26 -> Z, 27 -> AA"""
+    label = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+def product_key(name: Any) -> str:
+    """Normalise a product or item name to its join key"""
+    if name is None:
+        return ""
+    text = " ".join(str(name).split())
+    match = WIDGET_KEY.search(text)
+    if match:
+        return f"WIDGET {match.group(1).upper()}"
+    return text.upper()
+
+
+class CatalogJoin:
+    """
+    Hash join with the catalog as build side and market rows as probe side
+
+    Rows are (row_number, record) pairs so analysis formulas can reference
+    the source sheet rows of every match.
+    """
+
+    def __init__(self, catalog_rows: Iterable[Tuple[int, Dict[str, Any]]],
+                 catalog_key: Callable[[Dict[str, Any]], str] = lambda r: product_key(r['name']),
+                 market_key: Callable[[Dict[str, Any]], str] = lambda r: product_key(r['item_name'])):
+        self.market_key = market_key
+        self.index: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self.duplicate_catalog_keys: Dict[str, List[int]] = {}
+        self.matches: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self.duplicate_market_keys: Dict[str, List[int]] = {}
+        self.unmatched_market_count = 0
+        self.unmatched_market_sample: List[str] = []
+        self.market_rows = 0
+
+        for row_number, record in catalog_rows:
+            key = catalog_key(record)
+            if key in self.index:
+                # First occurrence wins; later rows are reported
+                self.duplicate_catalog_keys.setdefault(key, [self.index[key][0]]).append(row_number)
+                continue
+            self.index[key] = (row_number, record)
+
+    def probe(self, row_number: int, record: Dict[str, Any]) -> bool:
+        """Match one market row against the catalog; returns True on a match"""
+        self.market_rows += 1
+        key = self.market_key(record)
+        if key not in self.index:
+            self.unmatched_market_count += 1
+            if len(self.unmatched_market_sample) < UNMATCHED_SAMPLE_SIZE:
+                self.unmatched_market_sample.append(key)
+            return False
+        if key in self.matches:
+            self.duplicate_market_keys.setdefault(key, [self.matches[key][0]]).append(row_number)
+            return False
+        self.matches[key] = (row_number, record)
+        return True
+
+    def probe_all(self, market_rows: Iterable[Tuple[int, Dict[str, Any]]]) -> "CatalogJoin":
+        for row_number, record in market_rows:
+            self.probe(row_number, record)
+        return self
+
+    def matched_rows(self) -> List[Tuple[str, int, Dict[str, Any], int, Dict[str, Any]]]:
+        """(key, catalog_row, catalog_record, market_row, market_record) in catalog order"""
+        rows = []
+        for key, (market_row, market_record) in self.matches.items():
+            catalog_row, catalog_record = self.index[key]
+            rows.append((key, catalog_row, catalog_record, market_row, market_record))
+        rows.sort(key=lambda match: match[1])
+        return rows
+
+    def unmatched_catalog_keys(self) -> List[str]:
+        return [key for key in self.index if key not in self.matches]
+
+    def stats(self) -> Dict[str, Any]:
+        """Join summary suitable for printing and the benchmark report"""
+        return {
+            'catalog_rows': len(self.index) + sum(len(rows) - 1 for rows in self.duplicate_catalog_keys.values()),
+            'market_rows': self.market_rows,
+            'matched': len(self.matches),
+            'unmatched_catalog': self.unmatched_catalog_keys()[:UNMATCHED_SAMPLE_SIZE],
+            'unmatched_catalog_count': len(self.index) - len(self.matches),
+            'unmatched_market': self.unmatched_market_sample,
+            'unmatched_market_count': self.unmatched_market_count,
+            'duplicate_catalog_keys': self.duplicate_catalog_keys,
+            'duplicate_market_keys': self.duplicate_market_keys,
+        }
+
+
+def _synthetic_sources(size: int, rng: random.Random):
+    """Unordered catalog and market rows with ~5% misses and ~1% duplicates"""
+    catalog = [(row, {'name': f"Product Widget {item_label(i)}", 'target_price': rng.uniform(10, 100)})
+               for row, i in enumerate(rng.sample(range(1, size + 1), size), 2)]
+    market_ids = [i for i in range(1, size + 1) if rng.random() >= 0.05]
+    market_ids += rng.sample(market_ids, size // 100)
+    market_ids += range(size + 1, size + 1 + size // 20)
+    rng.shuffle(market_ids)
+    market = [(row, {'item_name': f"Widget {item_label(i)}", 'market_price': rng.uniform(10, 100)})
+              for row, i in enumerate(market_ids, 2)]
+    return catalog, market
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the keyed catalog join")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Catalog sizes to benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'Products':>10} {'Build (ms)':>12} {'Probe (ms)':>12} {'Rows/s':>14} "
+          f"{'Matched':>10} {'Unmatched':>10} {'Dup Keys':>9}")
+    for size in args.sizes:
+        catalog, market = _synthetic_sources(size, random.Random(args.seed))
+
+        start = time.perf_counter()
+        join = CatalogJoin(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        join.probe_all(market)
+        probe_ms = (time.perf_counter() - start) * 1000
+
+        total_rows = len(catalog) + len(market)
+        stats = join.stats()
+        rows_per_second = total_rows / ((build_ms + probe_ms) / 1000)
+        print(f"{size:>10,} {build_ms:>12.1f} {probe_ms:>12.1f} {rows_per_second:>14,.0f} "
+              f"{stats['matched']:>10,} {stats['unmatched_market_count']:>10,} "
+              f"{len(stats['duplicate_market_keys']):>9,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Error Recovery Test for RPA Python
+Fault injection against the business workflow, with recovery metrics
+
+Follows Test Scenario 7: the streaming BusinessWorkflowTest is run against
+a local fault_server.FaultServer once per failure mode, with its retry
+policy (retry_policy.RetryPolicy) handling the faults:
+  - network: request timeouts, 5xx responses, truncated HTML, slow bodies
+  - input files: the product catalog deleted, truncated, overwritten with
+    garbage, or with its sheet XML cut short after Phase 1 writes it
+Every mode is also run once without retries to confirm the fault really
+breaks an unprotected run. For each mode the test reports whether the
+workflow recovered, the time-to-recover per failed operation, and the
+throughput cost (items/s and duration) against a fault-free baseline.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import shutil
+import statistics
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+import benchmark_report
+from business_workflow_test import BusinessWorkflowTest
+from fault_server import FaultServer
+from retry_policy import RetryPolicy
+
+NETWORK_FAULTS = ["timeout", "5xx", "truncated", "slow"]
+XLSX_FAULTS = ["xlsx-missing", "xlsx-truncated", "xlsx-garbage", "xlsx-bad-xml"]
+
+
+def corrupt_xlsx(path, fault):
+    """Damage a workbook on disk the way a failed copy or crash would"""
+    path = Path(path)
+    if fault == "xlsx-missing":
+        path.unlink()
+    elif fault == "xlsx-truncated":
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) // 2])
+    elif fault == "xlsx-garbage":
+        path.write_bytes(os.urandom(path.stat().st_size))
+    elif fault == "xlsx-bad-xml":
+        # A valid zip whose first worksheet stops mid-element
+        with zipfile.ZipFile(path) as zf:
+            parts = {info.filename: zf.read(info) for info in zf.infolist()}
+        sheet = next(name for name in parts if name.startswith("xl/worksheets/sheet"))
+        parts[sheet] = parts[sheet][:len(parts[sheet]) // 2]
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in parts.items():
+                zf.writestr(name, data)
+    else:
+        raise ValueError(f"Unknown xlsx fault: {fault}")
+
+
+class ErrorRecoveryTest:
+    def __init__(self, runs=3, pages=3, fail_count=1, retries=2, backoff_ms=100,
+                 timeout_s=1.0, work_dir="test-data/error-recovery", verbose=False):
+        self.runs = runs
+        self.pages = pages
+        self.fail_count = fail_count
+        self.retries = retries
+        self.backoff_s = backoff_ms / 1000
+        self.timeout_s = timeout_s
+        self.work_dir = Path(work_dir)
+        self.verbose = verbose
+        self.modes = {}
+
+    def run_workflow(self, fault, attempts, work_dir):
+        """One in-process workflow run under `fault`; returns its measurements"""
+        network_fault = fault if fault in NETWORK_FAULTS else "none"
+        # The stall must outlast the client timeout to count as one
+        server = FaultServer(network_fault, fail_count=self.fail_count, pages=self.pages,
+                             stall_s=self.timeout_s * 1.5).start()
+        policy = RetryPolicy(attempts=attempts, backoff_s=self.backoff_s,
+                             timeout_s=self.timeout_s, seed=benchmark_report.seed())
+        workflow = BusinessWorkflowTest(streaming=True, max_pages=self.pages,
+                                        source_url=server.url + "/", work_dir=str(work_dir),
+                                        retry=policy)
+        if fault in XLSX_FAULTS:
+            build_catalog = workflow.phase1_excel_setup
+
+            def phase1_then_corrupt():
+                # Only the first build is damaged; a rebuild comes out clean
+                workflow.phase1_excel_setup = build_catalog
+                ok = build_catalog()
+                if ok:
+                    corrupt_xlsx(workflow.catalog_file, fault)
+                return ok
+            workflow.phase1_excel_setup = phase1_then_corrupt
+
+        output = io.StringIO()
+        start = time.perf_counter()
+        try:
+            if self.verbose:
+                status = workflow.run()
+            else:
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    status = workflow.run()
+                    # A failed run leaves half-written workbooks whose
+                    # finalizers complain; keep that in the captured log
+                    gc.collect()
+        finally:
+            seconds = time.perf_counter() - start
+            server.stop()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return {
+            "ok": status == 0,
+            "seconds": seconds,
+            "items": workflow.market_item_count,
+            "retry": policy.summary(),
+            "log": output.getvalue(),
+        }
+
+    def run_mode(self, fault):
+        print(f"\n{fault}:")
+        runs = []
+        for i in range(self.runs):
+            run = self.run_workflow(fault, self.retries + 1, self.work_dir / f"{fault}-{i}")
+            runs.append(run)
+            mark = "✓" if run["ok"] else "✗"
+            print(f"  {mark} run {i + 1}: {run['seconds'] * 1000:.0f} ms, {run['items']} items, "
+                  f"{run['retry']['retries']} retries")
+            if not run["ok"] and not self.verbose:
+                print("    " + "\n    ".join(run["log"].strip().splitlines()[-5:]))
+
+        recover_ms = [event["time_to_recover_ms"] for run in runs
+                      for event in run["retry"]["events"] if event["recovered"]]
+        error_types = {}
+        for run in runs:
+            for error, count in run["retry"]["error_types"].items():
+                error_types[error] = error_types.get(error, 0) + count
+        seconds = statistics.median(run["seconds"] for run in runs)
+        items = statistics.median(run["items"] for run in runs)
+        stats = {
+            "runs": self.runs,
+            "recovered_runs": sum(run["ok"] for run in runs),
+            "duration_ms": round(seconds * 1000, 2),
+            "items_per_s": round(items / seconds, 2) if seconds else None,
+            "retries": sum(run["retry"]["retries"] for run in runs),
+            "unrecovered_operations": sum(run["retry"]["unrecovered"] for run in runs),
+            "time_to_recover_ms_mean": round(statistics.mean(recover_ms), 2) if recover_ms else None,
+            "time_to_recover_ms_max": max(recover_ms) if recover_ms else None,
+            "error_types": error_types,
+        }
+
+        if fault != "none":
+            # Same fault with retries off: did the fault actually bite?
+            bare = self.run_workflow(fault, 1, self.work_dir / f"{fault}-no-retry")
+            stats["fails_without_retry"] = not bare["ok"]
+        self.modes[fault] = stats
+        return stats
+
+    def cost_against_baseline(self):
+        baseline = self.modes["none"]
+        for fault, stats in self.modes.items():
+            if fault == "none":
+                continue
+            stats["overhead_ms"] = round(stats["duration_ms"] - baseline["duration_ms"], 2)
+            if baseline["items_per_s"] and stats["items_per_s"] is not None:
+                stats["throughput_cost_pct"] = round(
+                    (1 - stats["items_per_s"] / baseline["items_per_s"]) * 100, 1)
+
+    def print_summary(self):
+        print("\n" + "="*60)
+        print("RECOVERY SUMMARY")
+        print("="*60)
+        print(f"{'Mode':<16} {'Recovered':<10} {'Median ms':<10} {'Items/s':<9} "
+              f"{'Cost %':<8} {'Recover ms':<11} {'Bites':<6}")
+        for fault, stats in self.modes.items():
+            recover = stats["time_to_recover_ms_mean"]
+            bites = {True: "yes", False: "no"}.get(stats.get("fails_without_retry"), "-")
+            print(f"{fault:<16} {stats['recovered_runs']}/{stats['runs']:<8} "
+                  f"{stats['duration_ms']:<10.0f} {stats['items_per_s'] or 0:<9.1f} "
+                  f"{stats.get('throughput_cost_pct', 0):<8.1f} "
+                  f"{f'{recover:.0f}' if recover is not None else '-':<11} {bites:<6}")
+
+    def run(self, faults):
+        print("\n" + "="*60)
+        print("ERROR RECOVERY TEST")
+        print(f"{self.runs} run(s) per mode, {self.pages} page(s), {self.fail_count} fault(s) per page, "
+              f"{self.retries} retries, {self.timeout_s:g}s timeout")
+        print("="*60)
+
+        start_time = time.perf_counter()
+        # run_workflow removes each run's own subdirectory; the rest of
+        # --work-dir is left alone
+        created_dir = not self.work_dir.exists()
+        try:
+            # Untimed warm-up so the baseline does not pay for first imports
+            self.run_workflow("none", 1, self.work_dir / "warm-up")
+            for fault in ["none"] + faults:
+                self.run_mode(fault)
+        finally:
+            if created_dir:
+                # Only removed when empty, so files placed there meanwhile survive
+                try:
+                    self.work_dir.rmdir()
+                except OSError:
+                    pass
+
+        self.cost_against_baseline()
+        benchmark_report.record("error_recovery", {
+            "runs": self.runs,
+            "pages": self.pages,
+            "fail_count": self.fail_count,
+            "retries": self.retries,
+            "backoff_ms": self.backoff_s * 1000,
+            "timeout_s": self.timeout_s,
+            "modes": self.modes
+        })
+        self.print_summary()
+
+        total_ms = (time.perf_counter() - start_time) * 1000
+        print(f"\nTotal Duration: {total_ms / 1000:.2f} seconds")
+        unrecovered = [f for f, s in self.modes.items() if s["recovered_runs"] < s["runs"]]
+        if unrecovered:
+            print(f"\n✗ Workflow did not recover from: {', '.join(unrecovered)}")
+            return 1
+        print("\n✓ Workflow recovered from every injected fault!")
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error recovery benchmark with fault injection")
+    parser.add_argument("--faults", nargs="+", choices=NETWORK_FAULTS + XLSX_FAULTS,
+                        default=NETWORK_FAULTS + XLSX_FAULTS,
+                        help="Failure modes to inject (default: all)")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Workflow runs per failure mode (default: 3)")
+    parser.add_argument("--pages", type=int, default=3,
+                        help="Pages the workflow crawls (default: 3)")
+    parser.add_argument("--fail-count", type=int, default=1,
+                        help="Faulty responses per page before it succeeds (default: 1)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Retries the workflow's policy allows (default: 2)")
+    parser.add_argument("--backoff-ms", type=float, default=100,
+                        help="Initial retry backoff (default: 100)")
+    parser.add_argument("--timeout", type=float, default=1.0,
+                        help="Client timeout in seconds; the timeout fault stalls 1.5x longer")
+    parser.add_argument("--work-dir", default="test-data/error-recovery",
+                        help="Directory for the per-run scratch subdirectories, removed afterwards")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show the workflow's own output")
+    args = parser.parse_args()
+
+    test = ErrorRecoveryTest(runs=args.runs, pages=args.pages, fail_count=args.fail_count,
+                             retries=args.retries, backoff_ms=args.backoff_ms,
+                             timeout_s=args.timeout, work_dir=args.work_dir, verbose=args.verbose)
+    return test.run(args.faults)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
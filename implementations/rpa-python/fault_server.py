@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Fault-Injecting Stand-in Site for the Error Recovery scenario
+Serves quotes.toscrape.com-style pages and fails on purpose
+
+Pages live at / and /page/<n>/ and carry the markup the workflow scraper
+expects (div.quote, span.text, small.author, a.tag, li.next). The first
+`fail_count` requests for every page are answered with the chosen fault,
+later ones succeed, so a client with retries recovers and one without
+does not:
+
+    timeout     stall longer than the client timeout before answering
+    5xx         503 Service Unavailable
+    truncated   a well-formed response carrying half the HTML document
+    slow        the full page trickled out over `slow_s` seconds
+    none        no faults (baseline)
+
+Run standalone with `python3 fault_server.py --fault 5xx --port 8000`.
+"""
+
+import argparse
+import threading
+import time
+from urllib.parse import urlsplit
+
+from local_server import LocalServer, QuietHandler
+
+FAULTS = ["none", "timeout", "5xx", "truncated", "slow"]
+
+QUOTES_PER_PAGE = 10
+
+
+def quotes_page(page, pages):
+    quotes = "".join(
+        '<div class="quote">'
+        f'<span class="text">"Quote {page}-{i}: {"recovery " * (3 + (page * 7 + i) % 12)}"</span>'
+        f'<small class="author">Author {(page * QUOTES_PER_PAGE + i) % 23}</small>'
+        f'<a class="tag" href="#">tag{i % 4}</a><a class="tag" href="#">page{page}</a>'
+        '</div>\n'
+        for i in range(QUOTES_PER_PAGE)
+    )
+    next_link = f'<li class="next"><a href="/page/{page + 1}/">Next</a></li>' if page < pages else ""
+    return (f"<html><head><title>Quotes page {page}</title></head><body>\n{quotes}"
+            f"<nav><ul>{next_link}</ul></nav>\n</body></html>\n")
+
+
+class FaultHandler(QuietHandler):
+    # Set on the subclass FaultServer creates
+    fault = "none"
+    fail_count = 1
+    pages = 3
+    stall_s = 2.0
+    slow_s = 0.5
+    hits = {}
+    lock = threading.Lock()
+
+    def page_number(self):
+        path = urlsplit(self.path).path.strip("/")
+        if not path:
+            return 1
+        parts = path.split("/")
+        if len(parts) == 2 and parts[0] == "page" and parts[1].isdigit():
+            return int(parts[1])
+        return None
+
+    def do_GET(self):
+        page = self.page_number()
+        if page is None or not 1 <= page <= self.pages:
+            self.send_body(404, "<html><body>Not found</body></html>", "text/html")
+            return
+
+        with self.lock:
+            hit = self.hits.get(page, 0) + 1
+            self.hits[page] = hit
+        body = quotes_page(page, self.pages).encode()
+
+        try:
+            if self.fault == "none" or hit > self.fail_count:
+                self.send_body(200, body, "text/html")
+            elif self.fault == "timeout":
+                time.sleep(self.stall_s)
+                self.send_body(200, body, "text/html")
+            elif self.fault == "5xx":
+                self.send_body(503, "<html><body>Service Unavailable</body></html>", "text/html",
+                               headers={"Retry-After": "1"})
+            elif self.fault == "truncated":
+                self.send_body(200, body[:len(body) // 2], "text/html")
+            elif self.fault == "slow":
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                chunks = 10
+                step = -(-len(body) // chunks)
+                for start in range(0, len(body), step):
+                    self.wfile.write(body[start:start + step])
+                    self.wfile.flush()
+                    time.sleep(self.slow_s / chunks)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (timed out) while we stalled
+            self.close_connection = True
+
+
+class FaultServer(LocalServer):
+    """LocalServer injecting one fault mode, with fresh per-page hit counts"""
+
+    def __init__(self, fault="none", fail_count=1, pages=3, stall_s=2.0, slow_s=0.5,
+                 host="127.0.0.1", port=0):
+        if fault not in FAULTS:
+            raise ValueError(f"Unknown fault '{fault}', expected one of {', '.join(FAULTS)}")
+        handler = type("FaultHandler", (FaultHandler,), {
+            "fault": fault,
+            "fail_count": fail_count,
+            "pages": pages,
+            "stall_s": stall_s,
+            "slow_s": slow_s,
+            "hits": {},
+            "lock": threading.Lock(),
+        })
+        super().__init__(handler, host, port)
+
+    @property
+    def hits(self):
+        return dict(self.httpd.RequestHandlerClass.hits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fault-injecting quotes site")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--fault", choices=FAULTS, default="none")
+    parser.add_argument("--fail-count", type=int, default=1,
+                        help="Faulty responses per page before it succeeds (default: 1)")
+    parser.add_argument("--pages", type=int, default=3)
+    args = parser.parse_args()
+
+    server = FaultServer(args.fault, args.fail_count, args.pages, port=args.port)
+    print(f"Fault server ({args.fault}) listening on {server.url}/")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
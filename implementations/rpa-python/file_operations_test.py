@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+File Operations Test for RPA Python
+Bulk inbox-folder operations with throughput per I/O strategy
+
+Follows Test Scenario 4 (create, read, rename, organize by date, purge,
+verify) and times competing strategies for each bulk step:
+  - directory scan: os.scandir vs os.listdir + os.stat
+  - reads: buffered read() vs mmap
+  - copies: shutil.copyfile vs a userspace read/write loop vs
+    kernel-assisted os.copy_file_range / os.sendfile
+  - renames: one path-based os.rename per file vs a batch relative to an
+    open directory descriptor (dir_fd)
+Each strategy reports files/s and MB/s so the fastest path for large inbox
+folders can be picked. Files are freshly written, so reads and copies run
+against a warm page cache.
+
+Each run works in its own fresh subdirectory of --work-dir and removes only
+that, so whatever else the directory holds is left alone.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import benchmark_report
+
+# Files are spread over this many days of modification time; the oldest
+# day is purged in the delete step
+DATE_SPREAD_DAYS = 3
+
+COPY_CHUNK = 1024 * 1024
+
+
+def copy_read_write(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+
+
+def copy_kernel(src, dst, syscall):
+    """Copy with os.copy_file_range or os.sendfile, all in kernel space"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            if syscall == "copy_file_range":
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining,
+                                          offset_src=offset, offset_dst=offset)
+            else:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+
+COPY_STRATEGIES = {
+    "shutil.copyfile": shutil.copyfile,
+    "read/write": copy_read_write,
+    "copy_file_range": lambda src, dst: copy_kernel(src, dst, "copy_file_range"),
+    "sendfile": lambda src, dst: copy_kernel(src, dst, "sendfile"),
+}
+
+
+class FileOperationsTest:
+    def __init__(self, file_count=100, file_size_kb=4, read_count=50,
+                 work_dir="test-data/file-operations"):
+        self.file_count = file_count
+        self.file_size = file_size_kb * 1024
+        self.read_count = min(read_count, file_count)
+        self.root = Path(work_dir)
+        self.created_root = False
+        # This run's subdirectory of root, created in step 1
+        self.work_dir = None
+        self.inbox = None
+        self.rng = random.Random(benchmark_report.seed(0))
+
+        self.digests = {}
+        self.throughput = {}
+        self.io_errors = 0
+
+    def measure(self, operation, strategy, func, files, total_bytes):
+        """Time func(), recording files/s and MB/s under operation/strategy"""
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        stats = {
+            "files": files,
+            "ms": round(seconds * 1000, 2),
+            "files_per_s": round(files / seconds, 1) if seconds else None,
+            "mb_per_s": round(total_bytes / 1024 / 1024 / seconds, 1) if seconds and total_bytes else None
+        }
+        self.throughput.setdefault(operation, {})[strategy] = stats
+        rate = f"{stats['files_per_s']:,.0f} files/s"
+        if stats["mb_per_s"] is not None:
+            rate += f", {stats['mb_per_s']:,.1f} MB/s"
+        print(f"  {strategy:<18} {stats['ms']:>10.2f} ms  ({rate})")
+        return stats
+
+    def content_for(self, index):
+        """Unique, deterministic file body of the configured size"""
+        header = f"Report {index:06d} generated for file operations benchmark\n".encode()
+        body = self.rng.randbytes(max(self.file_size - len(header), 0))
+        return header + body
+
+    def step1_create_files(self):
+        print("Step 1: Creating files with unique content...")
+        self.created_root = not self.root.exists()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.work_dir = Path(tempfile.mkdtemp(prefix="run-", dir=self.root))
+        self.inbox = self.work_dir / "inbox"
+        self.inbox.mkdir()
+        now = time.time()
+
+        def create():
+            for i in range(1, self.file_count + 1):
+                data = self.content_for(i)
+                path = self.inbox / f"report_{i:06d}.txt"
+                with open(path, 'wb') as f:
+                    f.write(data)
+                # Spread modification times over DATE_SPREAD_DAYS days
+                mtime = now - (i % DATE_SPREAD_DAYS) * 86400
+                os.utime(path, (mtime, mtime))
+                self.digests[path.name] = hashlib.sha256(data).hexdigest()
+
+        self.measure("create", "write", create, self.file_count, self.file_count * self.file_size)
+
+    def step2_scan_directory(self):
+        print("Step 2: Scanning inbox...")
+        found = {}
+
+        def scandir():
+            with os.scandir(self.inbox) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        found["scandir"] = found.get("scandir", 0) + entry.stat().st_size
+
+        def listdir_stat():
+            for name in os.listdir(self.inbox):
+                path = os.path.join(self.inbox, name)
+                if os.path.isfile(path):
+                    found["listdir"] = found.get("listdir", 0) + os.stat(path).st_size
+
+        total = self.file_count * self.file_size
+        self.measure("scan", "os.scandir", scandir, self.file_count, 0)
+        self.measure("scan", "listdir+stat", listdir_stat, self.file_count, 0)
+        assert found.get("scandir") == found.get("listdir") == total, \
+            f"Scan saw {found} bytes, expected {total}"
+
+    def step3_read_files(self):
+        print(f"Step 3: Reading {self.read_count} random files...")
+        names = self.rng.sample(sorted(self.digests), self.read_count)
+        total = self.read_count * self.file_size
+
+        def read_buffered():
+            for name in names:
+                with open(self.inbox / name, 'rb') as f:
+                    if hashlib.sha256(f.read()).hexdigest() != self.digests[name]:
+                        raise AssertionError(f"Content mismatch in {name}")
+
+        def read_mmap():
+            for name in names:
+                with open(self.inbox / name, 'rb') as f:
+                    if self.file_size == 0:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hashlib.sha256(mapped).hexdigest() != self.digests[name]:
+                            raise AssertionError(f"Content mismatch in {name}")
+
+        self.measure("read", "read()", read_buffered, self.read_count, total)
+        self.measure("read", "mmap", read_mmap, self.read_count, total)
+        print(f"✓ Content integrity verified for {self.read_count} files")
+
+    def step4_copy_files(self):
+        print("Step 4: Copying inbox to backups...")
+        total = self.file_count * self.file_size
+        names = sorted(self.digests)
+
+        for strategy, copy in COPY_STRATEGIES.items():
+            target = self.work_dir / "backup" / strategy.replace("/", "-")
+            target.mkdir(parents=True)
+
+            def copy_all():
+                for name in names:
+                    copy(self.inbox / name, target / name)
+
+            try:
+                self.measure("copy", strategy, copy_all, self.file_count, total)
+            except (AttributeError, OSError) as e:
+                # copy_file_range / sendfile between files is not available everywhere
+                print(f"  {strategy:<18} unsupported here ({e})")
+                shutil.rmtree(target)
+                continue
+            copied = sum(entry.stat().st_size for entry in os.scandir(target))
+            if copied != total:
+                self.io_errors += 1
+                print(f"✗ {strategy} copied {copied} of {total} bytes")
+            shutil.rmtree(target)
+
+    def step5_rename_files(self):
+        print("Step 5: Renaming files with timestamp prefix...")
+        names = sorted(self.digests)
+        prefix = datetime.now().strftime("%Y%m%d_%H%M%S_")
+
+        def rename_by_path():
+            for name in names:
+                os.rename(self.inbox / name, self.inbox / f"{name}.pending")
+
+        def rename_batch_dir_fd():
+            fd = os.open(self.inbox, os.O_RDONLY)
+            try:
+                for name in names:
+                    os.rename(f"{name}.pending", prefix + name, src_dir_fd=fd, dst_dir_fd=fd)
+            finally:
+                os.close(fd)
+
+        self.measure("rename", "os.rename(path)", rename_by_path, self.file_count, 0)
+        if os.rename in os.supports_dir_fd:
+            self.measure("rename", "batched dir_fd", rename_batch_dir_fd, self.file_count, 0)
+        else:
+            for name in names:
+                os.rename(self.inbox / f"{name}.pending", self.inbox / (prefix + name))
+
+        self.digests = {prefix + name: digest for name, digest in self.digests.items()}
+        renamed = [entry.name for entry in os.scandir(self.inbox)]
+        assert len(renamed) == self.file_count and all(n.startswith(prefix) for n in renamed), \
+            "Rename did not produce the expected names"
+        print(f"✓ {len(renamed)} files renamed with prefix {prefix}")
+
+    def step6_organize_by_date(self):
+        print("Step 6: Moving files into by-date folders...")
+        organized = self.work_dir / "by-date"
+
+        def organize():
+            created = set()
+            with os.scandir(self.inbox) as entries:
+                for entry in entries:
+                    day = datetime.fromtimestamp(entry.stat().st_mtime).strftime("%Y-%m-%d")
+                    folder = organized / day
+                    if day not in created:
+                        folder.mkdir(parents=True, exist_ok=True)
+                        created.add(day)
+                    os.replace(entry.path, folder / entry.name)
+
+        self.measure("organize", "scandir+replace", organize, self.file_count, 0)
+        days = sorted(p.name for p in organized.iterdir())
+        print(f"✓ Files organized into {len(days)} date folders: {', '.join(days)}")
+
+    def step7_delete_old_files(self):
+        cutoff = datetime.now() - timedelta(days=DATE_SPREAD_DAYS - 1)
+        print(f"Step 7: Deleting files older than {cutoff:%Y-%m-%d %H:%M}...")
+        organized = self.work_dir / "by-date"
+        deleted = []
+
+        def purge():
+            for folder in organized.iterdir():
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if datetime.fromtimestamp(entry.stat().st_mtime) < cutoff:
+                            os.unlink(entry.path)
+                            deleted.append(entry.name)
+                if not any(folder.iterdir()):
+                    folder.rmdir()
+
+        stats = self.measure("delete", "scandir+unlink", purge, self.file_count, 0)
+        stats["deleted"] = len(deleted)
+        for name in deleted:
+            self.digests.pop(name)
+        print(f"✓ {len(deleted)} old files deleted")
+
+    def step8_verify(self):
+        print("Step 8: Verifying final count and structure...")
+        organized = self.work_dir / "by-date"
+        remaining = {}
+        for folder in organized.iterdir():
+            for entry in os.scandir(folder):
+                day = datetime.fromtimestamp(entry.stat().st_mtime).strftime("%Y-%m-%d")
+                assert day == folder.name, f"{entry.name} is in {folder.name}, dated {day}"
+                remaining[entry.name] = entry.stat().st_size
+
+        assert remaining.keys() == self.digests.keys(), \
+            f"Expected {len(self.digests)} files, found {len(remaining)}"
+        disk_usage = sum(remaining.values())
+        print(f"✓ {len(remaining)} files remain in {len(list(organized.iterdir()))} folders "
+              f"({disk_usage / 1024:.1f} KB)")
+        return disk_usage
+
+    def cleanup(self):
+        if self.work_dir is not None:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        if self.created_root:
+            # Only removed when empty, so files placed there meanwhile survive
+            try:
+                self.root.rmdir()
+            except OSError:
+                pass
+
+    def run(self):
+        print("\n" + "="*60)
+        print("FILE OPERATIONS TEST")
+        print(f"{self.file_count} files x {self.file_size / 1024:g} KB")
+        print("="*60)
+
+        start_time = time.perf_counter()
+        try:
+            self.step1_create_files()
+            self.step2_scan_directory()
+            self.step3_read_files()
+            self.step4_copy_files()
+            self.step5_rename_files()
+            self.step6_organize_by_date()
+            self.step7_delete_old_files()
+            disk_usage = self.step8_verify()
+        except (AssertionError, OSError) as e:
+            if isinstance(e, OSError):
+                self.io_errors += 1
+            print(f"\n✗ Test failed: {e}")
+            benchmark_report.record("file_operations", {"io_errors": self.io_errors,
+                                                        "throughput": self.throughput})
+            return 1
+        finally:
+            self.cleanup()
+
+        total_ms = (time.perf_counter() - start_time) * 1000
+        fastest = {
+            operation: max(strategies, key=lambda s: strategies[s]["files_per_s"] or 0)
+            for operation, strategies in self.throughput.items() if len(strategies) > 1
+        }
+        benchmark_report.record("file_operations", {
+            "files": self.file_count,
+            "file_size_kb": self.file_size / 1024,
+            "files_per_second": round(self.file_count / (total_ms / 1000), 1),
+            "io_errors": self.io_errors,
+            "disk_usage_kb": round(disk_usage / 1024, 1),
+            "throughput": self.throughput,
+            "fastest": fastest
+        })
+
+        print("\n" + "="*60)
+        print("TEST SUMMARY")
+        print("="*60)
+        print(f"Total Duration: {total_ms / 1000:.2f} seconds")
+        print(f"Files per second: {self.file_count / (total_ms / 1000):,.1f}")
+        print(f"I/O errors: {self.io_errors}")
+        for operation, strategy in fastest.items():
+            print(f"Fastest {operation}: {strategy}")
+
+        if self.io_errors:
+            print("\n⚠ FILE OPERATIONS COMPLETED WITH I/O ERRORS")
+            return 1
+        print("\n✓ All file operations passed!")
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="File operations benchmark")
+    parser.add_argument("--files", type=int, default=100,
+                        help="Number of files in the inbox (default: 100)")
+    parser.add_argument("--size-kb", type=int, default=4,
+                        help="Size of each file in KB (default: 4)")
+    parser.add_argument("--reads", type=int, default=50,
+                        help="Number of random files to read back (default: 50)")
+    parser.add_argument("--work-dir", default="test-data/file-operations",
+                        help="Directory for this run's scratch subdirectory, removed afterwards")
+    args = parser.parse_args()
+
+    test = FileOperationsTest(file_count=args.files, file_size_kb=args.size_kb,
+                              read_count=args.reads, work_dir=args.work_dir)
+    return test.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
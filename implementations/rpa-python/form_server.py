@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Local Form Application for the Form Automation scenario
+A demoqa-style practice form split into three server-validated steps
+
+    GET  /form/personal       step 1: name, email, gender, mobile
+    POST /form/personal
+    GET  /form/details        step 2: date of birth, subjects, hobbies, picture
+    POST /form/details        (multipart/form-data, carries the upload)
+    GET  /form/address        step 3: current address, state, city
+    POST /form/address
+    GET  /form/done/<id>      confirmation with every submitted value
+
+The first GET of /form/personal starts a session (cookie "form_session").
+Every form carries a hidden csrf_token that is rotated after each POST; a
+POST with a missing or stale token gets 403, and one for a step the
+session has not reached gets 409. Valid steps answer 303 to the next step
+(post/redirect/get); invalid input re-renders the step with 422 and one
+<li class="error" data-field="..."> per failed field.
+
+Run standalone with `python3 form_server.py --port 8000`, or start it
+in-process through FormServer (see local_server.LocalServer).
+"""
+
+import argparse
+import datetime
+import html
+import re
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, urlsplit
+
+from local_server import LocalServer, QuietHandler
+
+SESSION_COOKIE = "form_session"
+HTML = "text/html; charset=utf-8"
+
+STEPS = ["personal", "details", "address"]
+
+GENDERS = ["Male", "Female", "Other"]
+HOBBIES = ["Sports", "Reading", "Music"]
+STATES = {
+    "NCR": ["Delhi", "Gurgaon", "Noida"],
+    "Uttar Pradesh": ["Agra", "Lucknow", "Merrut"],
+    "Haryana": ["Karnal", "Panipat"],
+    "Rajasthan": ["Jaipur", "Jaiselmer"],
+}
+PICTURE_TYPES = (".png", ".jpg", ".jpeg")
+MAX_PICTURE_BYTES = 1024 * 1024
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[A-Za-z]{2,}$")
+MOBILE_PATTERN = re.compile(r"^\d{10}$")
+DISPOSITION_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+# Fields shown on the confirmation page, in order
+CONFIRMATION_FIELDS = ["first_name", "last_name", "email", "gender", "mobile", "date_of_birth",
+                       "subjects", "hobbies", "picture", "current_address", "state", "city"]
+
+
+def parse_multipart(body, content_type):
+    """Yield (name, filename or None, data) for each part of a multipart/form-data body
+
+    A plain split on the boundary: email.parser handles the general MIME
+    case but spends ~3 ms line-parsing a 32 KB binary upload.
+    """
+    boundary = content_type.partition("boundary=")[2].split(";")[0].strip().strip('"')
+    for part in body.split(b"--" + boundary.encode("latin-1"))[1:-1]:
+        head, _, data = part[2:].partition(b"\r\n\r\n")
+        params = {}
+        for line in head.decode("utf-8").split("\r\n"):
+            if line.lower().startswith("content-disposition:"):
+                params = dict(DISPOSITION_PARAM.findall(line))
+        # The part ends with the CRLF that precedes the next boundary
+        yield params.get("name"), params.get("filename"), data[:-2]
+
+
+def validate(step, fields, files):
+    """Return {field: message} for every invalid field of `step`"""
+    errors = {}
+    if step == "personal":
+        for name in ("first_name", "last_name"):
+            if not 0 < len(fields.get(name, "").strip()) <= 50:
+                errors[name] = "Required, at most 50 characters"
+        if not EMAIL_PATTERN.match(fields.get("email", "")):
+            errors["email"] = "Enter a valid email address"
+        if fields.get("gender") not in GENDERS:
+            errors["gender"] = "Select a gender"
+        if not MOBILE_PATTERN.match(fields.get("mobile", "")):
+            errors["mobile"] = "Mobile number must be 10 digits"
+    elif step == "details":
+        try:
+            born = datetime.date.fromisoformat(fields.get("date_of_birth", ""))
+            if born >= datetime.date.today():
+                errors["date_of_birth"] = "Date of birth must be in the past"
+        except ValueError:
+            errors["date_of_birth"] = "Pick a date (YYYY-MM-DD)"
+        hobbies = [h for h in fields.get("hobbies", "").split(",") if h]
+        if any(h not in HOBBIES for h in hobbies):
+            errors["hobbies"] = "Unknown hobby"
+        name, data = files.get("picture", ("", b""))
+        if not name.lower().endswith(PICTURE_TYPES):
+            errors["picture"] = "Upload a .png or .jpg picture"
+        elif not 0 < len(data) <= MAX_PICTURE_BYTES:
+            errors["picture"] = f"Picture must be 1 byte to {MAX_PICTURE_BYTES // 1024} KB"
+    elif step == "address":
+        if not fields.get("current_address", "").strip():
+            errors["current_address"] = "Required"
+        state = fields.get("state")
+        if state not in STATES:
+            errors["state"] = "Select a state"
+        elif fields.get("city") not in STATES[state]:
+            errors["city"] = f"Select a city in {state}"
+    return errors
+
+
+def render_form(step, token, values=None, errors=None):
+    values = values or {}
+    esc = lambda name: html.escape(values.get(name, ""), quote=True)
+
+    def text(name, label, kind="text"):
+        return (f'<label>{label} <input type="{kind}" name="{name}" '
+                f'value="{esc(name)}"></label>\n')
+
+    def choices(name, options, kind):
+        chosen = values.get(name, "").split(",")
+        return "".join(
+            f'<label><input type="{kind}" name="{name}" value="{option}"'
+            f'{" checked" if option in chosen else ""}> {option}</label>\n'
+            for option in options)
+
+    if step == "personal":
+        inputs = (text("first_name", "First Name") + text("last_name", "Last Name")
+                  + text("email", "Email", "email") + choices("gender", GENDERS, "radio")
+                  + text("mobile", "Mobile", "tel"))
+    elif step == "details":
+        inputs = (text("date_of_birth", "Date of Birth", "date") + text("subjects", "Subjects")
+                  + choices("hobbies", HOBBIES, "checkbox")
+                  + '<label>Picture <input type="file" name="picture" accept=".png,.jpg"></label>\n')
+    else:
+        states = "".join(f'<option value="{s}">{s}</option>' for s in STATES)
+        cities = "".join(f'<option value="{c}">{c}</option>'
+                         for city_list in STATES.values() for c in city_list)
+        inputs = (text("current_address", "Current Address")
+                  + f'<select name="state">{states}</select>\n'
+                  + f'<select name="city">{cities}</select>\n')
+
+    error_list = "".join(f'<li class="error" data-field="{field}">{html.escape(message)}</li>'
+                         for field, message in (errors or {}).items())
+    enctype = ' enctype="multipart/form-data"' if step == "details" else ""
+    return (f"<html><head><title>Practice Form - {step}</title></head><body>\n"
+            f'<ul class="errors">{error_list}</ul>\n'
+            f'<form id="{step}" method="post" action="/form/{step}"{enctype}>\n'
+            f'<input type="hidden" name="csrf_token" value="{token}">\n'
+            f'{inputs}<button type="submit">Next</button>\n</form>\n</body></html>\n')
+
+
+def render_confirmation(submission_id, values):
+    rows = "".join(f'<tr><td>{name}</td><td data-field="{name}">'
+                   f'{html.escape(values.get(name, ""))}</td></tr>\n'
+                   for name in CONFIRMATION_FIELDS)
+    return (f"<html><head><title>Submitted</title></head><body>\n"
+            f'<h1 id="confirmation" data-id="{submission_id}">Thanks for submitting the form</h1>\n'
+            f"<table>\n{rows}</table>\n</body></html>\n")
+
+
+class FormHandler(QuietHandler):
+    # Set on the subclass FormServer creates, so each server has its own state
+    sessions = {}
+    submissions = {}
+    lock = threading.Lock()
+    latency_s = 0.0
+
+    def session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def route(self):
+        """Return (kind, argument): ("step", name), ("done", id) or (None, None)"""
+        segments = [s for s in urlsplit(self.path).path.split("/") if s]
+        if len(segments) == 2 and segments[0] == "form" and segments[1] in STEPS:
+            return "step", segments[1]
+        if len(segments) == 3 and segments[:2] == ["form", "done"]:
+            return "done", segments[2]
+        return None, None
+
+    def redirect(self, location, headers=None):
+        self.send_body(303, "", HTML, headers={"Location": location, **(headers or {})})
+
+    def do_GET(self):
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        kind, argument = self.route()
+        if kind == "done":
+            with self.lock:
+                values = self.submissions.get(argument)
+            if values is None:
+                self.send_body(404, "<html><body>Not found</body></html>", HTML)
+            else:
+                self.send_body(200, render_confirmation(argument, values), HTML)
+            return
+        if kind != "step":
+            self.send_body(404, "<html><body>Not found</body></html>", HTML)
+            return
+
+        session_id = self.session()
+        headers = {}
+        with self.lock:
+            state = self.sessions.get(session_id)
+            if state is None:
+                if argument != STEPS[0]:
+                    self.redirect(f"/form/{STEPS[0]}")
+                    return
+                session_id = secrets.token_hex(8)
+                state = self.sessions[session_id] = {"step": 0, "values": {},
+                                                     "token": secrets.token_hex(16)}
+                headers["Set-Cookie"] = f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly"
+            current = STEPS[state["step"]]
+            token, values = state["token"], dict(state["values"])
+        if argument != current:
+            self.redirect(f"/form/{current}", headers)
+            return
+        self.send_body(200, render_form(current, token, values), HTML, headers=headers)
+
+    def read_form(self):
+        """Parse the POST body into ({field: str}, {field: (filename, bytes)})"""
+        body = self.read_body()
+        content_type = self.headers.get("Content-Type", "")
+        fields, files = {}, {}
+        if content_type.startswith("multipart/form-data"):
+            for name, filename, payload in parse_multipart(body, content_type):
+                if filename is not None:
+                    files[name] = (filename, payload)
+                elif name in fields:
+                    fields[name] += "," + payload.decode("utf-8")
+                else:
+                    fields[name] = payload.decode("utf-8")
+        else:
+            for name, items in parse_qs(body.decode("utf-8"), keep_blank_values=True).items():
+                fields[name] = ",".join(items)
+        return fields, files
+
+    def do_POST(self):
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        kind, step = self.route()
+        fields, files = self.read_form()
+        if kind != "step":
+            self.send_body(404, "<html><body>Not found</body></html>", HTML)
+            return
+
+        with self.lock:
+            state = self.sessions.get(self.session())
+            if state is None or not secrets.compare_digest(fields.get("csrf_token", ""),
+                                                           state["token"]):
+                self.send_body(403, "<html><body>CSRF token missing or invalid</body></html>",
+                               HTML)
+                return
+            if STEPS[state["step"]] != step:
+                self.send_body(409, f"<html><body>Expected step {STEPS[state['step']]}"
+                                    "</body></html>", HTML)
+                return
+            state["token"] = token = secrets.token_hex(16)
+
+        errors = validate(step, fields, files)
+        values = {k: v for k, v in fields.items() if k != "csrf_token"}
+        if "picture" in files:
+            values["picture"] = files["picture"][0]
+        if errors:
+            self.send_body(422, render_form(step, token, values, errors), HTML)
+            return
+
+        with self.lock:
+            state["values"].update(values)
+            if step != STEPS[-1]:
+                state["step"] += 1
+                location = f"/form/{STEPS[state['step']]}"
+            else:
+                submission_id = f"{len(self.submissions) + 1:06d}"
+                self.submissions[submission_id] = state["values"]
+                del self.sessions[self.session()]
+                location = f"/form/done/{submission_id}"
+        self.redirect(location)
+
+
+class FormServer(LocalServer):
+    """LocalServer running a fresh form application (no sessions or submissions)"""
+
+    def __init__(self, latency_ms=0.0, host="127.0.0.1", port=0):
+        handler = type("FormHandler", (FormHandler,), {
+            "sessions": {},
+            "submissions": {},
+            "lock": threading.Lock(),
+            "latency_s": latency_ms / 1000,
+        })
+        super().__init__(handler, host, port)
+
+    @property
+    def submissions(self):
+        return dict(self.httpd.RequestHandlerClass.submissions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local multi-step practice form")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated server processing time per request")
+    args = parser.parse_args()
+
+    server = FormServer(latency_ms=args.latency_ms, port=args.port)
+    print(f"Form server listening on {server.url}/form/{STEPS[0]}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Form Automation Test for RPA Python
+Fills a multi-step web form from a workbook of records, with throughput
+
+Follows Test Scenario 3 (text inputs, gender radio, hobby checkboxes,
+file upload, date, address, submit, verify the confirmation) against
+form_server.FormServer, a bundled three-step form with CSRF tokens and
+server-side validation, so no public site is involved.
+
+Records are generated into an input workbook first; a share of them is
+deliberately invalid (bad email or mobile, future birth date, city not in
+the state) and must be rejected with a validation error on that field.
+The records are then submitted twice:
+  - sequential: one requests.Session, one form after another
+  - concurrent: a thread pool whose per-thread sessions (separate cookie
+    jars, since each fill is its own form session) share one pooled
+    HTTPAdapter of `concurrency` keep-alive connections
+Each mode reports forms/s, error rate (records that were neither
+confirmed with matching values nor rejected on the expected field) and
+p50/p99 latency per step. Results are written to an Excel workbook.
+"""
+
+import argparse
+import html
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import benchmark_report
+from form_server import CONFIRMATION_FIELDS, GENDERS, HOBBIES, STATES, STEPS, FormServer
+from xlsx_reader import XlsxReader
+
+CSRF_PATTERN = re.compile(r'name="csrf_token" value="([0-9a-f]+)"')
+ERROR_PATTERN = re.compile(r'<li class="error" data-field="(\w+)">')
+CONFIRMED_PATTERN = re.compile(r'<td data-field="(\w+)">([^<]*)</td>')
+
+# Workbook columns -> form fields (the picture column names a file to upload)
+RECORD_COLUMNS = {
+    "Record ID": "record_id",
+    "First Name": "first_name",
+    "Last Name": "last_name",
+    "Email": "email",
+    "Gender": "gender",
+    "Mobile": "mobile",
+    "Date of Birth": "date_of_birth",
+    "Subjects": "subjects",
+    "Hobbies": "hobbies",
+    "Picture": "picture",
+    "Current Address": "current_address",
+    "State": "state",
+    "City": "city",
+    "Expected Error": "expected_error",
+}
+
+# Ways to break a record, by the field the server must reject
+INVALID_VALUES = {
+    "email": lambda rng, r: r["email"].replace("@", " at "),
+    "mobile": lambda rng, r: r["mobile"][:7],
+    "date_of_birth": lambda rng, r: "2099-01-01",
+    "city": lambda rng, r: rng.choice([c for s, cities in STATES.items()
+                                       if s != r["state"] for c in cities]),
+}
+
+# Per-step latency keys: "open" is the first GET, each form step covers its
+# POST plus the redirected GET of the next page
+STEP_KEYS = ["open"] + STEPS
+
+MODES = ["sequential", "concurrent"]
+
+
+def latency_stats(latencies_ms):
+    if not latencies_ms:
+        return {"p50_ms": None, "p99_ms": None}
+    if len(latencies_ms) == 1:
+        return {"p50_ms": round(latencies_ms[0], 3), "p99_ms": round(latencies_ms[0], 3)}
+    cuts = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+    return {"p50_ms": round(cuts[49], 3), "p99_ms": round(cuts[98], 3)}
+
+
+class FormAutomationTest:
+    def __init__(self, records=200, concurrency=8, invalid_rate=0.1, upload_kb=32,
+                 latency_ms=1.0, base_url=None, output_dir="test-data/forms"):
+        self.record_count = records
+        self.concurrency = concurrency
+        self.invalid_rate = invalid_rate
+        self.upload_kb = upload_kb
+        self.latency_ms = latency_ms
+        self.base_url = base_url
+        # requests re-reads proxy settings from the environment on every
+        # request (about 1 ms here); the bundled server never needs them
+        self.trust_env = base_url is not None
+        self.output_dir = Path(output_dir)
+        self.records_file = self.output_dir / "form_records.xlsx"
+        self.output_file = self.output_dir / "form_results.xlsx"
+        self.created_dir = False
+        self.rng = random.Random(benchmark_report.seed(0))
+
+        self.records = []
+        self.pictures = {}
+        self.protocol_checks = []
+        self.submissions = {}
+        self.modes = {}
+
+    def write_records(self):
+        """Generate the input workbook and the pictures it references"""
+        from openpyxl import Workbook
+
+        self.created_dir = not self.output_dir.exists()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for name in ("portrait.png", "badge.jpg", "scan.jpeg"):
+            self.pictures[name] = self.rng.randbytes(self.upload_kb * 1024)
+            (self.output_dir / name).write_bytes(self.pictures[name])
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Records")
+        ws.append(list(RECORD_COLUMNS))
+        invalid = int(self.record_count * self.invalid_rate)
+        broken = set(self.rng.sample(range(self.record_count), invalid))
+        for i in range(self.record_count):
+            state = self.rng.choice(list(STATES))
+            record = {
+                "record_id": f"R{i + 1:05d}",
+                "first_name": f"First{i}",
+                "last_name": self.rng.choice(["Kim", "Lee", "Park", "O'Neil", "Müller"]),
+                "email": f"user{i}@example.com",
+                "gender": self.rng.choice(GENDERS),
+                "mobile": f"{self.rng.randrange(10 ** 9, 10 ** 10)}",
+                "date_of_birth": f"{self.rng.randint(1950, 2005)}-"
+                                 f"{self.rng.randint(1, 12):02d}-{self.rng.randint(1, 28):02d}",
+                "subjects": ", ".join(self.rng.sample(["Maths", "Physics", "English", "Arts"], 2)),
+                "hobbies": ",".join(h for h in HOBBIES if self.rng.random() < 0.5),
+                "picture": self.rng.choice(list(self.pictures)),
+                "current_address": f"{i + 1} Main Street & Co <Suite {i % 9}>",
+                "state": state,
+                "city": self.rng.choice(STATES[state]),
+                "expected_error": "",
+            }
+            if i in broken:
+                field = self.rng.choice(list(INVALID_VALUES))
+                record[field] = INVALID_VALUES[field](self.rng, record)
+                record["expected_error"] = field
+            ws.append([record[field] for field in RECORD_COLUMNS.values()])
+        wb.save(self.records_file)
+        print(f"✓ {self.record_count} records ({invalid} invalid) written to {self.records_file}")
+
+    def read_records(self):
+        with XlsxReader(self.records_file) as book:
+            rows = book.rows("Records")
+            header = next(rows)
+            fields = [RECORD_COLUMNS[name] for name in header]
+            for row in rows:
+                if row:
+                    self.records.append({field: "" if value is None else str(value)
+                                         for field, value in zip(fields, row)})
+        print(f"✓ {len(self.records)} records read back")
+
+    def fill(self, session, record):
+        """Submit one record through every step; returns (outcome, step latencies, detail)
+
+        outcome is "submitted" (confirmed, every value matches), "rejected"
+        (validation errors, listed in detail) or "error".
+        """
+        latencies = {}
+
+        def timed(key, method, path, **kwargs):
+            start = time.perf_counter()
+            response = session.request(method, self.base_url + path, timeout=10, **kwargs)
+            latencies[key] = (time.perf_counter() - start) * 1000
+            return response
+
+        response = timed("open", "GET", f"/form/{STEPS[0]}")
+        for step in STEPS:
+            token = CSRF_PATTERN.search(response.text)
+            if response.status_code != 200 or token is None:
+                return "error", latencies, f"{step}: HTTP {response.status_code} without a form"
+            data = {"csrf_token": token.group(1)}
+            files = None
+            if step == "personal":
+                for field in ("first_name", "last_name", "email", "gender", "mobile"):
+                    data[field] = record[field]
+            elif step == "details":
+                data["date_of_birth"] = record["date_of_birth"]
+                data["subjects"] = record["subjects"]
+                # Checkboxes post one value per ticked box
+                data["hobbies"] = [h for h in record["hobbies"].split(",") if h]
+                picture = record["picture"]
+                kind = "image/png" if picture.endswith(".png") else "image/jpeg"
+                files = {"picture": (picture, self.pictures[picture], kind)}
+            else:
+                for field in ("current_address", "state", "city"):
+                    data[field] = record[field]
+            # requests follows the 303 to the next step (or the confirmation)
+            response = timed(step, "POST", f"/form/{step}", data=data, files=files)
+            if response.status_code == 422:
+                return "rejected", latencies, ",".join(ERROR_PATTERN.findall(response.text))
+            if response.status_code != 200:
+                return "error", latencies, f"{step}: HTTP {response.status_code}"
+
+        if "/form/done/" not in response.url:
+            return "error", latencies, f"no confirmation (ended at {response.url})"
+        confirmed = {name: html.unescape(value)
+                     for name, value in CONFIRMED_PATTERN.findall(response.text)}
+        wrong = [name for name in CONFIRMATION_FIELDS if confirmed.get(name) != record[name]]
+        if wrong:
+            return "error", latencies, "confirmation differs: " + ",".join(wrong)
+        return "submitted", latencies, response.url.rsplit("/", 1)[-1]
+
+    def check(self, record, outcome, detail):
+        """True if the outcome is what the record should produce"""
+        expected = record["expected_error"]
+        if expected:
+            return outcome == "rejected" and detail == expected
+        return outcome == "submitted"
+
+    def new_session(self):
+        import requests
+
+        session = requests.Session()
+        session.trust_env = self.trust_env
+        return session
+
+    def run_protocol_checks(self):
+        """The server enforces CSRF tokens and step order"""
+        print("\nProtocol checks:")
+        base = self.base_url + "/form/"
+        with self.new_session() as session:
+            page = session.get(base + STEPS[0], timeout=10).text
+            token = CSRF_PATTERN.search(page).group(1)
+            checks = [
+                ("POST without CSRF token", 403,
+                 session.post(base + STEPS[0], data={}, timeout=10)),
+                ("POST with a forged token", 403,
+                 session.post(base + STEPS[0], data={"csrf_token": "0" * 32}, timeout=10)),
+                ("POST a step out of order", 409,
+                 session.post(base + STEPS[1], data={"csrf_token": token}, timeout=10)),
+                ("Skip ahead to a later step", 200,
+                 session.get(base + STEPS[2], timeout=10)),
+            ]
+        for label, expected, response in checks:
+            ok = response.status_code == expected
+            if label.startswith("Skip"):
+                # Redirected back to the step the session is on
+                ok = ok and response.url.endswith(f"/form/{STEPS[0]}")
+            print(f"{'✓' if ok else '✗'} {label}: {response.status_code}")
+            self.protocol_checks.append({"check": label, "status": response.status_code,
+                                         "expected": expected, "ok": ok})
+        failed = [c["check"] for c in self.protocol_checks if not c["ok"]]
+        assert not failed, f"Protocol checks failed: {', '.join(failed)}"
+
+    def run_sequential(self):
+        with self.new_session() as session:
+            results = []
+            for record in self.records:
+                session.cookies.clear()
+                results.append(self.fill(session, record))
+        return results
+
+    def run_concurrent(self):
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        local = threading.local()
+
+        def fill(record):
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = self.new_session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+            session.cookies.clear()
+            return self.fill(session, record)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                return list(pool.map(fill, self.records))
+        finally:
+            adapter.close()
+
+    def run_mode(self, mode):
+        start = time.perf_counter()
+        results = self.run_sequential() if mode == "sequential" else self.run_concurrent()
+        seconds = time.perf_counter() - start
+
+        step_latencies = {key: [] for key in STEP_KEYS}
+        outcomes = {"submitted": 0, "rejected": 0, "error": 0}
+        errors = []
+        rows = []
+        for record, (outcome, latencies, detail) in zip(self.records, results):
+            outcomes[outcome] += 1
+            for key, value in latencies.items():
+                step_latencies[key].append(value)
+            if not self.check(record, outcome, detail):
+                errors.append(f"{record['record_id']}: {outcome} ({detail})")
+            rows.append([mode, record["record_id"], outcome, detail, record["expected_error"]]
+                        + [round(latencies[k], 3) if k in latencies else None for k in STEP_KEYS])
+        self.submissions[mode] = rows
+
+        stats = {
+            "forms": len(self.records),
+            "seconds": round(seconds, 3),
+            "forms_per_s": round(len(self.records) / seconds, 1) if seconds else None,
+            "submitted": outcomes["submitted"],
+            "rejected": outcomes["rejected"],
+            "http_errors": outcomes["error"],
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(self.records), 4) if self.records else 0,
+            "steps": {key: latency_stats(values) for key, values in step_latencies.items()},
+            "error_samples": errors[:5],
+        }
+        if mode == "concurrent":
+            stats["concurrency"] = self.concurrency
+        self.modes[mode] = stats
+
+        mark = "✓" if not errors else "✗"
+        print(f"{mark} {mode:<11} {stats['forms_per_s']:>8,.1f} forms/s  "
+              f"{stats['submitted']} submitted, {stats['rejected']} rejected, "
+              f"error rate {stats['error_rate'] * 100:.1f}%")
+        for key in STEP_KEYS:
+            step = stats["steps"][key]
+            if step["p50_ms"] is not None:
+                print(f"    {key:<9} p50 {step['p50_ms']:.2f} ms  p99 {step['p99_ms']:.2f} ms")
+        for error in stats["error_samples"]:
+            print(f"    {error}")
+        return stats
+
+    def write_workbook(self):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Modes"
+        ws.append(["Mode", "Forms", "Seconds", "Forms/s", "Submitted", "Rejected", "Errors",
+                   "Error Rate"] + [f"{key} p50 (ms)" for key in STEP_KEYS])
+        for mode, stats in self.modes.items():
+            ws.append([mode, stats["forms"], stats["seconds"], stats["forms_per_s"],
+                       stats["submitted"], stats["rejected"], stats["errors"], stats["error_rate"]]
+                      + [stats["steps"][key]["p50_ms"] for key in STEP_KEYS])
+
+        ws_forms = wb.create_sheet("Submissions")
+        ws_forms.append(["Mode", "Record ID", "Outcome", "Detail", "Expected Error"]
+                        + [f"{key} (ms)" for key in STEP_KEYS])
+        for rows in self.submissions.values():
+            for row in rows:
+                ws_forms.append(row)
+
+        for sheet in (ws, ws_forms):
+            for cell in sheet[1]:
+                cell.font = Font(bold=True)
+        wb.save(self.output_file)
+        print(f"\n✓ Results written to {self.output_file}")
+
+    def cleanup(self):
+        benchmark_report.discard(self.output_file)
+        benchmark_report.discard(self.records_file,
+                                 *(self.output_dir / name for name in self.pictures), keep=False)
+        if self.created_dir:
+            # Only removed when empty, so files placed there meanwhile survive
+            try:
+                self.output_dir.rmdir()
+            except OSError:
+                pass
+
+    def report(self):
+        return {
+            "records": self.record_count,
+            "invalid_rate": self.invalid_rate,
+            "concurrency": self.concurrency,
+            "upload_kb": self.upload_kb,
+            "server_latency_ms": self.latency_ms,
+            "protocol_checks": self.protocol_checks,
+            "modes": self.modes,
+        }
+
+    def run(self, modes=MODES):
+        print("\n" + "="*60)
+        print("FORM AUTOMATION TEST")
+        print("="*60)
+
+        server = None
+        if self.base_url is None:
+            server = FormServer(latency_ms=self.latency_ms).start()
+            self.base_url = server.url
+            print(f"Local form server: {self.base_url} ({self.latency_ms:g} ms per request)")
+
+        start_time = time.perf_counter()
+        try:
+            self.write_records()
+            self.read_records()
+            self.run_protocol_checks()
+            print(f"\nSubmitting {len(self.records)} records "
+                  f"(concurrency {self.concurrency} for the pooled run):")
+            for mode in modes:
+                self.run_mode(mode)
+            self.write_workbook()
+        except (AssertionError, OSError) as e:
+            print(f"\n✗ Test failed: {e}")
+            benchmark_report.record("forms", self.report())
+            return 1
+        finally:
+            self.cleanup()
+            if server is not None:
+                server.stop()
+
+        total_ms = (time.perf_counter() - start_time) * 1000
+        benchmark_report.record("forms", self.report())
+
+        print("\n" + "="*60)
+        print("TEST SUMMARY")
+        print("="*60)
+        print(f"Total Duration: {total_ms / 1000:.2f} seconds")
+        for mode, stats in self.modes.items():
+            print(f"{mode}: {stats['forms_per_s']:,.1f} forms/s, {stats['errors']} errors")
+
+        errors = sum(stats["errors"] for stats in self.modes.values())
+        if errors:
+            print(f"\n⚠ FORM TEST COMPLETED WITH {errors} UNEXPECTED OUTCOMES")
+            return 1
+        print("\n✓ All form automation tests passed!")
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Form automation benchmark")
+    parser.add_argument("--records", type=int, default=200,
+                        help="Records to submit per mode (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Worker threads / pooled connections in concurrent mode (default: 8)")
+    parser.add_argument("--invalid-rate", type=float, default=0.1,
+                        help="Share of records that must fail validation (default: 0.1)")
+    parser.add_argument("--upload-kb", type=int, default=32,
+                        help="Size of the uploaded pictures (default: 32)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES,
+                        help="Submission modes to run (default: both)")
+    parser.add_argument("--server-latency-ms", type=float, default=1.0,
+                        help="Simulated processing time of the bundled form server (default: 1.0)")
+    parser.add_argument("--url",
+                        help="Use an already running form server instead of starting one")
+    parser.add_argument("--output-dir", default="test-data/forms",
+                        help="Directory for the record and result workbooks, removed afterwards")
+    args = parser.parse_args()
+
+    test = FormAutomationTest(records=args.records, concurrency=args.concurrency,
+                              invalid_rate=args.invalid_rate, upload_kb=args.upload_kb,
+                              latency_ms=args.server_latency_ms,
+                              base_url=args.url.rstrip("/") if args.url else None,
+                              output_dir=args.output_dir)
+    return test.run(args.modes)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
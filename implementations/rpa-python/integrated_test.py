@@ -7,13 +7,13 @@ Tests comprehensive RPA workflow combining multiple automation types
 import sys
 import time
 from pathlib import Path
-import subprocess
-import openpyxl
-from openpyxl import Workbook
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+from phase_executor import PhaseExecutor
+
+# subprocess, openpyxl, requests and bs4 are imported inside the test that
+# uses them so each step only pays for its own dependencies.
+
 def test_native_app_automation():
     """
     Test 1: Native macOS Application Automation
@@ -23,6 +23,8 @@ def test_native_app_automation():
     print("TEST 1: Native Application Automation (Notes)")
     print("="*60)
     
+    import subprocess
+    
     try:
         # Step 1: Open Notes app
         print("Step 1.1: Opening Notes app...")
@@ -83,6 +85,13 @@ def test_web_scraping():
     print("TEST 2: Web Scraping")
     print("="*60)
     
+    try:
+        import requests
+        from bs4 import BeautifulSoup
+    except ImportError as e:
+        print(f"✗ Web scraping failed: {e}")
+        return []
+    
     try:
         # Using a public test website
         url = "https://quotes.toscrape.com/"
@@ -126,12 +135,58 @@ def test_web_scraping():
         print(f"✗ Error during web scraping: {e}")
         return []
 
-def test_excel_integration(quotes_data):
+def build_calculations_workbook():
+    """
+    Test 3 (part 1): Workbook with the Calculations sheet
+    Needs no web data, so it can be built while scraping runs.
+    """
+    from openpyxl import Workbook
+    
+    # Create new workbook
+    print("Step 3.1: Creating new Excel workbook...")
+    wb = Workbook()
+    
+    # Sheet 1: Original Excel Test Data
+    print("Step 3.2: Creating Sheet1 with calculation test...")
+    ws1 = wb.active
+    ws1.title = "Calculations"
+    
+    # Headers
+    ws1['A1'] = "Item"
+    ws1['B1'] = "Quantity"
+    ws1['C1'] = "Price"
+    ws1['D1'] = "Total"
+    
+    # Data
+    items_data = [
+        ("Product A", 10, 25.50),
+        ("Product B", 5, 42.00),
+        ("Product C", 15, 18.75),
+        ("Product D", 8, 33.25),
+        ("Product E", 12, 21.50)
+    ]
+    
+    for idx, (item, qty, price) in enumerate(items_data, start=2):
+        ws1[f'A{idx}'] = item
+        ws1[f'B{idx}'] = qty
+        ws1[f'C{idx}'] = price
+        ws1[f'D{idx}'] = f'=B{idx}*C{idx}'
+    
+    # Summary
+    ws1['A7'] = "TOTAL"
+    ws1['D7'] = '=SUM(D2:D6)'
+    
+    print("✓ Sheet1 created with formulas")
+    
+    return wb
+
+def test_excel_integration(quotes_data, wb=None):
     """
     Test 3: Excel Integration
     Creates Excel file with multiple sheets:
     - Sheet1: Original Excel test data
     - Sheet2: Web scraped quotes data
+    Pass the workbook from build_calculations_workbook() to reuse Sheet1.
     """
     print("\n" + "="*60)
     print("TEST 3: Excel Multi-Sheet Integration")
@@ -141,41 +196,10 @@ def test_excel_integration(quotes_data):
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Create new workbook
-        print("Step 3.1: Creating new Excel workbook...")
-        wb = Workbook()
-        
-        # Sheet 1: Original Excel Test Data
-        print("Step 3.2: Creating Sheet1 with calculation test...")
-        ws1 = wb.active
-        ws1.title = "Calculations"
-        
-        # Headers
-        ws1['A1'] = "Item"
-        ws1['B1'] = "Quantity"
-        ws1['C1'] = "Price"
-        ws1['D1'] = "Total"
-        
-        # Data
-        items_data = [
-            ("Product A", 10, 25.50),
-            ("Product B", 5, 42.00),
-            ("Product C", 15, 18.75),
-            ("Product D", 8, 33.25),
-            ("Product E", 12, 21.50)
-        ]
-        
-        for idx, (item, qty, price) in enumerate(items_data, start=2):
-            ws1[f'A{idx}'] = item
-            ws1[f'B{idx}'] = qty
-            ws1[f'C{idx}'] = price
-            ws1[f'D{idx}'] = f'=B{idx}*C{idx}'
-        
-        # Summary
-        ws1['A7'] = "TOTAL"
-        ws1['D7'] = '=SUM(D2:D6)'
+        import openpyxl
         
-        print("✓ Sheet1 created with formulas")
+        if wb is None:
+            wb = build_calculations_workbook()
         
         # Sheet 2: Web Scraped Data
         print("Step 3.3: Creating Sheet2 with scraped quotes...")
@@ -253,7 +277,7 @@ def test_excel_integration(quotes_data):
 
 def run_integrated_test():
     """
-    Main test runner - executes all tests in sequence
+    Main test runner - executes independent tests concurrently
     """
     print("\n" + "="*60)
     print("INTEGRATED RPA TEST SUITE")
@@ -262,24 +286,38 @@ def run_integrated_test():
     print("="*60)
     
     start_time = time.time()
-    results = {
-        'native_app': False,
-        'web_scraping': False,
-        'excel_integration': False
-    }
     
-    # Test 1: Native App Automation
-    results['native_app'] = test_native_app_automation()
+    # The native app test, the web scrape and the Calculations sheet don't
+    # depend on each other, so they run concurrently; the multi-sheet
+    # workbook is finished once both the quotes and Sheet1 exist.
+    state = {}
     
-    # Test 2: Web Scraping
-    quotes_data = test_web_scraping()
-    results['web_scraping'] = len(quotes_data) > 0
+    def web_scraping():
+        state['quotes'] = test_web_scraping()
+        return len(state['quotes']) > 0
     
-    # Test 3: Excel Integration (combines data from tests 1 & 2)
-    if results['web_scraping']:
-        results['excel_integration'] = test_excel_integration(quotes_data)
-    else:
-        print("\n⚠ Skipping Excel integration due to web scraping failure")
+    def excel_base():
+        state['workbook'] = build_calculations_workbook()
+        return True
+    
+    executor = PhaseExecutor()
+    executor.add('native_app', test_native_app_automation)
+    executor.add('web_scraping', web_scraping, outputs=['quotes'])
+    executor.add('excel_base', excel_base, outputs=['workbook'])
+    executor.add('excel_integration',
+                 lambda: test_excel_integration(state['quotes'], state['workbook']),
+                 inputs=['quotes', 'workbook'])
+    executor.run()
+    executor.record()
+    
+    passed = {name: timing['status'] == 'passed' for name, timing in executor.timings.items()}
+    results = {
+        'native_app': passed['native_app'],
+        'web_scraping': passed['web_scraping'],
+        'excel_integration': passed['excel_integration']
+    }
+    if not results['web_scraping']:
+        print("\n⚠ Skipped Excel integration due to web scraping failure")
     
     # Final Summary
     end_time = time.time()
@@ -292,6 +330,7 @@ def run_integrated_test():
     print(f"2. Web Scraping:              {'✓ PASSED' if results['web_scraping'] else '✗ FAILED'}")
     print(f"3. Excel Integration:         {'✓ PASSED' if results['excel_integration'] else '✗ FAILED'}")
     print(f"\nTotal Duration: {duration:.2f} seconds")
+    executor.print_summary()
     
     all_passed = all(results.values())
     if all_passed:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Local HTTP Server helper for RPA Python tests
+Runs a stand-in service on 127.0.0.1 inside the test process
+
+Scenarios that would otherwise depend on a public site (REST APIs, fault
+injection, forms) start one of these with their own request handler so
+results are repeatable and no network is needed:
+
+    with LocalServer(MyHandler) as server:
+        requests.get(server.url + "/posts")
+
+The server binds an ephemeral port, speaks HTTP/1.1 keep-alive when the
+handler sets Content-Length, and serves each connection on its own thread.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Base handler: HTTP/1.1, no per-request logging, JSON/text helpers"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body waits on the client's delayed ACK (~40 ms per keep-alive request)
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # Keep request lines out of the benchmark output
+        pass
+
+    def send_body(self, status, body, content_type="application/json", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+
+class BenchmarkHTTPServer(ThreadingHTTPServer):
+    # Concurrent clients open many connections at once; the default
+    # backlog of 5 drops SYNs and costs a 1 s retransmit
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class LocalServer:
+    """ThreadingHTTPServer on an ephemeral localhost port, run on a daemon thread"""
+
+    def __init__(self, handler_class, host="127.0.0.1", port=0):
+        self.httpd = BenchmarkHTTPServer((host, port), handler_class)
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       name=f"local-server-{handler_class.__name__}", daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware Phase Executor for RPA Python tests
+Runs workflow phases as a DAG so independent phases overlap
+
+Each phase declares the named inputs it needs and the outputs it produces
+(e.g. "catalog_file", "market_data"). A phase starts on a worker thread as
+soon as every phase producing its inputs has succeeded, so local Excel work
+can run while a network-bound phase waits. Phases return True/False like
+the workflow phase methods; a failed phase skips the phases that depend on
+it, while independent phases still run.
+
+After a run the executor reports each phase's start/end offsets, the
+critical path (the chain of dependent phases that bounds wall time) and
+total work, so the overlap gained is visible next to the phase times.
+
+A phase may be added with `overhead`, a callable returning the
+milliseconds its last call spent on instrumentation (e.g. tracemalloc
+snapshots). That time is left out of the phase's duration, and out of the
+offsets and wall time that follow it; the offsets are exact when phases
+run one at a time, as instrumentation that needs exclusion usually forces.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import benchmark_report
+
+
+class Phase:
+    def __init__(self, name: str, func: Callable[[], bool],
+                 inputs: Iterable[str] = (), outputs: Iterable[str] = (),
+                 overhead: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.func = func
+        self.overhead = overhead
+        self.inputs = set(inputs)
+        self.outputs = set(outputs)
+
+
+class PhaseExecutor:
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.phases: Dict[str, Phase] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.wall_ms = 0.0
+        self.excluded_ms = 0.0
+
+    def add(self, name: str, func: Callable[[], bool],
+            inputs: Iterable[str] = (), outputs: Iterable[str] = (),
+            overhead: Optional[Callable[[], float]] = None):
+        """Register a phase; returns self so calls can be chained"""
+        if name in self.phases:
+            raise ValueError(f"Duplicate phase: {name}")
+        self.phases[name] = Phase(name, func, inputs, outputs, overhead)
+        return self
+
+    def dependencies(self) -> Dict[str, set]:
+        """Phase name -> names of the phases producing its inputs"""
+        producers = {}
+        for phase in self.phases.values():
+            for output in phase.outputs:
+                if output in producers:
+                    raise ValueError(f"'{output}' is produced by both "
+                                     f"{producers[output]} and {phase.name}")
+                producers[output] = phase.name
+
+        deps = {}
+        for phase in self.phases.values():
+            missing = phase.inputs - producers.keys()
+            if missing:
+                raise ValueError(f"{phase.name} needs {', '.join(sorted(missing))}, "
+                                 "which no phase produces")
+            deps[phase.name] = {producers[i] for i in phase.inputs}
+
+        # Reject cycles before anything runs
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Phase dependency cycle through {name}")
+            visiting.add(name)
+            for dep in deps[name]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in deps:
+            visit(name)
+        return deps
+
+    def _timed(self, phase: Phase, origin: float) -> bool:
+        start = time.perf_counter()
+        try:
+            ok = bool(phase.func())
+        except Exception as e:
+            print(f"✗ {phase.name} raised: {e}")
+            ok = False
+        end = time.perf_counter()
+        overhead_ms = phase.overhead() if phase.overhead else 0.0
+        start_ms = (start - origin) * 1000 - self.excluded_ms
+        duration_ms = max((end - start) * 1000 - overhead_ms, 0.0)
+        self.excluded_ms += overhead_ms
+        self.timings[phase.name] = {
+            "start_ms": round(start_ms, 2),
+            "end_ms": round(start_ms + duration_ms, 2),
+            "duration_ms": round(duration_ms, 2),
+            "status": "passed" if ok else "failed",
+        }
+        if overhead_ms:
+            self.timings[phase.name]["excluded_ms"] = round(overhead_ms, 2)
+        return ok
+
+    def run(self) -> bool:
+        """Run every phase as soon as its inputs exist; True if all passed"""
+        deps = self.dependencies()
+        pending = dict(deps)
+        origin = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            while pending or running:
+                for name, needs in list(pending.items()):
+                    statuses = [self.timings[d]["status"] for d in needs if d in self.timings]
+                    if any(status != "passed" for status in statuses):
+                        # An upstream phase failed: nothing to build on
+                        del pending[name]
+                        self.timings[name] = {"status": "skipped"}
+                    elif len(statuses) == len(needs):
+                        del pending[name]
+                        running[pool.submit(self._timed, self.phases[name], origin)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    del running[future]
+
+        self.wall_ms = round((time.perf_counter() - origin) * 1000 - self.excluded_ms, 2)
+        return all(t["status"] == "passed" for t in self.timings.values())
+
+    def failed_phase(self) -> Optional[str]:
+        for name, timing in self.timings.items():
+            if timing["status"] == "failed":
+                return name
+        return None
+
+    def critical_path(self) -> List[str]:
+        """Longest chain of dependent phases by duration"""
+        deps = self.dependencies()
+        best: Dict[str, tuple] = {}
+
+        def longest(name):
+            if name not in best:
+                own = self.timings.get(name, {}).get("duration_ms", 0.0)
+                chains = [longest(dep) for dep in deps[name]]
+                length, path = max(chains, default=(0.0, []))
+                best[name] = (length + own, path + [name])
+            return best[name]
+
+        path = max((longest(name) for name in deps), default=(0.0, []))[1]
+        return [name for name in path if "duration_ms" in self.timings.get(name, {})]
+
+    def schedule(self) -> Dict[str, Any]:
+        path = self.critical_path()
+        durations = [t["duration_ms"] for t in self.timings.values() if "duration_ms" in t]
+        return {
+            "wall_ms": self.wall_ms,
+            "total_work_ms": round(sum(durations), 2),
+            "critical_path": path,
+            "critical_path_ms": round(sum(self.timings[p].get("duration_ms", 0.0) for p in path), 2),
+            "excluded_ms": round(self.excluded_ms, 2),
+            "phases": self.timings,
+        }
+
+    def record(self, key: str = "phase_schedule"):
+        """Store the schedule in the benchmark report"""
+        benchmark_report.record(key, self.schedule())
+
+    def print_summary(self):
+        schedule = self.schedule()
+        print(f"Critical Path: {' → '.join(schedule['critical_path'])} "
+              f"({schedule['critical_path_ms'] / 1000:.2f}s)")
+        print(f"Total Phase Work: {schedule['total_work_ms'] / 1000:.2f}s "
+              f"in {schedule['wall_ms'] / 1000:.2f}s wall time")
+        if schedule["excluded_ms"]:
+            print(f"Instrumentation Excluded: {schedule['excluded_ms'] / 1000:.2f}s")
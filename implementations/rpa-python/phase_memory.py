@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Per-phase Memory Profiler for RPA Python tests
+Takes tracemalloc snapshots at phase boundaries
+
+Enabled by test_runner.py --memory-profile (RPA_BENCH_TRACEMALLOC=1). For
+each phase it reports the peak traced allocation above the phase's starting
+point, the memory still held when the phase ends, and the source lines
+responsible for the largest growth. Disabled profilers cost nothing.
+
+Phases import their heavy libraries lazily, so a phase's growth would
+mostly be module objects created by imports. The modules named in
+`warm_up` are imported before tracing starts, allocations made under the
+import machinery are dropped where the traceback reaches it, and each
+remaining allocation is attributed to the innermost frame in a scenario
+script (this directory) rather than the library line that made it.
+(Named phase_memory so it does not shadow the PyPI memory_profiler.)
+"""
+
+import importlib
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import benchmark_report
+
+TRACEMALLOC_ENV = "RPA_BENCH_TRACEMALLOC"
+
+# Allocations made anywhere under the import machinery (module objects,
+# class bodies, descriptors) or by tracemalloc itself are noise when
+# attributing memory to workflow code; all_frames drops a trace if any
+# frame of its traceback matches
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>", all_frames=True),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>", all_frames=True),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+# Deep enough to reach from library internals back to the scenario frame;
+# every extra frame makes tracing slower
+TRACEBACK_FRAMES = 8
+
+SCENARIO_DIR = str(Path(__file__).resolve().parent)
+
+
+class PhaseMemoryProfiler:
+    def __init__(self, enabled: bool = None, top_n: int = 5, frames: int = TRACEBACK_FRAMES,
+                 warm_up: Sequence[str] = ()):
+        if enabled is None:
+            enabled = os.environ.get(TRACEMALLOC_ENV) == "1"
+        self.enabled = enabled
+        self.warm_up = list(warm_up)
+        self.top_n = top_n
+        self.frames = frames
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        # Time spent taking and comparing snapshots, per phase
+        self.overhead_ms: Dict[str, float] = {}
+
+    def _top_sites(self, before, after) -> List[Dict[str, Any]]:
+        """Scenario source lines with the largest allocation growth between snapshots"""
+        stats = after.filter_traces(SNAPSHOT_FILTERS).compare_to(
+            before.filter_traces(SNAPSHOT_FILTERS), 'traceback')
+        growth: Dict[str, List[int]] = {}
+        for stat in stats:
+            # Innermost frame in a scenario script, else the allocating line
+            # (tracebacks are stored oldest frame first)
+            frames = list(reversed(stat.traceback))
+            frame = next((f for f in frames if f.filename.startswith(SCENARIO_DIR)
+                          and f.filename != __file__), frames[0])
+            site = growth.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+            site[0] += stat.size_diff
+            site[1] += stat.count_diff
+        top = sorted(growth.items(), key=lambda item: item[1][0], reverse=True)[:self.top_n]
+        return [{"site": site, "size_kb": round(size / 1024, 2), "count": count}
+                for site, (size, count) in top if size > 0]
+
+    @contextmanager
+    def phase(self, name: str):
+        """Profile the enclosed block as phase `name`"""
+        if not self.enabled:
+            yield
+            return
+
+        entered = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            for module in self.warm_up:
+                try:
+                    importlib.import_module(module)
+                except ImportError:
+                    pass
+            tracemalloc.start(self.frames)
+
+        before = tracemalloc.take_snapshot()
+        start_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self.phases[name] = {
+                "peak_kb": round((peak - start_current) / 1024, 2),
+                "retained_kb": round((current - start_current) / 1024, 2),
+                "duration_ms": round((end_time - start_time) * 1000, 2),
+                "top_allocations": self._top_sites(before, after)
+            }
+            benchmark_report.record("memory_profile", self.phases)
+            self.overhead_ms[name] = ((time.perf_counter() - entered)
+                                      - (end_time - start_time)) * 1000
+
+    def print_summary(self):
+        """Print per-phase peak and retained allocations"""
+        if not self.phases:
+            return
+        print("\nMemory Profile (tracemalloc):")
+        for name, stats in self.phases.items():
+            print(f"  {name}: peak {stats['peak_kb']:.1f} KB, "
+                  f"retained {stats['retained_kb']:.1f} KB")
+            for site in stats["top_allocations"][:3]:
+                print(f"    +{site['size_kb']:.1f} KB  {site['site']}")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Retry / Backoff Policy for RPA Python workflows
+Retries transient failures and records how long recovery took
+
+A RetryPolicy wraps one unit of work (a page fetch, a workbook load) and
+retries it on errors the caller marks as transient, sleeping an
+exponentially growing, jittered backoff between attempts. Work is retried
+at the granularity the caller chose, so a crawl resumes from the page that
+failed instead of starting over.
+
+Every operation that needed a retry is logged with its error types, the
+attempts taken and its time-to-recover: from the start of the first failed
+attempt to the end of the successful one.
+"""
+
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class IncompleteResponse(Exception):
+    """A response arrived but its body is cut short (e.g. truncated HTML)"""
+
+
+def html_complete(response):
+    """Validator for fetch(): the page must end its <html> document"""
+    if "</html>" not in response.text[-512:].lower():
+        raise IncompleteResponse(f"Truncated HTML from {response.url} "
+                                 f"({len(response.content)} bytes)")
+
+
+def is_transient_http(error: Exception) -> bool:
+    """Timeouts, dropped connections, 5xx and truncated bodies are worth retrying"""
+    import requests
+
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.Timeout, requests.ConnectionError,
+                              requests.exceptions.ChunkedEncodingError, IncompleteResponse))
+
+
+class RetryPolicy:
+    def __init__(self, attempts: int = 3, backoff_s: float = 0.25, max_backoff_s: float = 4.0,
+                 jitter: float = 0.1, timeout_s: float = 10.0, seed: Optional[int] = None):
+        self.attempts = max(1, attempts)
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.jitter = jitter
+        self.timeout_s = timeout_s
+        self.rng = random.Random(seed)
+        self.events: List[Dict[str, Any]] = []
+
+    def delay(self, retry: int) -> float:
+        """Backoff before retry number `retry` (1-based)"""
+        base = min(self.backoff_s * 2 ** (retry - 1), self.max_backoff_s)
+        return base * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def call(self, operation: Callable[[], Any], label: str,
+             retry_on: Callable[[Exception], bool] = lambda e: True,
+             before_retry: Optional[Callable[[], Any]] = None) -> Any:
+        """Run operation(), retrying errors for which retry_on(error) is true
+
+        before_retry runs ahead of each new attempt, e.g. to rebuild a
+        corrupt input. The last error is re-raised once attempts run out.
+        """
+        errors: List[str] = []
+        first_failure = None
+        backoff_total = 0.0
+        for attempt in range(1, self.attempts + 1):
+            attempt_start = time.perf_counter()
+            try:
+                result = operation()
+            except Exception as e:
+                if first_failure is None:
+                    first_failure = attempt_start
+                errors.append(type(e).__name__)
+                if attempt == self.attempts or not retry_on(e):
+                    self.log(label, errors, recovered=False, started=first_failure,
+                             backoff_s=backoff_total)
+                    raise
+                wait = self.delay(attempt)
+                backoff_total += wait
+                print(f"⚠ {label}: {type(e).__name__}: {e} "
+                      f"(retry {attempt}/{self.attempts - 1} in {wait:.2f}s)")
+                time.sleep(wait)
+                if before_retry is not None:
+                    before_retry()
+                continue
+            if errors:
+                event = self.log(label, errors, recovered=True, started=first_failure,
+                                 backoff_s=backoff_total)
+                print(f"✓ {label} recovered after {len(errors)} failed attempt(s) "
+                      f"in {event['time_to_recover_ms']:.0f} ms")
+            return result
+
+    def fetch(self, session, url: str, validate: Optional[Callable[[Any], None]] = None):
+        """GET url through session with retries; validate(response) may raise IncompleteResponse"""
+        def get():
+            response = session.get(url, timeout=self.timeout_s)
+            response.raise_for_status()
+            if validate is not None:
+                validate(response)
+            return response
+        return self.call(get, f"GET {url}", retry_on=is_transient_http)
+
+    def log(self, label: str, errors: List[str], recovered: bool, started: float,
+            backoff_s: float) -> Dict[str, Any]:
+        event = {
+            "operation": label,
+            "errors": errors,
+            "attempts": len(errors) + (1 if recovered else 0),
+            "recovered": recovered,
+            "time_to_recover_ms": round((time.perf_counter() - started) * 1000, 2) if recovered else None,
+            "backoff_ms": round(backoff_s * 1000, 2),
+        }
+        self.events.append(event)
+        return event
+
+    def summary(self) -> Dict[str, Any]:
+        recover_ms = [e["time_to_recover_ms"] for e in self.events if e["recovered"]]
+        error_types: Dict[str, int] = {}
+        for event in self.events:
+            for error in event["errors"]:
+                error_types[error] = error_types.get(error, 0) + 1
+        return {
+            "attempts_allowed": self.attempts,
+            "retries": sum(len(e["errors"]) for e in self.events) - sum(not e["recovered"] for e in self.events),
+            "recovered": len(recover_ms),
+            "unrecovered": sum(not e["recovered"] for e in self.events),
+            "time_to_recover_ms_mean": round(sum(recover_ms) / len(recover_ms), 2) if recover_ms else None,
+            "time_to_recover_ms_max": max(recover_ms) if recover_ms else None,
+            "error_types": error_types,
+            "events": self.events,
+        }
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Streaming Workbook Verifier for RPA Python tests
+Checks declarative rules over every row in one read-only pass per sheet
+
+Phase 4 used to load whole workbooks into the object model and probe a few
+hand-picked cells. WorkbookVerifier instead streams each sheet once with
+xlsx_reader.XlsxReader (openpyxl's read-only mode would parse sheets
+without a <dimension> twice) and checks a SheetRule against every row:
+
+  - required headers (by name, in any column order)
+  - data row count (exact or minimum)
+  - non-empty key column
+  - formula / numeric presence per column
+  - cross-sheet key consistency (keys must exist in, or equal, the keys of
+    a sheet verified earlier, possibly in another workbook)
+  - summary rows after the table (label present, formula or number next to it)
+
+The table is the run of rows after the header up to the first blank row;
+anything below is the summary block. Besides the shared strings table,
+only the key sets needed for cross-sheet checks are kept; no cell objects
+are built, and violations keep a bounded sample per rule.
+
+Run directly to compare against full-load verification:
+    python3 workbook_verifier.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from xlsx_reader import XlsxReader
+
+# Violations are all counted, but only this many are kept per rule
+VIOLATION_SAMPLE_SIZE = 5
+
+
+def is_formula(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("=")
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class SheetRule:
+    """
+    Declarative checks for one sheet
+
+    `ref` names the sheet's key set for other rules' keys_in / same_keys_as
+    (defaults to the sheet name; set it when two workbooks share a sheet
+    name). `summary` maps a column A label below the table to "formula" or
+    "number" for the cell next to it.
+    """
+
+    def __init__(self, sheet: str, headers: Sequence[str] = (), key: Optional[str] = None,
+                 rows: Optional[int] = None, min_rows: Optional[int] = None,
+                 formulas: Sequence[str] = (), numbers: Sequence[str] = (),
+                 keys_in: Sequence[str] = (), same_keys_as: Optional[str] = None,
+                 summary: Optional[Dict[str, str]] = None,
+                 normalize: Callable[[Any], Any] = lambda v: v, ref: Optional[str] = None):
+        self.sheet = sheet
+        self.headers = list(headers)
+        self.key = key
+        self.rows = rows
+        self.min_rows = min_rows
+        self.formulas = list(formulas)
+        self.numbers = list(numbers)
+        self.keys_in = list(keys_in)
+        self.same_keys_as = same_keys_as
+        self.summary = dict(summary or {})
+        self.normalize = normalize
+        self.ref = ref or sheet
+
+    def columns(self) -> List[str]:
+        """Every header the rule needs to locate"""
+        needed = self.headers + self.formulas + self.numbers + ([self.key] if self.key else [])
+        return list(dict.fromkeys(needed))
+
+
+class SheetResult:
+    def __init__(self, rule: SheetRule):
+        self.rule = rule
+        self.rows = 0
+        self.violations: Dict[str, int] = {}
+        self.samples: Dict[str, List[str]] = {}
+
+    def fail(self, check: str, message: str):
+        self.violations[check] = self.violations.get(check, 0) + 1
+        sample = self.samples.setdefault(check, [])
+        if len(sample) < VIOLATION_SAMPLE_SIZE:
+            sample.append(message)
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "sheet": self.rule.sheet,
+            "rows": self.rows,
+            "violations": self.violations,
+            "samples": self.samples,
+        }
+
+
+class WorkbookVerifier:
+    """Runs SheetRules over workbooks; key sets carry over between verify() calls"""
+
+    def __init__(self):
+        self.keys: Dict[str, set] = {}
+        self.results: List[SheetResult] = []
+        self.verify_ms = 0.0
+
+    def verify(self, path, rules: Sequence[SheetRule],
+               required_sheets: Sequence[str] = ()) -> List[SheetResult]:
+        start = time.perf_counter()
+        wb = XlsxReader(path)
+        try:
+            results = []
+            ruled = {rule.sheet for rule in rules}
+            for name in required_sheets:
+                if name not in wb.sheetnames and name not in ruled:
+                    results.append(SheetResult(SheetRule(name)))
+                    results[-1].fail("sheet", f"{Path(path).name}: sheet '{name}' missing")
+            for rule in rules:
+                result = SheetResult(rule)
+                if rule.sheet in wb.sheetnames:
+                    self.scan(wb.rows(rule.sheet), rule, result)
+                else:
+                    result.fail("sheet", f"{Path(path).name}: sheet '{rule.sheet}' missing")
+                results.append(result)
+        finally:
+            wb.close()
+        self.results.extend(results)
+        self.verify_ms += (time.perf_counter() - start) * 1000
+        return results
+
+    def locate(self, header_row: Tuple, rule: SheetRule, result: SheetResult) -> Dict[str, int]:
+        positions = {}
+        for index, value in enumerate(header_row or ()):
+            if value is not None and value not in positions:
+                positions[value] = index
+        for name in rule.columns():
+            if name not in positions:
+                result.fail("headers", f"header '{name}' missing")
+        return positions
+
+    def scan(self, rows: Iterator[Tuple], rule: SheetRule, result: SheetResult):
+        columns = self.locate(next(rows, None), rule, result)
+        key_col = columns.get(rule.key)
+        formula_cols = [(name, columns[name]) for name in rule.formulas if name in columns]
+        number_cols = [(name, columns[name]) for name in rule.numbers if name in columns]
+        keys = set()
+        summary_seen = set()
+        in_table = True
+
+        def cell(row, index):
+            return row[index] if index is not None and index < len(row) else None
+
+        for row_number, row in enumerate(rows, 2):
+            blank = all(value is None or value == "" for value in row)
+            if in_table and blank:
+                in_table = False
+            if not in_table:
+                label = cell(row, 0)
+                expected = rule.summary.get(label)
+                if expected:
+                    summary_seen.add(label)
+                    value = cell(row, 1)
+                    if not (is_formula(value) if expected == "formula" else is_number(value)):
+                        result.fail("summary", f"row {row_number}: {label} has {value!r}, "
+                                               f"expected a {expected}")
+                continue
+
+            result.rows += 1
+            if key_col is not None:
+                key = cell(row, key_col)
+                if key is None or str(key).strip() == "":
+                    result.fail("keys", f"row {row_number}: empty {rule.key}")
+                else:
+                    keys.add(rule.normalize(key))
+            for name, index in formula_cols:
+                value = cell(row, index)
+                if not is_formula(value):
+                    result.fail("formulas", f"row {row_number}: {name} is {value!r}, not a formula")
+            for name, index in number_cols:
+                value = cell(row, index)
+                if not is_number(value):
+                    result.fail("numbers", f"row {row_number}: {name} is {value!r}, not a number")
+
+        if rule.rows is not None and result.rows != rule.rows:
+            result.fail("row_count", f"expected {rule.rows} rows, found {result.rows}")
+        if rule.min_rows is not None and result.rows < rule.min_rows:
+            result.fail("row_count", f"expected at least {rule.min_rows} rows, found {result.rows}")
+        for label in rule.summary:
+            if label not in summary_seen:
+                result.fail("summary", f"summary row '{label}' missing")
+
+        if rule.key:
+            self.keys[rule.ref] = keys
+            for ref in rule.keys_in:
+                if ref not in self.keys:
+                    result.fail("cross_sheet", f"no keys recorded for '{ref}' (verify it first)")
+                    continue
+                for key in sorted(keys - self.keys[ref], key=str):
+                    result.fail("cross_sheet", f"{rule.key} {key!r} not in {ref}")
+            if rule.same_keys_as:
+                other = self.keys.get(rule.same_keys_as)
+                if other is None:
+                    result.fail("cross_sheet", f"no keys recorded for '{rule.same_keys_as}'")
+                elif other != keys:
+                    result.fail("cross_sheet", f"keys differ from {rule.same_keys_as}: "
+                                               f"{len(keys - other)} extra, {len(other - keys)} missing")
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    def report(self) -> Dict[str, Any]:
+        rows = sum(result.rows for result in self.results)
+        return {
+            "sheets": [result.as_dict() for result in self.results],
+            "rows_checked": rows,
+            "violations": sum(sum(r.violations.values()) for r in self.results),
+            "verify_ms": round(self.verify_ms, 2),
+            "rows_per_second": round(rows / (self.verify_ms / 1000), 1) if self.verify_ms else None,
+        }
+
+    def print_results(self):
+        for result in self.results:
+            if result.ok:
+                print(f"✓ {result.rule.sheet}: {result.rows} rows pass "
+                      f"{', '.join(self.checks(result.rule))}")
+                continue
+            print(f"✗ {result.rule.sheet}: {sum(result.violations.values())} violation(s) "
+                  f"in {result.rows} rows")
+            for check, messages in result.samples.items():
+                for message in messages:
+                    print(f"    [{check}] {message}")
+
+    @staticmethod
+    def checks(rule: SheetRule) -> List[str]:
+        names = ["headers"]
+        if rule.rows is not None or rule.min_rows is not None:
+            names.append("row count")
+        if rule.key:
+            names.append("keys")
+        if rule.formulas:
+            names.append(f"{len(rule.formulas)} formula column(s)")
+        if rule.numbers:
+            names.append(f"{len(rule.numbers)} numeric column(s)")
+        if rule.keys_in or rule.same_keys_as:
+            names.append("cross-sheet keys")
+        if rule.summary:
+            names.append("summary")
+        return names
+
+
+def _write_sample(path: Path, rows: int):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append(["Key", "Amount", "Double"])
+    for row in range(2, rows + 2):
+        ws.append([f"K{row}", row * 1.5, f"=B{row}*2"])
+    wb.save(path)
+
+
+def _full_load_verify(path: Path, rows: int) -> int:
+    """The old approach: object-model load, then cell-by-cell probing"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb["Data"]
+    assert ws["A1"].value == "Key"
+    checked = 0
+    for row in range(2, rows + 2):
+        assert ws[f"A{row}"].value
+        assert is_formula(ws[f"C{row}"].value)
+        checked += 1
+    wb.close()
+    return checked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming workbook verification")
+    parser.add_argument("--rows", type=int, default=100_000,
+                        help="Rows in the synthetic workbook")
+    parser.add_argument("--path", default="test-data/verifier_sample.xlsx")
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_sample(path, args.rows)
+    rule = SheetRule("Data", headers=["Key", "Amount", "Double"], key="Key", rows=args.rows,
+                     numbers=["Amount"], formulas=["Double"])
+    try:
+        timings = {}
+        for name, verify in (("Streaming", lambda: WorkbookVerifier().verify(path, [rule])),
+                             ("Full load", lambda: _full_load_verify(path, args.rows))):
+            start = time.perf_counter()
+            verify()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            # Peak memory from a second, traced run so tracing does not skew the timing
+            tracemalloc.start()
+            verify()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            timings[name] = (elapsed_ms, peak_mb)
+        verifier = WorkbookVerifier()
+        verifier.verify(path, [rule])
+    finally:
+        path.unlink()
+
+    verifier.print_results()
+    print(f"Rows verified: {args.rows:,}")
+    for name, (elapsed_ms, peak_mb) in timings.items():
+        print(f"{name + ':':<11} {elapsed_ms:.0f} ms, peak {peak_mb:.1f} MB")
+    return 0 if verifier.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
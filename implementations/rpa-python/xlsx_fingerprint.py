@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Structural xlsx Fingerprint and Diff for RPA Python tests
+Compares workbooks from their zip/XML parts, without the openpyxl object model
+
+A fingerprint records, per worksheet, the zip CRC-32 and size of its XML
+part plus content hashes computed while streaming the sheet once through
+xlsx_reader: a 64-bit BLAKE2 digest per row (values only, so styles and
+shared-string ordering do not matter) and a sheet hash chained over them.
+
+Comparisons work in tiers, cheapest first:
+  1. sheet part and shared strings have the same CRC-32/size in both zip
+     directories -> identical, nothing is decompressed
+  2. otherwise both sheets are streamed side by side; rows whose values
+     differ are listed with a cell-level diff
+  3. against a saved fingerprint (golden file) only hashes are available,
+     so differing sheets and, when row hashes were saved, rows are listed
+
+Usage:
+    python3 xlsx_fingerprint.py fingerprint book.xlsx --row-hashes -o golden.json
+    python3 xlsx_fingerprint.py diff golden.json book.xlsx
+    python3 xlsx_fingerprint.py diff before.xlsx after.xlsx --limit 20
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from xlsx_reader import XlsxReader
+
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+
+# Changed rows and cells are all counted, but only this many are listed
+DIFF_LIMIT = 50
+
+
+def trimmed(values: Tuple) -> Tuple:
+    """Row values without trailing empty cells, so padding does not count"""
+    end = len(values)
+    while end and (values[end - 1] is None or values[end - 1] == ""):
+        end -= 1
+    return values[:end]
+
+
+def row_digest(values: Tuple) -> bytes:
+    return hashlib.blake2b(repr(trimmed(values)).encode("utf-8"), digest_size=8).digest()
+
+
+def column_letter(index: int) -> str:
+    """0-based column index to letters: 0 -> A, 27 -> AB"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def part_signature(reader: XlsxReader, part: str) -> Optional[Tuple[int, int]]:
+    """(CRC-32, uncompressed size) from the zip directory, or None if absent"""
+    try:
+        info = reader.archive.getinfo(part)
+    except KeyError:
+        return None
+    return info.CRC, info.file_size
+
+
+def sheet_fingerprint(reader: XlsxReader, sheet: str, row_hashes: bool = False) -> Dict[str, Any]:
+    """Stream one sheet and hash its rows"""
+    part = reader.sheet_paths[sheet]
+    crc, size = part_signature(reader, part)
+    chain = hashlib.blake2b(digest_size=16)
+    hashes = []
+    rows = 0
+    cells = 0
+    for values in reader.rows(sheet):
+        digest = row_digest(values)
+        chain.update(digest)
+        rows += 1
+        cells += sum(value is not None for value in values)
+        if row_hashes:
+            hashes.append(digest.hex())
+    fingerprint = {
+        "part": part,
+        "crc32": crc,
+        "size": size,
+        "rows": rows,
+        "cells": cells,
+        "content_hash": chain.hexdigest(),
+    }
+    if row_hashes:
+        fingerprint["row_hashes"] = hashes
+    return fingerprint
+
+
+def fingerprint(path, row_hashes: bool = False, sheets: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Fingerprint every (or the named) worksheet of a workbook"""
+    start = time.perf_counter()
+    with XlsxReader(path) as reader:
+        names = list(sheets) if sheets is not None else reader.sheetnames
+        result = {
+            "file": Path(path).name,
+            "size": os.path.getsize(path),
+            "shared_strings": part_signature(reader, SHARED_STRINGS_PART),
+            "sheets": {name: sheet_fingerprint(reader, name, row_hashes) for name in names},
+        }
+        xml_bytes = sum(reader.archive.getinfo(s["part"]).file_size for s in result["sheets"].values())
+    elapsed = time.perf_counter() - start
+    chain = hashlib.blake2b(digest_size=16)
+    for name, sheet in result["sheets"].items():
+        chain.update(name.encode("utf-8") + bytes.fromhex(sheet["content_hash"]))
+    result["content_hash"] = chain.hexdigest()
+    result["elapsed_ms"] = round(elapsed * 1000, 2)
+    result["xml_mb_per_s"] = round(xml_bytes / 1024 / 1024 / elapsed, 1) if elapsed else None
+    return result
+
+
+def sheet_content_hash(path, sheet: str) -> str:
+    """Content hash of a single sheet"""
+    with XlsxReader(path) as reader:
+        return sheet_fingerprint(reader, sheet)["content_hash"]
+
+
+class SheetDiff:
+    def __init__(self, sheet: str, limit: int = DIFF_LIMIT):
+        self.sheet = sheet
+        self.limit = limit
+        self.status = "identical"
+        self.how = None
+        self.rows_a = None
+        self.rows_b = None
+        self.changed_rows = 0
+        self.rows: List[int] = []
+        self.cells: List[Dict[str, Any]] = []
+
+    def row_changed(self, row_number: int):
+        self.status = "changed"
+        self.changed_rows += 1
+        if len(self.rows) < self.limit:
+            self.rows.append(row_number)
+
+    def cell_changed(self, row_number: int, a: Tuple, b: Tuple):
+        a, b = trimmed(a), trimmed(b)
+        for index in range(max(len(a), len(b))):
+            old = a[index] if index < len(a) else None
+            new = b[index] if index < len(b) else None
+            if old != new and len(self.cells) < self.limit:
+                self.cells.append({"cell": f"{column_letter(index)}{row_number}", "a": old, "b": new})
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = {"status": self.status, "how": self.how, "rows_a": self.rows_a, "rows_b": self.rows_b}
+        if self.status == "changed":
+            result.update(changed_rows=self.changed_rows, rows=self.rows, cells=self.cells)
+        return result
+
+
+def diff_sheets_streaming(reader_a: XlsxReader, reader_b: XlsxReader, sheet: str,
+                          limit: int = DIFF_LIMIT) -> SheetDiff:
+    diff = SheetDiff(sheet, limit)
+    part_a, part_b = reader_a.sheet_paths[sheet], reader_b.sheet_paths[sheet]
+    same_part = part_signature(reader_a, part_a) == part_signature(reader_b, part_b)
+    same_strings = (part_signature(reader_a, SHARED_STRINGS_PART)
+                    == part_signature(reader_b, SHARED_STRINGS_PART))
+    if same_part and same_strings:
+        diff.how = "zip crc"
+        return diff
+
+    diff.how = "streamed"
+    rows_a = rows_b = 0
+    for row_number, (a, b) in enumerate(zip_longest(reader_a.rows(sheet), reader_b.rows(sheet)), 1):
+        rows_a += a is not None
+        rows_b += b is not None
+        a, b = a or (), b or ()
+        if trimmed(a) != trimmed(b):
+            diff.row_changed(row_number)
+            diff.cell_changed(row_number, a, b)
+    diff.rows_a, diff.rows_b = rows_a, rows_b
+    return diff
+
+
+def diff_sheet_hashes(golden: Dict[str, Any], golden_strings: Optional[List[int]],
+                      reader: XlsxReader, sheet: str, limit: int = DIFF_LIMIT) -> SheetDiff:
+    """Compare a live sheet with a saved sheet fingerprint"""
+    diff = SheetDiff(sheet, limit)
+    diff.rows_a = golden["rows"]
+    # JSON turned the saved (crc, size) pairs into lists
+    strings = tuple(golden_strings) if golden_strings else None
+    if (golden["crc32"], golden["size"]) == part_signature(reader, reader.sheet_paths[sheet]) \
+            and strings == part_signature(reader, SHARED_STRINGS_PART):
+        diff.how = "zip crc"
+        diff.rows_b = golden["rows"]
+        return diff
+
+    diff.how = "row hashes" if "row_hashes" in golden else "sheet hash"
+    current = sheet_fingerprint(reader, sheet, row_hashes="row_hashes" in golden)
+    diff.rows_b = current["rows"]
+    if current["content_hash"] == golden["content_hash"]:
+        return diff
+    if "row_hashes" not in golden:
+        diff.status = "changed"
+        return diff
+    for row_number, (a, b) in enumerate(zip_longest(golden["row_hashes"], current["row_hashes"]), 1):
+        if a != b:
+            diff.row_changed(row_number)
+    return diff
+
+
+def diff(a: Union[str, Path, Dict[str, Any]], b: Union[str, Path],
+         sheets: Optional[Iterable[str]] = None, limit: int = DIFF_LIMIT) -> Dict[str, Any]:
+    """Diff workbook (or saved fingerprint) `a` against workbook `b`"""
+    start = time.perf_counter()
+    golden = a if isinstance(a, dict) else None
+    reader_a = None if golden else XlsxReader(a)
+    try:
+        with XlsxReader(b) as reader_b:
+            names_a = list(golden["sheets"]) if golden else reader_a.sheetnames
+            names_b = reader_b.sheetnames
+            wanted = set(sheets) if sheets is not None else None
+            common = [n for n in names_a if n in names_b and (wanted is None or n in wanted)]
+            sheet_diffs = {}
+            for name in common:
+                if golden:
+                    sheet_diffs[name] = diff_sheet_hashes(golden["sheets"][name], golden["shared_strings"],
+                                                          reader_b, name, limit)
+                else:
+                    sheet_diffs[name] = diff_sheets_streaming(reader_a, reader_b, name, limit)
+    finally:
+        if reader_a is not None:
+            reader_a.close()
+
+    removed = [n for n in names_a if n not in names_b and (wanted is None or n in wanted)]
+    added = [n for n in names_b if n not in names_a and (wanted is None or n in wanted)]
+    return {
+        "identical": not removed and not added and all(d.status == "identical" for d in sheet_diffs.values()),
+        "sheets_removed": removed,
+        "sheets_added": added,
+        "sheets": {name: d.as_dict() for name, d in sheet_diffs.items()},
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+def print_diff(result: Dict[str, Any]):
+    for name in result["sheets_removed"]:
+        print(f"✗ {name}: only in the first workbook")
+    for name in result["sheets_added"]:
+        print(f"✗ {name}: only in the second workbook")
+    for name, sheet in result["sheets"].items():
+        if sheet["status"] == "identical":
+            print(f"✓ {name}: identical ({sheet['how']})")
+            continue
+        changed = (f"{sheet['changed_rows']} changed row(s)" if sheet["how"] != "sheet hash"
+                   else "content hash differs")
+        print(f"✗ {name}: {changed} ({sheet['rows_a']} → {sheet['rows_b']} rows, {sheet['how']})")
+        if sheet.get("rows") and not sheet.get("cells"):
+            print(f"    rows: {', '.join(map(str, sheet['rows']))}")
+        for cell in sheet.get("cells", []):
+            print(f"    {cell['cell']}: {cell['a']!r} → {cell['b']!r}")
+    verdict = "✓ Workbooks identical" if result["identical"] else "✗ Workbooks differ"
+    print(f"{verdict} ({result['elapsed_ms']:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint and diff xlsx workbooks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fp = commands.add_parser("fingerprint", help="Hash every sheet of a workbook")
+    fp.add_argument("workbook")
+    fp.add_argument("--row-hashes", action="store_true",
+                    help="Keep per-row hashes so a later diff can point at rows")
+    fp.add_argument("-o", "--output", help="Write the fingerprint JSON here (default: stdout)")
+
+    df = commands.add_parser("diff", help="Compare a workbook or fingerprint JSON with a workbook")
+    df.add_argument("first", help="Workbook or fingerprint JSON (golden file)")
+    df.add_argument("second", help="Workbook")
+    df.add_argument("--sheet", action="append", help="Only compare this sheet (repeatable)")
+    df.add_argument("--limit", type=int, default=DIFF_LIMIT,
+                    help=f"Changed rows/cells listed per sheet (default: {DIFF_LIMIT})")
+    df.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    args = parser.parse_args()
+
+    if args.command == "fingerprint":
+        result = fingerprint(args.workbook, row_hashes=args.row_hashes)
+        text = json.dumps(result, indent=2)
+        if args.output:
+            Path(args.output).write_text(text)
+            print(f"✓ {result['file']}: {len(result['sheets'])} sheet(s), "
+                  f"content {result['content_hash']}, {result['xml_mb_per_s']} MB/s of sheet XML")
+        else:
+            print(text)
+        return 0
+
+    first = args.first
+    if first.endswith(".json"):
+        first = json.loads(Path(first).read_text())
+    result = diff(first, args.second, sheets=args.sheet, limit=args.limit)
+    if args.json:
+        print(json.dumps(result, indent=2, default=str))
+    else:
+        print_diff(result)
+    return 0 if result["identical"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Streaming xlsx Reader for RPA Python tests
+Yields sheet rows straight from the workbook's zip/XML in a single pass
+
+openpyxl's read-only mode sizes every sheet when the workbook is opened;
+sheets without a <dimension> element (everything openpyxl's write-only
+mode produces) are parsed end to end just for that, so a "single pass"
+read costs two. XlsxReader maps sheet names to their XML parts and streams
+one sheet through an expat parser, keeping only the rows not yet yielded:
+
+    with XlsxReader(path) as book:
+        for row in book.rows("Market Data"):
+            ...
+
+Rows are value tuples like openpyxl's iter_rows(values_only=True): shared
+and inline strings are resolved, numbers are int/float, booleans bool and
+formula cells come back as "=<formula>" (as with data_only=False). Missing
+rows are yielded as empty tuples so blank separators stay visible.
+"""
+
+import posixpath
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+from xml.parsers import expat
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+TEXT_TAG = MAIN_NS + "t"
+SHARED_ITEM_TAG = MAIN_NS + "si"
+
+# Element names as the sheet's expat parser reports them ("<namespace> <local>")
+X_ROW, X_CELL, X_VALUE, X_FORMULA, X_TEXT = (
+    f"{MAIN_NS[1:-1]} {local}" for local in ("row", "c", "v", "f", "t"))
+
+
+def column_index(ref: str) -> int:
+    """0-based column of a cell reference: "A1" -> 0, "AB12" -> 27"""
+    index = 0
+    for char in ref:
+        if char.isdigit():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class XlsxReader:
+    def __init__(self, path):
+        self.path = path
+        self.archive = zipfile.ZipFile(path)
+        self.sheet_paths = self._sheet_paths()
+        self._shared_strings: Optional[List[str]] = None
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self.sheet_paths)
+
+    def _sheet_paths(self) -> Dict[str, str]:
+        """Sheet name -> XML part, in workbook order"""
+        rels = {}
+        with self.archive.open("xl/_rels/workbook.xml.rels") as src:
+            for _, element in iterparse(src):
+                if element.tag == PKG_REL_NS + "Relationship":
+                    target = element.get("Target")
+                    if target.startswith("/"):
+                        target = target.lstrip("/")
+                    else:
+                        target = posixpath.normpath(posixpath.join("xl", target))
+                    rels[element.get("Id")] = target
+        paths = {}
+        with self.archive.open("xl/workbook.xml") as src:
+            for _, element in iterparse(src):
+                if element.tag == MAIN_NS + "sheet":
+                    paths[element.get("name")] = rels[element.get(REL_NS + "id")]
+        return paths
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if "xl/sharedStrings.xml" in self.archive.namelist():
+                with self.archive.open("xl/sharedStrings.xml") as src:
+                    for _, element in iterparse(src):
+                        if element.tag == SHARED_ITEM_TAG:
+                            # Rich text keeps its runs in several <t> elements
+                            self._shared_strings.append(
+                                "".join(t.text or "" for t in element.iter(TEXT_TAG)))
+                            element.clear()
+        return self._shared_strings
+
+    def rows(self, sheet: str, chunk_size: int = 1 << 16) -> Iterator[Tuple]:
+        """Value tuples for every row of `sheet`, starting at row 1
+
+        The sheet part is fed to an expat parser in chunks; the callbacks
+        build plain tuples without creating Element objects, and the rows
+        completed by each chunk are yielded before the next one is read.
+        """
+        strings = self.shared_strings
+        finished: List[Tuple] = []
+        text: List[str] = []
+        row: List = []
+        cell = {"ref": None, "kind": "n", "value": None, "formula": None}
+        capture = False
+        expected = 1
+
+        def start(name, attrs):
+            nonlocal capture, row, expected
+            if name == X_CELL:
+                cell["ref"] = attrs.get("r")
+                cell["kind"] = attrs.get("t", "n")
+                cell["value"] = cell["formula"] = None
+            elif name == X_VALUE or name == X_TEXT or name == X_FORMULA:
+                text.clear()
+                capture = True
+            elif name == X_ROW:
+                number = int(attrs.get("r", expected))
+                while expected < number:
+                    finished.append(())
+                    expected += 1
+                row = []
+                expected = number + 1
+
+        def end(name):
+            nonlocal capture
+            if name == X_VALUE:
+                cell["value"] = "".join(text)
+                capture = False
+            elif name == X_TEXT:
+                # Inline rich text keeps its runs in several <t> elements
+                cell["value"] = (cell["value"] or "") + "".join(text)
+                capture = False
+            elif name == X_FORMULA:
+                cell["formula"] = "".join(text)
+                capture = False
+            elif name == X_CELL:
+                ref = cell["ref"]
+                index = column_index(ref) if ref else len(row)
+                if index > len(row):
+                    row.extend([None] * (index - len(row)))
+                row.append(self.convert(cell, strings))
+            elif name == X_ROW:
+                finished.append(tuple(row))
+
+        def characters(data):
+            if capture:
+                text.append(data)
+
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+        with self.archive.open(self.sheet_paths[sheet]) as src:
+            while True:
+                data = src.read(chunk_size)
+                parser.Parse(data, not data)
+                yield from finished
+                finished.clear()
+                if not data:
+                    break
+
+    @staticmethod
+    def convert(cell: Dict, strings: List[str]):
+        """Python value of a parsed cell, as openpyxl returns it with data_only=False"""
+        if cell["formula"] is not None:
+            return "=" + cell["formula"]
+        text = cell["value"]
+        if text is None:
+            return None
+        kind = cell["kind"]
+        if kind == "s":
+            return strings[int(text)]
+        if kind == "n":
+            return _number(text) if text else None
+        if kind == "b":
+            return text == "1"
+        # inlineStr, str (cached formula string), e (error), d (ISO date)
+        return text
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
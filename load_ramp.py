@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Concurrent Bot Load Ramp
+Finds how many BusinessWorkflowTest bots one host can run at once
+
+The ramp runs the workflow with 1, 2, 4, ... N concurrent bots. Each stage
+lasts a fixed time: every bot slot launches workflow runs back to back (each
+in its own work directory) until the stage ends, then the stage drains. A
+sampler thread records host CPU, memory, disk throughput and I/O wait.
+
+For every stage the ramp reports completed workflows per minute, latency
+percentiles and resource usage. The saturation knee is the last stage
+before throughput stops scaling or p95 latency degrades; the limiting
+resource is whichever of CPU, memory or I/O is closest to saturation there.
+
+The bots scrape a local fault_server.FaultServer the ramp starts, so a ramp
+never puts load on a public site. Pass --source-url after -- to point them
+at another server, or --public-source to use the workflow's public default.
+
+Usage:
+    python3 load_ramp.py --max-concurrency 16 --stage-seconds 60
+    python3 load_ramp.py --max-concurrency 8 -- --source-url http://127.0.0.1:8000/
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from sample_buffer import SampleBuffer
+from test_runner import percentile
+
+SCENARIO_DIR = Path(__file__).resolve().parent / "implementations" / "rpa-python"
+WORKFLOW_COMMAND = ["python3", "implementations/rpa-python/business_workflow_test.py"]
+
+# Pages the local source serves (the public quotes site has 10)
+LOCAL_SOURCE_PAGES = 10
+
+# Utilization at which each resource counts as saturated
+SATURATION = {
+    "cpu": 90.0,        # % of all cores
+    "memory": 90.0,     # % of RAM in use
+    "io": 30.0,         # % CPU time waiting on I/O
+}
+
+SAMPLE_INTERVAL_S = 0.5
+HOST_SAMPLE_FIELDS = ("cpu_percent", "memory_percent", "iowait_percent", "disk_mb_per_s")
+
+
+def local_source():
+    """Unstarted FaultServer with no faults, for the bots to scrape"""
+    if str(SCENARIO_DIR) not in sys.path:
+        sys.path.insert(0, str(SCENARIO_DIR))
+    from fault_server import FaultServer
+    return FaultServer(pages=LOCAL_SOURCE_PAGES)
+
+
+def ramp_stages(max_concurrency: int) -> List[int]:
+    """1, 2, 4, ... up to and including max_concurrency"""
+    stages = []
+    level = 1
+    while level < max_concurrency:
+        stages.append(level)
+        level *= 2
+    stages.append(max_concurrency)
+    return stages
+
+
+class HostSampler:
+    """Background thread sampling host-wide CPU, memory and I/O"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.samples = SampleBuffer(HOST_SAMPLE_FIELDS)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_times_percent(interval=None)
+        last_io = psutil.disk_io_counters()
+        last_time = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            io = psutil.disk_io_counters()
+            times = psutil.cpu_times_percent(interval=None)
+            disk_mb_per_s = 0.0
+            if io and last_io:
+                moved = (io.read_bytes - last_io.read_bytes) + (io.write_bytes - last_io.write_bytes)
+                disk_mb_per_s = moved / 1024 / 1024 / (now - last_time)
+            last_io, last_time = io, now
+            self.samples.append(psutil.cpu_percent(interval=None),
+                                psutil.virtual_memory().percent,
+                                getattr(times, "iowait", 0.0),
+                                disk_mb_per_s)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self) -> Dict[str, float]:
+        summary = {}
+        if len(self.samples):
+            for key in HOST_SAMPLE_FIELDS:
+                summary[f"{key}_mean"] = round(self.samples.mean(key), 2)
+                summary[f"{key}_max"] = round(self.samples.max(key), 2)
+        return summary
+
+
+class LoadRamp:
+    """Runs the workflow at increasing concurrency and finds the knee"""
+
+    def __init__(self, command: List[str], stage_seconds: float = 60,
+                 work_root: str = "test-data/load-ramp"):
+        self.command = command
+        self.stage_seconds = stage_seconds
+        self.work_root = Path(work_root)
+        self.stages: List[Dict[str, Any]] = []
+
+    def run_bot(self, slot_dir: Path) -> Dict[str, Any]:
+        """One workflow run in its own work directory"""
+        start = time.perf_counter()
+        completed = subprocess.run(self.command + ["--work-dir", str(slot_dir)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        run = {
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "ok": completed.returncode == 0,
+            "error": None,
+        }
+        if not run["ok"]:
+            lines = completed.stderr.strip().splitlines()
+            run["error"] = lines[-1] if lines else f"Exit code: {completed.returncode}"
+        return run
+
+    def run_stage(self, concurrency: int) -> Dict[str, Any]:
+        print(f"\nStage: {concurrency} concurrent bot(s) for {self.stage_seconds:g}s")
+        runs: List[Dict[str, Any]] = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + self.stage_seconds
+
+        def slot(index: int):
+            slot_dir = self.work_root / f"bot-{concurrency}-{index}"
+            while time.perf_counter() < deadline:
+                run = self.run_bot(slot_dir)
+                with lock:
+                    runs.append(run)
+            shutil.rmtree(slot_dir, ignore_errors=True)
+
+        start = time.perf_counter()
+        with HostSampler() as sampler:
+            threads = [threading.Thread(target=slot, args=(i,)) for i in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed_s = time.perf_counter() - start
+
+        ok = [r["duration_ms"] for r in runs if r["ok"]]
+        stage = {
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed_s, 2),
+            "completed": len(ok),
+            "failed": len(runs) - len(ok),
+            "workflows_per_minute": round(len(ok) / elapsed_s * 60, 2),
+            "p50_ms": round(percentile(ok, 50), 2) if ok else None,
+            "p95_ms": round(percentile(ok, 95), 2) if ok else None,
+            "resources": sampler.summary(),
+        }
+        errors = [r["error"] for r in runs if r["error"]]
+        if errors:
+            stage["last_error"] = errors[-1]
+        resources = stage["resources"]
+        print(f"  {stage['completed']} completed, {stage['failed']} failed, "
+              f"{stage['workflows_per_minute']:.1f}/min, p95 {stage['p95_ms']} ms, "
+              f"CPU {resources.get('cpu_percent_mean', 0):.0f}%, "
+              f"memory {resources.get('memory_percent_max', 0):.0f}%, "
+              f"iowait {resources.get('iowait_percent_mean', 0):.0f}%")
+        return stage
+
+    @staticmethod
+    def limiting_resource(stage: Dict[str, Any]) -> str:
+        """Resource closest to its saturation threshold at this stage"""
+        resources = stage["resources"]
+        if not resources:
+            return "unknown"
+        load = {
+            "cpu": resources["cpu_percent_mean"] / SATURATION["cpu"],
+            "memory": resources["memory_percent_max"] / SATURATION["memory"],
+            "io": resources["iowait_percent_mean"] / SATURATION["io"],
+        }
+        name = max(load, key=load.get)
+        if load[name] < 0.5:
+            # Nothing on this host is busy: bots wait on something external
+            return "none on host (network or remote service)"
+        return name
+
+    @staticmethod
+    def find_knee(stages: List[Dict[str, Any]], min_gain: float = 0.1,
+                  latency_tolerance: float = 1.5) -> Optional[Dict[str, Any]]:
+        """Last stage before throughput stops scaling or p95 degrades
+
+        A stage degrades when it adds less than `min_gain` throughput over
+        the previous stage, or its p95 exceeds the single-bot p95 by more
+        than `latency_tolerance` times.
+        """
+        usable = [s for s in stages if s["p95_ms"] is not None]
+        if not usable:
+            return None
+        baseline_p95 = usable[0]["p95_ms"]
+        knee = usable[0]
+        for previous, stage in zip(usable, usable[1:]):
+            gained = stage["workflows_per_minute"] > previous["workflows_per_minute"] * (1 + min_gain)
+            if not gained or stage["p95_ms"] > baseline_p95 * latency_tolerance or stage["failed"]:
+                break
+            knee = stage
+        return knee
+
+    def run(self, max_concurrency: int, min_gain: float = 0.1,
+            latency_tolerance: float = 1.5) -> Dict[str, Any]:
+        self.work_root.mkdir(parents=True, exist_ok=True)
+        try:
+            for concurrency in ramp_stages(max_concurrency):
+                self.stages.append(self.run_stage(concurrency))
+        finally:
+            shutil.rmtree(self.work_root, ignore_errors=True)
+
+        knee = self.find_knee(self.stages, min_gain, latency_tolerance)
+        beyond = [s for s in self.stages if knee and s["concurrency"] > knee["concurrency"]]
+        report = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "command": self.command,
+            "stage_seconds": self.stage_seconds,
+            "cpu_count": os.cpu_count(),
+            "stages": self.stages,
+            "knee_concurrency": knee["concurrency"] if knee else None,
+            # The resource that ran out is visible at the first stage past the knee
+            "limiting_resource": self.limiting_resource(beyond[0] if beyond else knee) if knee else None,
+        }
+        return report
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"\n{'='*60}")
+    print("LOAD RAMP SUMMARY")
+    print(f"{'='*60}")
+    print(f"{'Bots':<6} {'Done':<6} {'Failed':<8} {'Per min':<9} {'p50 (ms)':<10} "
+          f"{'p95 (ms)':<10} {'CPU %':<7} {'Mem %':<7} {'IOwait %':<9}")
+    for s in report["stages"]:
+        r = s["resources"]
+        print(f"{s['concurrency']:<6} {s['completed']:<6} {s['failed']:<8} "
+              f"{s['workflows_per_minute']:<9.1f} {s['p50_ms'] or '-':<10} {s['p95_ms'] or '-':<10} "
+              f"{r.get('cpu_percent_mean', 0):<7.0f} {r.get('memory_percent_max', 0):<7.0f} "
+              f"{r.get('iowait_percent_mean', 0):<9.1f}")
+    if report["knee_concurrency"] is None:
+        print("\n✗ No stage completed a workflow")
+    else:
+        print(f"\nSaturation knee: {report['knee_concurrency']} concurrent bot(s)")
+        print(f"Limiting resource: {report['limiting_resource']}")
+    print(f"{'='*60}\n")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Ramp concurrent workflow bots to find host saturation")
+    parser.add_argument("--max-concurrency", type=int, default=(os.cpu_count() or 1) * 2,
+                        help="Highest number of concurrent bots (default: 2x CPU count)")
+    parser.add_argument("--stage-seconds", type=float, default=60,
+                        help="How long each stage keeps launching workflows (default: 60)")
+    parser.add_argument("--min-gain", type=float, default=0.1,
+                        help="Throughput gain per stage below which scaling has stopped (default: 0.1)")
+    parser.add_argument("--latency-tolerance", type=float, default=1.5,
+                        help="p95 growth over the single-bot p95 that counts as degraded (default: 1.5)")
+    parser.add_argument("--output-dir", default="results",
+                        help="Directory for the load_ramp_<timestamp>.json report")
+    parser.add_argument("--public-source", action="store_true",
+                        help="Scrape the workflow's public default site instead of a local server")
+    parser.add_argument("workflow_args", nargs=argparse.REMAINDER,
+                        help="Extra business_workflow_test.py arguments after --")
+    args = parser.parse_args(argv)
+
+    extra = args.workflow_args[1:] if args.workflow_args[:1] == ["--"] else args.workflow_args
+    server = None
+    if not args.public_source and not any(a.split("=")[0] == "--source-url" for a in extra):
+        server = local_source()
+        server.start()
+        extra = ["--source-url", server.url + "/"] + extra
+        print(f"✓ Local source server at {server.url}/")
+    try:
+        ramp = LoadRamp(WORKFLOW_COMMAND + extra, stage_seconds=args.stage_seconds)
+        report = ramp.run(args.max_concurrency, args.min_gain, args.latency_tolerance)
+    finally:
+        if server:
+            server.stop()
+    print_report(report)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(exist_ok=True)
+    output_file = output_dir / f"load_ramp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to: {output_file}")
+    return 0 if report["knee_concurrency"] is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Live Metrics Endpoint for the RPA Benchmark Test Runner
+Publishes campaign progress in Prometheus text format while tests run
+
+Start the runner with --metrics-port 9108 and scrape or curl
+http://127.0.0.1:9108/metrics to watch iteration counters, success and
+failure counts, latency histograms per tool/scenario (cumulative plus
+quantiles over a rolling window of recent iterations) and the latest
+resource sampler readings. A stalled campaign shows up as an old
+rpa_bench_last_iteration_timestamp_seconds.
+"""
+
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 15000, 30000, 60000)
+
+ROLLING_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    rank = (len(ordered) - 1) * q
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class MetricsRegistry:
+    """Thread-safe store of benchmark metrics rendered as Prometheus text"""
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.last_iteration_at: Optional[float] = None
+        self.iterations: Dict[Tuple[str, str, str], int] = {}
+        self.buckets: Dict[Tuple[str, str], List[int]] = {}
+        self.duration_sum: Dict[Tuple[str, str], float] = {}
+        self.duration_count: Dict[Tuple[str, str], int] = {}
+        self.recent: Dict[Tuple[str, str], Deque[float]] = {}
+        self.in_progress: Dict[Tuple[str, str], int] = {}
+        self.samples: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def iteration_started(self, tool: str, scenario: str, iteration: int):
+        with self._lock:
+            self.in_progress[(tool, scenario)] = iteration
+
+    def observe_result(self, result: Dict[str, Any]):
+        """Record a finished iteration's status and duration"""
+        key = (result["tool"], result["scenario"])
+        duration = float(result["duration_ms"])
+        with self._lock:
+            status_key = key + (result["status"],)
+            self.iterations[status_key] = self.iterations.get(status_key, 0) + 1
+            self.in_progress.pop(key, None)
+            self.last_iteration_at = time.time()
+            if result["status"] != "success":
+                return
+
+            buckets = self.buckets.setdefault(key, [0] * len(LATENCY_BUCKETS_MS))
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if duration <= bound:
+                    buckets[i] += 1
+            self.duration_sum[key] = self.duration_sum.get(key, 0.0) + duration
+            self.duration_count[key] = self.duration_count.get(key, 0) + 1
+            self.recent.setdefault(key, deque(maxlen=self.window)).append(duration)
+
+    def observe_sample(self, tool: str, scenario: str, sample: Dict[str, float]):
+        """Record the latest resource sampler reading"""
+        with self._lock:
+            self.samples[(tool, scenario)] = dict(sample)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP rpa_bench_campaign_start_timestamp_seconds Campaign start time.",
+                "# TYPE rpa_bench_campaign_start_timestamp_seconds gauge",
+                f"rpa_bench_campaign_start_timestamp_seconds {self.started_at:.3f}",
+                "# HELP rpa_bench_last_iteration_timestamp_seconds Time the last iteration finished.",
+                "# TYPE rpa_bench_last_iteration_timestamp_seconds gauge",
+                f"rpa_bench_last_iteration_timestamp_seconds {self.last_iteration_at or 0:.3f}",
+                "# HELP rpa_bench_iterations_total Finished iterations by status.",
+                "# TYPE rpa_bench_iterations_total counter",
+            ]
+            for (tool, scenario, status), count in sorted(self.iterations.items()):
+                lines.append(f"rpa_bench_iterations_total{_labels(tool=tool, scenario=scenario, status=status)} {count}")
+
+            lines += [
+                "# HELP rpa_bench_iteration_in_progress Iteration number currently running.",
+                "# TYPE rpa_bench_iteration_in_progress gauge",
+            ]
+            for (tool, scenario), iteration in sorted(self.in_progress.items()):
+                lines.append(f"rpa_bench_iteration_in_progress{_labels(tool=tool, scenario=scenario)} {iteration}")
+
+            lines += [
+                "# HELP rpa_bench_iteration_duration_ms Duration of successful iterations.",
+                "# TYPE rpa_bench_iteration_duration_ms histogram",
+            ]
+            for key, buckets in sorted(self.buckets.items()):
+                tool, scenario = key
+                for bound, count in zip(LATENCY_BUCKETS_MS, buckets):
+                    lines.append(f"rpa_bench_iteration_duration_ms_bucket"
+                                 f"{_labels(tool=tool, scenario=scenario, le=bound)} {count}")
+                lines.append(f"rpa_bench_iteration_duration_ms_bucket"
+                             f"{_labels(tool=tool, scenario=scenario, le='+Inf')} {self.duration_count[key]}")
+                lines.append(f"rpa_bench_iteration_duration_ms_sum{_labels(tool=tool, scenario=scenario)} "
+                             f"{self.duration_sum[key]:.3f}")
+                lines.append(f"rpa_bench_iteration_duration_ms_count{_labels(tool=tool, scenario=scenario)} "
+                             f"{self.duration_count[key]}")
+
+            lines += [
+                f"# HELP rpa_bench_iteration_duration_rolling_ms Duration quantiles over the last {self.window} successful iterations.",
+                "# TYPE rpa_bench_iteration_duration_rolling_ms summary",
+            ]
+            for (tool, scenario), recent in sorted(self.recent.items()):
+                ordered = sorted(recent)
+                for q in ROLLING_QUANTILES:
+                    lines.append(f"rpa_bench_iteration_duration_rolling_ms"
+                                 f"{_labels(tool=tool, scenario=scenario, quantile=q)} {_quantile(ordered, q):.3f}")
+                lines.append(f"rpa_bench_iteration_duration_rolling_ms_sum{_labels(tool=tool, scenario=scenario)} "
+                             f"{sum(ordered):.3f}")
+                lines.append(f"rpa_bench_iteration_duration_rolling_ms_count{_labels(tool=tool, scenario=scenario)} "
+                             f"{len(ordered)}")
+
+            for name, help_text in (("memory_mb", "Latest sampled memory of the running test (MB)."),
+                                    ("cpu_percent", "Latest sampled CPU of the running test (%).")):
+                lines += [
+                    f"# HELP rpa_bench_sample_{name} {help_text}",
+                    f"# TYPE rpa_bench_sample_{name} gauge",
+                ]
+                for (tool, scenario), sample in sorted(self.samples.items()):
+                    if name in sample:
+                        lines.append(f"rpa_bench_sample_{name}{_labels(tool=tool, scenario=scenario)} {sample[name]}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves a MetricsRegistry on http://host:port/metrics from a daemon thread"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9108):
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] not in ("/metrics", "/"):
+                    handler.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                handler.send_response(200)
+                handler.send_header("Content-Type", CONTENT_TYPE)
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                # Keep scrapes out of the benchmark console output
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       name="metrics-server", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
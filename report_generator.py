@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Latency Distribution Report Generator
+Renders benchmark results into a static HTML report with matplotlib
+
+For every run the report shows, per scenario, a latency CDF and histogram
+with one series per tool (so bimodal runs and long tails such as network
+stalls stay visible) and stacked bars of the mean per-phase / per-step
+times. The index page adds run-over-run p50/p95 trend lines per scenario.
+
+Builds are incremental: report/manifest.json caches a summary for every
+results file (keyed by size and mtime), so only new or changed runs are
+loaded and plotted again. Trend plots and HTML pages are redrawn from the
+cached summaries.
+
+Usage:
+    python3 report_generator.py                      # results/ -> results/report/
+    python3 report_generator.py --results-dir results --rebuild
+"""
+
+import argparse
+import html
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from test_runner import percentile
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Result keys holding a {phase_or_step: ms} mapping, in order of preference
+PHASE_KEYS = ("phase_times_ms", "step_times_ms")
+
+HISTOGRAM_BINS = 30
+
+
+def pyplot():
+    """matplotlib.pyplot on the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def run_id(results: List[Dict[str, Any]]) -> str:
+    """Identify a run by its first iteration's timestamp
+
+    Older runners wrote a new snapshot file after every iteration; all
+    snapshots of one run share the first timestamp.
+    """
+    stamp = results[0]["timestamp"].rstrip("Z").split(".")[0]
+    return stamp.replace("-", "").replace(":", "")
+
+
+def slug(text: str) -> str:
+    return "".join(c if c.isalnum() else "-" for c in text).strip("-").lower()
+
+
+def phase_times(result: Dict[str, Any]) -> Dict[str, float]:
+    for key in PHASE_KEYS:
+        if result.get(key):
+            return result[key]
+    return {}
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """{scenario: {tool: stats}} for one run"""
+    grouped: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for result in results:
+        grouped.setdefault(result["scenario"], {}).setdefault(result["tool"], []).append(result)
+
+    summary = {}
+    for scenario, by_tool in grouped.items():
+        summary[scenario] = {}
+        for tool, runs in by_tool.items():
+            durations = [r["duration_ms"] for r in runs if r["status"] == "success"]
+            stats = {"iterations": len(runs), "successful": len(durations)}
+            if durations:
+                stats.update({
+                    "mean_ms": round(statistics.mean(durations), 2),
+                    "p50_ms": round(percentile(durations, 50), 2),
+                    "p95_ms": round(percentile(durations, 95), 2),
+                    "p99_ms": round(percentile(durations, 99), 2),
+                    "max_ms": max(durations),
+                })
+            summary[scenario][tool] = stats
+    return summary
+
+
+class ReportGenerator:
+    """Incrementally renders results/benchmark_results_*.json into HTML"""
+
+    def __init__(self, results_dir: str = "results", report_dir: Optional[str] = None):
+        self.results_dir = Path(results_dir)
+        self.report_dir = Path(report_dir) if report_dir else self.results_dir / "report"
+        self.manifest_path = self.report_dir / MANIFEST_FILE
+
+    def load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "files": {}, "runs": {}}
+
+    def build(self, rebuild: bool = False) -> Path:
+        """Update the report and return the path of its index page"""
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+        if rebuild:
+            manifest["files"] = {}
+            manifest["runs"] = {}
+
+        # Fingerprint results files; only load the ones we haven't seen
+        files = manifest["files"]
+        current = {}
+        loaded: Dict[str, List[Dict[str, Any]]] = {}
+        for path in sorted(self.results_dir.glob("benchmark_results_*.json")):
+            st = path.stat()
+            fingerprint = [st.st_size, st.st_mtime_ns]
+            entry = files.get(path.name)
+            if entry is None or entry["fingerprint"] != fingerprint:
+                try:
+                    with open(path) as f:
+                        results = json.load(f)
+                except ValueError:
+                    results = []
+                entry = {"fingerprint": fingerprint, "run_id": run_id(results) if results else None,
+                         "count": len(results)}
+                if results:
+                    loaded[path.name] = results
+            current[path.name] = entry
+        manifest["files"] = current
+
+        # One file per run: the most complete snapshot
+        latest: Dict[str, str] = {}
+        for name, entry in current.items():
+            rid = entry["run_id"]
+            if rid and (rid not in latest or entry["count"] > current[latest[rid]]["count"]):
+                latest[rid] = name
+
+        runs = manifest["runs"]
+        removed = [rid for rid in runs if rid not in latest]
+        for rid in removed:
+            del runs[rid]
+        rendered = 0
+        for rid, name in sorted(latest.items()):
+            source = {"file": name, "fingerprint": current[name]["fingerprint"]}
+            if runs.get(rid, {}).get("source") == source:
+                continue
+            results = loaded.get(name)
+            if results is None:
+                with open(self.results_dir / name) as f:
+                    results = json.load(f)
+            runs[rid] = {"source": source, "summary": summarize(results),
+                         "plots": self.render_run(rid, results)}
+            rendered += 1
+
+        if rendered or removed:
+            self.render_trends(runs)
+        self.write_index(runs)
+        with open(self.manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        print(f"✓ Report updated: {rendered} run(s) rendered, {len(runs) - rendered} cached")
+        return self.report_dir / "index.html"
+
+    def render_run(self, rid: str, results: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Draw CDF, histogram and phase plots for one run; return their paths"""
+        plt = pyplot()
+        run_dir = self.report_dir / "runs" / rid
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        grouped: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for result in results:
+            grouped.setdefault(result["scenario"], {}).setdefault(result["tool"], []).append(result)
+
+        plots = {}
+        for scenario, by_tool in sorted(grouped.items()):
+            durations = {tool: sorted(r["duration_ms"] for r in runs if r["status"] == "success")
+                         for tool, runs in sorted(by_tool.items())}
+            durations = {tool: d for tool, d in durations.items() if d}
+            if not durations:
+                continue
+            name = slug(scenario)
+            files = []
+
+            fig, (ax_cdf, ax_hist) = plt.subplots(1, 2, figsize=(12, 4))
+            for tool, values in durations.items():
+                n = len(values)
+                ax_cdf.step(values, [(i + 1) / n for i in range(n)], where="post", label=tool)
+                ax_hist.hist(values, bins=HISTOGRAM_BINS, alpha=0.6, label=tool)
+            ax_cdf.set(title=f"{scenario}: latency CDF", xlabel="Duration (ms)",
+                       ylabel="Fraction of iterations")
+            ax_cdf.grid(alpha=0.3)
+            ax_hist.set(title=f"{scenario}: latency histogram", xlabel="Duration (ms)",
+                        ylabel="Iterations")
+            ax_cdf.legend()
+            ax_hist.legend()
+            fig.tight_layout()
+            fig.savefig(run_dir / f"{name}-latency.png", dpi=90)
+            plt.close(fig)
+            files.append(f"runs/{rid}/{name}-latency.png")
+
+            # Mean phase (or step) time per tool, stacked
+            phases: Dict[str, Dict[str, float]] = {}
+            for tool, runs in sorted(by_tool.items()):
+                samples = [phase_times(r) for r in runs if r["status"] == "success" and phase_times(r)]
+                if samples:
+                    phases[tool] = {phase: statistics.mean(s.get(phase, 0) for s in samples)
+                                    for phase in samples[0]}
+            if phases:
+                fig, ax = plt.subplots(figsize=(8, 4))
+                tools = list(phases)
+                bottoms = [0.0] * len(tools)
+                names = list(dict.fromkeys(p for values in phases.values() for p in values))
+                for phase in names:
+                    heights = [phases[tool].get(phase, 0) for tool in tools]
+                    ax.bar(tools, heights, bottom=bottoms, label=phase)
+                    bottoms = [b + h for b, h in zip(bottoms, heights)]
+                ax.set(title=f"{scenario}: mean time per phase", ylabel="ms")
+                ax.legend(fontsize="small", bbox_to_anchor=(1.02, 1), loc="upper left")
+                fig.tight_layout()
+                fig.savefig(run_dir / f"{name}-phases.png", dpi=90)
+                plt.close(fig)
+                files.append(f"runs/{rid}/{name}-phases.png")
+
+            plots[scenario] = files
+        return plots
+
+    def render_trends(self, runs: Dict[str, Any]):
+        """Draw p50/p95 per tool across runs for each scenario"""
+        series: Dict[str, Dict[str, List]] = {}
+        for rid in sorted(runs):
+            for scenario, by_tool in runs[rid]["summary"].items():
+                for tool, stats in by_tool.items():
+                    if "p50_ms" in stats:
+                        series.setdefault(scenario, {}).setdefault(tool, []).append(
+                            (rid, stats["p50_ms"], stats["p95_ms"]))
+
+        trend_dir = self.report_dir / "trends"
+        trend_dir.mkdir(exist_ok=True)
+        for stale in trend_dir.glob("*.png"):
+            stale.unlink()
+        plt = None
+        for scenario, by_tool in sorted(series.items()):
+            if max(len(points) for points in by_tool.values()) < 2:
+                continue
+            plt = plt or pyplot()
+            fig, ax = plt.subplots(figsize=(10, 4))
+            for tool, points in sorted(by_tool.items()):
+                labels = [p[0] for p in points]
+                line, = ax.plot(labels, [p[1] for p in points], marker="o", label=f"{tool} p50")
+                ax.plot(labels, [p[2] for p in points], marker="x", linestyle="--",
+                        color=line.get_color(), label=f"{tool} p95")
+            ax.set(title=f"{scenario}: latency trend", ylabel="Duration (ms)")
+            ax.tick_params(axis="x", labelrotation=45, labelsize="small")
+            ax.grid(alpha=0.3)
+            ax.legend(fontsize="small")
+            fig.tight_layout()
+            fig.savefig(trend_dir / f"{slug(scenario)}.png", dpi=90)
+            plt.close(fig)
+
+    def write_index(self, runs: Dict[str, Any]):
+        """Write index.html (trends and run list) and one page per run"""
+        style = ("<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}"
+                 "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+                 "th:first-child,td:first-child{text-align:left}img{max-width:100%}</style>")
+
+        for rid, run in runs.items():
+            parts = [f"<html><head><meta charset='utf-8'><title>Run {rid}</title>{style}</head><body>",
+                     f"<p><a href='../../index.html'>&larr; All runs</a></p><h1>Run {rid}</h1>",
+                     f"<p>Source: {html.escape(run['source']['file'])}</p>"]
+            for scenario, by_tool in sorted(run["summary"].items()):
+                parts.append(f"<h2>{html.escape(scenario)}</h2>")
+                parts.append(self.stats_table(by_tool))
+                for plot in run["plots"].get(scenario, []):
+                    parts.append(f"<p><img src='../../{plot}'></p>")
+            parts.append("</body></html>")
+            (self.report_dir / "runs" / rid / "index.html").write_text("\n".join(parts))
+
+        parts = [f"<html><head><meta charset='utf-8'><title>RPA Benchmark Report</title>{style}</head><body>",
+                 "<h1>RPA Benchmark Report</h1>", "<h2>Trends</h2>"]
+        for trend in sorted(self.report_dir.glob("trends/*.png")):
+            parts.append(f"<p><img src='trends/{trend.name}'></p>")
+        parts.append("<h2>Runs</h2><table><tr><th>Run</th><th>Scenario</th><th>Tool</th>"
+                     "<th>Success</th><th>p50 (ms)</th><th>p95 (ms)</th><th>Max (ms)</th></tr>")
+        for rid in sorted(runs, reverse=True):
+            for scenario, by_tool in sorted(runs[rid]["summary"].items()):
+                for tool, stats in sorted(by_tool.items()):
+                    parts.append(
+                        f"<tr><td><a href='runs/{rid}/index.html'>{rid}</a></td>"
+                        f"<td>{html.escape(scenario)}</td><td>{html.escape(tool)}</td>"
+                        f"<td>{stats['successful']}/{stats['iterations']}</td>"
+                        f"<td>{stats.get('p50_ms', '-')}</td><td>{stats.get('p95_ms', '-')}</td>"
+                        f"<td>{stats.get('max_ms', '-')}</td></tr>")
+        parts.append("</table></body></html>")
+        (self.report_dir / "index.html").write_text("\n".join(parts))
+
+    @staticmethod
+    def stats_table(by_tool: Dict[str, Dict[str, Any]]) -> str:
+        rows = ["<table><tr><th>Tool</th><th>Success</th><th>Mean</th><th>p50</th>"
+                "<th>p95</th><th>p99</th><th>Max</th></tr>"]
+        for tool, stats in sorted(by_tool.items()):
+            rows.append(f"<tr><td>{html.escape(tool)}</td>"
+                        f"<td>{stats['successful']}/{stats['iterations']}</td>"
+                        + "".join(f"<td>{stats.get(key, '-')}</td>"
+                                  for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"))
+                        + "</tr>")
+        rows.append("</table>")
+        return "\n".join(rows)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Render benchmark results as an HTML report")
+    parser.add_argument("--results-dir", default="results",
+                        help="Directory with benchmark_results_*.json (default: results)")
+    parser.add_argument("--report-dir",
+                        help="Output directory (default: <results-dir>/report)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Ignore the manifest and re-render every run")
+    args = parser.parse_args(argv)
+
+    index = ReportGenerator(args.results_dir, args.report_dir).build(rebuild=args.rebuild)
+    print(f"Report: {index}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Resource Limits for the RPA Benchmark Test Runner
+Caps a test iteration's CPU, memory and cores to match production bots
+
+A ResourceBudget describes the container a bot would get in production.
+CappedExecution applies it to one child process: with cgroup v2 it creates
+a transient child cgroup (cpu.max, memory.max, cpuset.cpus) and reads
+throttling and OOM counters back when the iteration ends. Without a
+writable cgroup v2 hierarchy it falls back to RLIMIT_AS for memory and CPU
+affinity for core count; CPU quotas and throttling time are then reported
+as not enforced.
+"""
+
+import os
+import signal
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Parent cgroup for transient benchmark cgroups; must be delegated to us
+CGROUP_PARENT_ENV = "RPA_BENCH_CGROUP_PARENT"
+
+CPU_PERIOD_US = 100000
+
+
+class ResourceBudget:
+    """CPU quota (in CPUs), memory limit (MB) and core count for one iteration"""
+
+    def __init__(self, cpus: Optional[float] = None, memory_mb: Optional[int] = None,
+                 cores: Optional[int] = None):
+        self.cpus = cpus
+        self.memory_mb = memory_mb
+        self.cores = cores
+
+    @classmethod
+    def parse(cls, spec: str) -> "ResourceBudget":
+        """Parse "cpus=0.5,memory=256,cores=1" (any subset of the keys)"""
+        values: Dict[str, str] = {}
+        for part in spec.split(","):
+            if not part.strip():
+                continue
+            key, _, value = part.partition("=")
+            values[key.strip()] = value.strip()
+        unknown = set(values) - {"cpus", "memory", "cores"}
+        if unknown:
+            raise ValueError(f"Unknown budget keys: {', '.join(sorted(unknown))}")
+        return cls(
+            cpus=float(values["cpus"]) if "cpus" in values else None,
+            memory_mb=int(values["memory"]) if "memory" in values else None,
+            cores=int(values["cores"]) if "cores" in values else None
+        )
+
+    def label(self) -> str:
+        parts = []
+        if self.cpus is not None:
+            parts.append(f"{self.cpus:g}cpu")
+        if self.memory_mb is not None:
+            parts.append(f"{self.memory_mb}MB")
+        if self.cores is not None:
+            parts.append(f"{self.cores}core")
+        return "/".join(parts) or "unlimited"
+
+    def cost(self):
+        """Sort key: smaller budgets are cheaper (unset limits sort last)"""
+        unlimited = float("inf")
+        return (
+            self.cpus if self.cpus is not None else unlimited,
+            self.memory_mb if self.memory_mb is not None else unlimited,
+            self.cores if self.cores is not None else unlimited
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"cpus": self.cpus, "memory_mb": self.memory_mb, "cores": self.cores}
+
+
+def cgroup_v2_parent() -> Optional[Path]:
+    """Writable cgroup v2 directory to create benchmark cgroups under, if any"""
+    override = os.environ.get(CGROUP_PARENT_ENV)
+    if override:
+        parent = Path(override)
+    else:
+        if not (CGROUP_ROOT / "cgroup.controllers").exists():
+            return None
+        try:
+            own = Path("/proc/self/cgroup").read_text().splitlines()
+        except OSError:
+            return None
+        unified = [line[3:] for line in own if line.startswith("0::")]
+        if not unified:
+            return None
+        parent = CGROUP_ROOT / unified[0].lstrip("/")
+    if not (parent / "cgroup.subtree_control").exists() or not os.access(parent, os.W_OK):
+        return None
+    return parent
+
+
+def _allowed_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _read_flat_keyed(path: Path) -> Dict[str, int]:
+    """Parse a cgroup "key value" file such as cpu.stat or memory.events"""
+    values = {}
+    try:
+        for line in path.read_text().splitlines():
+            key, _, value = line.partition(" ")
+            if value.strip().isdigit():
+                values[key] = int(value)
+    except OSError:
+        pass
+    return values
+
+
+class CappedExecution:
+    """
+    Applies a ResourceBudget to one child process
+
+    Usage:
+        with CappedExecution(budget) as cap:
+            process = subprocess.Popen(cmd, preexec_fn=cap.preexec_fn)
+            process.wait()
+            stats = cap.stats(process.returncode)
+
+    setup()/cleanup() do the same as entering/leaving the context.
+    """
+
+    _counter = 0
+
+    def __init__(self, budget: ResourceBudget):
+        self.budget = budget
+        self.cgroup: Optional[Path] = None
+        self.mechanism = "none"
+        self.notes: List[str] = []
+
+    def __enter__(self) -> "CappedExecution":
+        return self.setup()
+
+    def __exit__(self, *exc_info):
+        self.cleanup()
+        return False
+
+    def setup(self) -> "CappedExecution":
+        parent = cgroup_v2_parent()
+        if parent is not None:
+            try:
+                self.cgroup = self._create_cgroup(parent)
+                self.mechanism = "cgroup2"
+            except OSError as e:
+                self.notes.append(f"cgroup v2 unavailable ({e}), using rlimits")
+                self._remove_cgroup()
+        if self.cgroup is None:
+            self.mechanism = "rlimit"
+            if self.budget.cpus is not None:
+                self.notes.append("CPU quota not enforced without cgroup v2")
+        return self
+
+    def cleanup(self):
+        self._remove_cgroup()
+
+    def _create_cgroup(self, parent: Path) -> Path:
+        controllers = ["cpu", "memory"] + (["cpuset"] if self.budget.cores is not None else [])
+        enabled = (parent / "cgroup.subtree_control").read_text().split()
+        missing = [c for c in controllers if c not in enabled]
+        if missing:
+            (parent / "cgroup.subtree_control").write_text(" ".join(f"+{c}" for c in missing))
+
+        CappedExecution._counter += 1
+        cgroup = parent / f"rpa-bench-{os.getpid()}-{CappedExecution._counter}"
+        cgroup.mkdir()
+        self.cgroup = cgroup
+
+        if self.budget.cpus is not None:
+            quota = max(int(self.budget.cpus * CPU_PERIOD_US), 1000)
+            (cgroup / "cpu.max").write_text(f"{quota} {CPU_PERIOD_US}")
+        if self.budget.memory_mb is not None:
+            (cgroup / "memory.max").write_text(str(self.budget.memory_mb * 1024 * 1024))
+            swap_max = cgroup / "memory.swap.max"
+            if swap_max.exists():
+                swap_max.write_text("0")
+        if self.budget.cores is not None:
+            cpus = _allowed_cpus()[:self.budget.cores]
+            (cgroup / "cpuset.cpus").write_text(",".join(str(c) for c in cpus))
+        return cgroup
+
+    def _remove_cgroup(self):
+        if self.cgroup is not None:
+            try:
+                self.cgroup.rmdir()
+            except OSError:
+                pass
+
+    def preexec_fn(self):
+        """Runs in the child between fork and exec to apply the budget"""
+        if self.cgroup is not None:
+            with open(self.cgroup / "cgroup.procs", "w") as f:
+                f.write(str(os.getpid()))
+            return
+
+        import resource
+        if self.budget.memory_mb is not None:
+            limit = self.budget.memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        if self.budget.cores is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, _allowed_cpus()[:self.budget.cores])
+
+    def stats(self, returncode: Optional[int] = None, stderr: str = "") -> Dict[str, Any]:
+        """Throttling and OOM counters for the finished iteration"""
+        stats: Dict[str, Any] = {
+            "mechanism": self.mechanism,
+            "cpu_quota_enforced": self.mechanism == "cgroup2" or self.budget.cpus is None,
+            "throttled_ms": None,
+            "throttled_periods": None,
+            "oom_events": 0,
+            "oom_killed": False,
+            "notes": list(self.notes)
+        }
+
+        if self.cgroup is not None:
+            cpu = _read_flat_keyed(self.cgroup / "cpu.stat")
+            if "throttled_usec" in cpu:
+                stats["throttled_ms"] = round(cpu["throttled_usec"] / 1000, 2)
+                stats["throttled_periods"] = cpu.get("nr_throttled", 0)
+            memory = _read_flat_keyed(self.cgroup / "memory.events")
+            stats["oom_events"] = memory.get("oom", 0)
+            stats["oom_killed"] = memory.get("oom_kill", 0) > 0
+            peak = self.cgroup / "memory.peak"
+            if peak.exists():
+                stats["memory_peak_mb"] = round(int(peak.read_text()) / 1024 / 1024, 2)
+        elif self.budget.memory_mb is not None:
+            # Under RLIMIT_AS allocation failures surface as MemoryError or a
+            # SIGKILL/SIGSEGV rather than a cgroup OOM event
+            if "MemoryError" in stderr or returncode in (-signal.SIGKILL, -signal.SIGSEGV):
+                stats["oom_events"] = 1
+                stats["oom_killed"] = returncode == -signal.SIGKILL
+        return stats
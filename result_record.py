@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Iteration Result Records for the RPA Benchmark Test Runner
+One slotted record per iteration instead of a wide dict
+
+The fields every iteration has live in __slots__; tool and scenario names
+are interned so thousands of records share one string each. Fields only
+some iterations have (startup_profile, resource_caps, the child report's
+phase times, ...) go in `extra`. The record supports the dict operations
+the runner, metrics and summaries use (record["duration_ms"], get, in,
+setdefault, update, pop), and to_dict() gives the JSON form written to
+the results file and checkpoint, with the same keys as before.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Slot fields left out of to_dict() while they are None (e.g. stdout/stderr
+# after they moved to the blob store)
+OPTIONAL_FIELDS = ("stdout", "stderr", "exit_code", "seed")
+
+_MISSING = object()
+
+
+@dataclass
+class IterationResult:
+    __slots__ = ("tool", "scenario", "iteration", "timestamp", "duration_ms", "memory_mb",
+                 "cpu_percent", "status", "errors", "stdout", "stderr", "exit_code", "seed",
+                 "extra")
+
+    tool: str
+    scenario: str
+    iteration: int
+    timestamp: str
+    duration_ms: float
+    memory_mb: float
+    cpu_percent: float
+    status: str
+    errors: List[str]
+    stdout: Optional[str]
+    stderr: Optional[str]
+    exit_code: Optional[int]
+    seed: Optional[int]
+    extra: Dict[str, Any]
+
+    @classmethod
+    def new(cls, tool: str, scenario: str, iteration: int) -> "IterationResult":
+        """Empty (failed) record for an iteration about to run"""
+        return cls(sys.intern(tool), sys.intern(scenario), iteration,
+                   datetime.utcnow().isoformat() + "Z", 0, 0, 0, "failed", [], "", "",
+                   None, None, {})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IterationResult":
+        """Rebuild a record from its to_dict() form (results file, checkpoint)"""
+        data = dict(data)
+        record = cls.new(data.pop("tool"), data.pop("scenario"), data.pop("iteration"))
+        record.stdout = record.stderr = None
+        record.update(data)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {}
+        for name in self.__slots__[:-1]:
+            value = getattr(self, name)
+            if value is not None or name not in OPTIONAL_FIELDS:
+                data[name] = value
+        data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self.__slots__ and key != "extra":
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__slots__ and key != "extra":
+            value = getattr(self, key)
+            return default if value is None and key in OPTIONAL_FIELDS else value
+        return self.extra.get(key, default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, values: Dict[str, Any]):
+        for key, value in values.items():
+            self[key] = value
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        if key in OPTIONAL_FIELDS:
+            value = self.get(key, default)
+            setattr(self, key, None)
+            return value
+        if key in self.__slots__:
+            raise KeyError(f"{key} is a required field")
+        return self.extra.pop(key, default)
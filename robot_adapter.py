@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Robot Framework Adapter for the RPA Benchmark Test Runner
+Runs .robot suites in-process inside a warm worker
+
+Spawning the `robot` CLI for every iteration pays interpreter startup,
+Robot Framework and library imports, and output.xml serialization each
+time. RobotWorker keeps one worker process alive for a whole scenario and
+calls robot.run() there with output, log and report disabled. Keyword
+durations come from a listener instead of parsed output files, so
+Robot Framework steps can be compared with rpa-python step timings.
+
+Library state persists inside the worker between iterations, exactly as
+it would inside a long-running bot; suites should clean up after
+themselves in teardown.
+"""
+
+import io
+import multiprocessing
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+
+class KeywordTimingListener:
+    """Listener (API v2) that records the duration of every keyword"""
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self.keywords: List[Dict[str, Any]] = []
+        self._depth = 0
+
+    def start_keyword(self, name, attrs):
+        self._depth += 1
+
+    def end_keyword(self, name, attrs):
+        self.keywords.append({
+            "keyword": attrs.get("kwname", name),
+            "library": attrs.get("libname", ""),
+            "type": attrs.get("type", "KEYWORD"),
+            "depth": self._depth,
+            "duration_ms": attrs.get("elapsedtime", 0),
+            "status": attrs.get("status", "")
+        })
+        self._depth -= 1
+
+    def step_times(self) -> Dict[str, float]:
+        """Total duration per top-level keyword, i.e. per task step"""
+        steps: Dict[str, float] = {}
+        for keyword in self.keywords:
+            if keyword["depth"] == 1:
+                steps[keyword["keyword"]] = steps.get(keyword["keyword"], 0) + keyword["duration_ms"]
+        return steps
+
+
+def _worker_main(conn):
+    """Worker loop: import Robot Framework once, then run suites on request"""
+    import robot
+
+    conn.send({"ready": True})
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+
+        suite, options = request
+        listener = KeywordTimingListener()
+        console = io.StringIO()
+        start = time.perf_counter()
+        error = None
+        try:
+            return_code = robot.run(
+                suite,
+                output="NONE",
+                log="NONE",
+                report="NONE",
+                listener=listener,
+                stdout=console,
+                stderr=console,
+                **options
+            )
+        except Exception:
+            return_code = 255
+            error = traceback.format_exc()
+
+        conn.send({
+            "return_code": return_code,
+            "run_ms": round((time.perf_counter() - start) * 1000, 2),
+            "keywords": listener.keywords,
+            "step_times_ms": listener.step_times(),
+            "console": console.getvalue(),
+            "error": error
+        })
+
+
+class RobotWorker:
+    """A warm worker process executing Robot Framework suites via robot.run()"""
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        # Block until Robot Framework is imported so the first timed
+        # iteration does not pay for the warm-up
+        self.wait()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def submit(self, suite: str, **options):
+        """Start running a suite; collect the outcome with wait()"""
+        self._conn.send((suite, options))
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return the finished run's outcome, or None if still running after timeout"""
+        if not self._conn.poll(timeout):
+            if not self.process.is_alive():
+                raise RuntimeError(f"Robot worker exited with code {self.process.exitcode}")
+            return None
+        try:
+            return self._conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Robot worker exited with code {self.process.exitcode}")
+
+    def run(self, suite: str, **options) -> Dict[str, Any]:
+        """Run a suite and block until it finishes"""
+        self.submit(suite, **options)
+        return self.wait()
+
+    def stop(self):
+        if self.process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.terminate()
+        self._conn.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Resource Sample Buffers for the RPA Benchmark Test Runner
+Fixed-size float storage for sampler readings, with running statistics
+
+The runner samples a test's memory and CPU every SAMPLE_PERIOD_S. Keeping
+a dict per reading in a list made every iteration's footprint grow with
+its duration; SampleBuffer instead preallocates one interleaved
+array('d') ring of `capacity` rows and keeps count, sum, min and max per
+field as samples arrive, so means and peaks cover every sample even after
+the ring has wrapped.
+
+With `spill` (a binary file), each full ring is written out with
+array.tofile() before it is reused, and close() writes the remainder, so
+the complete time series is persisted while memory stays at one ring.
+Series files are raw native-endian float64 rows of `fields`:
+
+    series = load_series("results/samples/rpa-python_excel-automation_1.f64",
+                         ["elapsed_s", "memory_mb", "cpu_percent"])
+"""
+
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence, Union
+
+# Rows kept in memory per buffer (about 13 minutes at the runner's 0.2 s period)
+DEFAULT_CAPACITY = 4096
+
+
+class SampleBuffer:
+    def __init__(self, fields: Sequence[str], capacity: int = DEFAULT_CAPACITY,
+                 spill: Optional[BinaryIO] = None):
+        self.fields = list(fields)
+        self.width = len(self.fields)
+        self.capacity = capacity
+        self.spill = spill
+        self.data = array("d", bytes(8 * capacity * self.width))
+        self.position = 0   # next row to write in the ring
+        self.count = 0      # samples seen, including overwritten and spilled ones
+        self.sums = array("d", bytes(8 * self.width))
+        self.minimums = array("d", [float("inf")] * self.width)
+        self.maximums = array("d", [float("-inf")] * self.width)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, *values: float):
+        """Add one row, one value per field in `fields` order"""
+        if self.position == self.capacity:
+            if self.spill is not None:
+                self.data.tofile(self.spill)
+            self.position = 0
+        offset = self.position * self.width
+        for i, value in enumerate(values):
+            self.data[offset + i] = value
+            self.sums[i] += value
+            if value < self.minimums[i]:
+                self.minimums[i] = value
+            if value > self.maximums[i]:
+                self.maximums[i] = value
+        self.position += 1
+        self.count += 1
+
+    def mean(self, field: str) -> float:
+        return self.sums[self.fields.index(field)] / self.count if self.count else 0.0
+
+    def min(self, field: str) -> float:
+        return self.minimums[self.fields.index(field)] if self.count else 0.0
+
+    def max(self, field: str) -> float:
+        return self.maximums[self.fields.index(field)] if self.count else 0.0
+
+    def recent(self, field: str) -> List[float]:
+        """The samples of `field` still in the ring, oldest first"""
+        index = self.fields.index(field)
+        rows = min(self.count, self.capacity)
+        if self.count > self.capacity and self.spill is None:
+            # Wrapped: the oldest row is the one about to be overwritten
+            order = list(range(self.position, self.capacity)) + list(range(self.position))
+        else:
+            order = range(self.position if self.spill is not None else rows)
+        return [self.data[row * self.width + index] for row in order]
+
+    def close(self):
+        """Write the rows not yet spilled; the spill file stays open"""
+        if self.spill is not None and self.position:
+            self.spill.write(memoryview(self.data)[:self.position * self.width].tobytes())
+            self.position = 0
+
+
+def load_series(path: Union[str, Path], fields: Sequence[str]) -> Dict[str, array]:
+    """Read a spilled series back into one array('d') per field"""
+    data = array("d")
+    data.frombytes(Path(path).read_bytes())
+    width = len(fields)
+    return {field: data[i::width] for i, field in enumerate(fields)}
@@ -4,21 +4,103 @@ RPA Benchmark Test Runner
 Executes each test scenario 10 times and collects metrics
 """
 
+import argparse
 import json
+import os
+import platform
+import re
+import shutil
+import tempfile
 import time
 import psutil
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import statistics
 
+from blob_store import BlobStore
+from checkpoint import CampaignCheckpoint, CheckpointMismatch, config_hash
+from metrics_server import MetricsRegistry, MetricsServer
+from resource_limits import CappedExecution, ResourceBudget
+from result_record import IterationResult
+from sample_buffer import SampleBuffer
+
+# Matches one line of `python -X importtime` output:
+# "import time:       229 |     126959 | openpyxl"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)\s*$")
+
+# Resource sampling period while a test runs (psutil cpu interval + sleep)
+SAMPLE_PERIOD_S = 0.2
+
+# Columns of the per-iteration resource sample buffers (and series files)
+SAMPLE_FIELDS = ("elapsed_s", "memory_mb", "cpu_percent")
+
+# Null scenarios used to calibrate harness overhead: runs each, and the
+# base idle time (longer than one sampling period)
+CALIBRATION_RUNS = 10
+CALIBRATION_IDLE_S = 0.3
+
+
+def is_python_command(command: List[str]) -> bool:
+    """Return True if the command launches a Python interpreter directly"""
+    return Path(command[0]).name.startswith("python")
+
+
+def parse_importtime(stderr: str):
+    """Split `-X importtime` lines out of stderr.
+
+    Returns (top_level_imports, remaining_stderr) where top_level_imports is a
+    list of (module, cumulative_us) for imports made directly by the
+    interpreter or the test script (nested imports are already included in
+    their parent's cumulative time).
+    """
+    top_level = []
+    remaining = []
+    for line in stderr.splitlines(keepends=True):
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            if len(match.group(3)) == 1:
+                top_level.append((match.group(4), int(match.group(2))))
+        elif not line.startswith("import time: self [us]"):
+            remaining.append(line)
+    return top_level, "".join(remaining)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linearly interpolated percentile (pct in 0-100) of a non-empty list"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
 class BenchmarkRunner:
-    def __init__(self, output_dir: str = "results"):
+    def __init__(self, output_dir: str = "results", import_profile: bool = False,
+                 memory_profile: bool = False,
+                 resource_budget: Optional[ResourceBudget] = None,
+                 metrics: Optional[MetricsRegistry] = None,
+                 blob_store: Optional[BlobStore] = None,
+                 calibrate: bool = True, sample_series: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.results: List[Dict[str, Any]] = []
+        self.results: List[IterationResult] = []
+        self.import_profile = import_profile
+        self.memory_profile = memory_profile
+        self.resource_budget = resource_budget
+        self.metrics = metrics
+        self.blob_store = blob_store
+        self.checkpoint: Optional[CampaignCheckpoint] = None
+        self.results_file = self.output_dir / f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        self.calibrate = calibrate
+        self.sample_series = sample_series
+        self.calibration: Optional[Dict[str, Any]] = None
+        self._interpreter_baselines: Dict[str, Dict[str, Any]] = {}
+        self._robot_worker = None
         
     def measure_resources(self, process=None):
         """Measure current resource usage"""
@@ -38,102 +120,525 @@ class BenchmarkRunner:
             "memory_mb": round(memory_mb, 2),
             "cpu_percent": round(cpu_percent, 2)
         }
+
+    def interpreter_baseline(self, python: str, runs: int = 3) -> Dict[str, Any]:
+        """Measure bare interpreter startup for `python` (cached per executable).
+
+        Runs `python -X importtime -c pass` a few times and records the median
+        wall time plus the set of modules the interpreter imports on its own,
+        so scenario imports can be told apart from startup imports.
+        """
+        if python in self._interpreter_baselines:
+            return self._interpreter_baselines[python]
+
+        durations = []
+        startup_modules = set()
+        for _ in range(runs):
+            start = time.perf_counter()
+            completed = subprocess.run(
+                [python, "-X", "importtime", "-c", "pass"],
+                capture_output=True,
+                text=True
+            )
+            durations.append((time.perf_counter() - start) * 1000)
+            top_level, _ = parse_importtime(completed.stderr)
+            startup_modules.update(name for name, _ in top_level)
+
+        baseline = {
+            "startup_ms": round(statistics.median(durations), 2),
+            "modules": startup_modules
+        }
+        self._interpreter_baselines[python] = baseline
+        return baseline
+
+    def startup_breakdown(self, python: str, stderr: str, duration_ms: float):
+        """Split an iteration's wall time into startup, import and work time.
+
+        Returns (profile, stderr_without_importtime_lines).
+        """
+        baseline = self.interpreter_baseline(python)
+        top_level, remaining = parse_importtime(stderr)
+
+        scenario_imports = [(name, us) for name, us in top_level
+                            if name not in baseline["modules"]]
+        import_ms = sum(us for _, us in scenario_imports) / 1000
+        startup_ms = baseline["startup_ms"]
+        work_ms = max(duration_ms - startup_ms - import_ms, 0)
+
+        top_imports = sorted(scenario_imports, key=lambda item: item[1], reverse=True)[:10]
+        profile = {
+            "interpreter_startup_ms": round(startup_ms, 2),
+            "import_ms": round(import_ms, 2),
+            "work_ms": round(work_ms, 2),
+            "top_imports": [
+                {"module": name, "cumulative_ms": round(us / 1000, 2)}
+                for name, us in top_imports
+            ]
+        }
+        return profile, remaining
+
+    def child_environment(self, report_path: str, seed: Optional[int] = None,
+                          artifact_dir: Optional[str] = None) -> Dict[str, str]:
+        """Environment for a test process.
+
+        RPA_BENCH_REPORT tells the test where to write its structured report
+        (see implementations/rpa-python/benchmark_report.py). With a seed,
+        RPA_BENCH_SEED and PYTHONHASHSEED make the iteration repeatable.
+        RPA_BENCH_ARTIFACT_DIR collects files for the blob store.
+        """
+        env = dict(os.environ)
+        env["RPA_BENCH_REPORT"] = report_path
+        if artifact_dir:
+            env["RPA_BENCH_ARTIFACT_DIR"] = artifact_dir
+        if seed is not None:
+            env["RPA_BENCH_SEED"] = str(seed)
+            env["PYTHONHASHSEED"] = str(seed)
+        if self.memory_profile:
+            env["RPA_BENCH_TRACEMALLOC"] = "1"
+        return env
+
+    def load_child_report(self, report_path: str) -> Dict[str, Any]:
+        """Read and remove the report a test process wrote, if any"""
+        path = Path(report_path)
+        try:
+            if path.stat().st_size == 0:
+                return {}
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+        finally:
+            path.unlink(missing_ok=True)
+    
+    def store_outputs(self, result: IterationResult, artifact_dir: Optional[str] = None):
+        """Move stdout/stderr and captured artifacts into the blob store
+        
+        The result keeps only digests, under "blobs" and "artifacts".
+        """
+        if self.blob_store is None:
+            return
+        blobs = {}
+        for stream in ("stdout", "stderr"):
+            text = result.pop(stream, "")
+            if text:
+                blobs[stream] = self.blob_store.put(text)
+        result["blobs"] = blobs
+        
+        if artifact_dir:
+            artifacts = {}
+            for path in sorted(Path(artifact_dir).iterdir()):
+                if path.is_file():
+                    artifacts[path.name] = self.blob_store.put_file(path)
+            shutil.rmtree(artifact_dir, ignore_errors=True)
+            if artifacts:
+                result["artifacts"] = artifacts
+    
+    def new_result(self, tool: str, scenario: str, iteration: int) -> IterationResult:
+        """Empty result record for one iteration"""
+        return IterationResult.new(tool, scenario, iteration)
+    
+    def sample_buffer(self, result: IterationResult) -> SampleBuffer:
+        """Resource sample buffer for one iteration
+        
+        With --sample-series the full series is spilled to
+        <output-dir>/samples/<tool>_<scenario>_<iteration>.f64 and the file
+        is noted in the result; otherwise only the running statistics (and
+        the most recent samples) are kept.
+        """
+        spill = None
+        if self.sample_series:
+            name = re.sub(r"[^\w.@=,-]", "_", f"{result.tool}_{result.scenario}_{result.iteration}")
+            path = self.output_dir / "samples" / f"{name}.f64"
+            path.parent.mkdir(exist_ok=True)
+            spill = open(path, "wb")
+            result["resource_series"] = {"file": str(path.relative_to(self.output_dir)),
+                                         "fields": list(SAMPLE_FIELDS), "dtype": "float64"}
+        return SampleBuffer(SAMPLE_FIELDS, spill=spill)
+    
+    def finish_samples(self, result: IterationResult, samples: SampleBuffer):
+        """Average the samples into the result and close the series file"""
+        result["memory_mb"] = round(samples.mean("memory_mb"), 2)
+        result["cpu_percent"] = round(samples.mean("cpu_percent"), 2)
+        if samples.spill is not None:
+            samples.close()
+            samples.spill.close()
+            result["resource_series"]["samples"] = len(samples)
     
     def run_test(self, tool: str, scenario: str, test_command: List[str], 
-                 iteration: int) -> Dict[str, Any]:
+                 iteration: int, seed: Optional[int] = None) -> IterationResult:
         """Run a single test iteration"""
         print(f"Running {tool} - {scenario} - Iteration {iteration}")
         
-        result = {
-            "tool": tool,
-            "scenario": scenario,
-            "iteration": iteration,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "duration_ms": 0,
-            "memory_mb": 0,
-            "cpu_percent": 0,
-            "status": "failed",
-            "errors": [],
-            "stdout": "",
-            "stderr": ""
-        }
+        result = self.new_result(tool, scenario, iteration)
+        if seed is not None:
+            result["seed"] = seed
+        
+        profile_imports = self.import_profile and is_python_command(test_command)
+        if profile_imports:
+            test_command = [test_command[0], "-X", "importtime", *test_command[1:]]
+        
+        report_fd, report_path = tempfile.mkstemp(prefix="rpa_bench_", suffix=".json")
+        os.close(report_fd)
+        artifact_dir = (tempfile.mkdtemp(prefix="rpa_bench_artifacts_")
+                        if self.blob_store else None)
+        
+        cap = None
+        if self.resource_budget is not None:
+            cap = CappedExecution(self.resource_budget).setup()
+            result["resource_budget"] = self.resource_budget.to_dict()
         
-        start_time = time.time()
         start_resources = self.measure_resources()
+        samples = self.sample_buffer(result)
+        start_time = time.perf_counter()
         
         try:
             process = subprocess.Popen(
                 test_command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                env=self.child_environment(report_path, seed, artifact_dir),
+                preexec_fn=cap.preexec_fn if cap else None
             )
             
             # Monitor resources during execution
-            resource_samples = []
             while process.poll() is None:
-                resource_samples.append(self.measure_resources(process))
+                sample = self.measure_resources(process)
+                samples.append(time.perf_counter() - start_time,
+                               sample["memory_mb"], sample["cpu_percent"])
+                if self.metrics:
+                    self.metrics.observe_sample(tool, scenario, sample)
                 time.sleep(0.1)
             
             stdout, stderr = process.communicate()
             
-            end_time = time.time()
-            duration_ms = int((end_time - start_time) * 1000)
-            
-            # Calculate average resources
-            if resource_samples:
-                avg_memory = statistics.mean([r["memory_mb"] for r in resource_samples])
-                avg_cpu = statistics.mean([r["cpu_percent"] for r in resource_samples])
-            else:
-                avg_memory = 0
-                avg_cpu = 0
+            end_time = time.perf_counter()
+            duration_ms = round((end_time - start_time) * 1000, 2)
             
             result.update({
                 "duration_ms": duration_ms,
-                "memory_mb": round(avg_memory, 2),
-                "cpu_percent": round(avg_cpu, 2),
                 "status": "success" if process.returncode == 0 else "failed",
                 "stdout": stdout,
                 "stderr": stderr,
                 "exit_code": process.returncode
             })
             
+            if profile_imports:
+                profile, result["stderr"] = self.startup_breakdown(
+                    test_command[0], stderr, duration_ms)
+                result["startup_profile"] = profile
+            
+            if cap:
+                result["resource_caps"] = cap.stats(process.returncode, stderr)
+                if result["resource_caps"]["oom_events"]:
+                    result["errors"].append("Out of memory under resource budget")
+            
             if process.returncode != 0:
                 result["errors"].append(f"Exit code: {process.returncode}")
                 
         except Exception as e:
-            end_time = time.time()
-            result["duration_ms"] = int((end_time - start_time) * 1000)
+            end_time = time.perf_counter()
+            result["duration_ms"] = round((end_time - start_time) * 1000, 2)
+            result["errors"].append(str(e))
+            result["status"] = "error"
+        finally:
+            self.finish_samples(result, samples)
+            if cap:
+                cap.cleanup()
+        
+        # Structured metrics reported by the test itself (phase times,
+        # memory profile, ...) never override the runner's own fields
+        for key, value in self.load_child_report(report_path).items():
+            result.setdefault(key, value)
+        
+        self.store_outputs(result, artifact_dir)
+        return result
+    
+    def robot_worker(self):
+        """Return the warm Robot Framework worker, starting it on first use"""
+        if self._robot_worker is None or not self._robot_worker.is_alive():
+            from robot_adapter import RobotWorker
+            self._robot_worker = RobotWorker()
+        return self._robot_worker
+    
+    def run_robot_test(self, tool: str, scenario: str, suite: str,
+                       iteration: int) -> IterationResult:
+        """Run a single iteration of a Robot Framework suite in the warm worker"""
+        print(f"Running {tool} - {scenario} - Iteration {iteration}")
+        
+        result = self.new_result(tool, scenario, iteration)
+        samples = self.sample_buffer(result)
+        start_time = time.perf_counter()
+        
+        try:
+            worker = self.robot_worker()
+            worker.submit(suite)
+            
+            # Monitor the worker while the suite runs
+            outcome = None
+            while outcome is None:
+                sample = self.measure_resources(worker)
+                samples.append(time.perf_counter() - start_time,
+                               sample["memory_mb"], sample["cpu_percent"])
+                if self.metrics:
+                    self.metrics.observe_sample(tool, scenario, sample)
+                outcome = worker.wait(timeout=0.1)
+            
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            
+            return_code = outcome["return_code"]
+            result.update({
+                "duration_ms": duration_ms,
+                "status": "success" if return_code == 0 else "failed",
+                "stdout": outcome["console"],
+                "stderr": outcome["error"] or "",
+                "exit_code": return_code,
+                "step_times_ms": outcome["step_times_ms"],
+                "keywords": outcome["keywords"]
+            })
+            
+            if return_code != 0:
+                result["errors"].append(f"Robot return code: {return_code}")
+                
+        except Exception as e:
+            result["duration_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
             result["errors"].append(str(e))
             result["status"] = "error"
+        finally:
+            self.finish_samples(result, samples)
         
+        self.store_outputs(result)
         return result
     
+    def close(self):
+        """Stop long-lived helpers such as the Robot Framework worker"""
+        if self._robot_worker is not None:
+            self._robot_worker.stop()
+            self._robot_worker = None
+    
+    def null_scenario(self, name: str, command: List[str],
+                      idle_s: float = 0.0) -> Optional[float]:
+        """Median overhead of a command that does no work, or None if it failed
+        
+        With idle_s, `{idle}` in the command is replaced by an idle time
+        spread over one sampling period across the runs (so exit detection
+        lands at every phase of the loop) and that time is subtracted.
+        """
+        overheads = []
+        for i in range(1, CALIBRATION_RUNS + 1):
+            idle = idle_s + SAMPLE_PERIOD_S * i / CALIBRATION_RUNS if idle_s else 0.0
+            run_command = [part.replace("{idle}", f"{idle:.3f}") for part in command]
+            result = self.run_test("harness", f"calibration-{name}", run_command, i)
+            if result["status"] == "success":
+                overheads.append(result["duration_ms"] - idle * 1000)
+        return round(statistics.median(overheads), 2) if overheads else None
+    
+    def calibrate_overhead(self, test_command: List[str]) -> Optional[Dict[str, Any]]:
+        """Measure the harness's own overhead on this host (cached)
+        
+        run_test's wall time includes process spawn, exit detection by the
+        sampling loop and communicate(). Three null scenarios run through
+        run_test, so they pay exactly what a real iteration pays:
+        `true` (a process that exits at once still waits out one sampling
+        cycle), `sleep` for known times (spawn plus average sampling
+        quantization, i.e. the harness overhead) and, for Python commands,
+        an interpreter sleeping for the same times (adds interpreter startup).
+        Metrics, the blob store, sample series files and budget caps are
+        switched off while they run, so null runs leave no trace in them.
+        """
+        if not self.calibrate:
+            return None
+        hooks = (self.metrics, self.blob_store, self.sample_series, self.resource_budget)
+        self.metrics = self.blob_store = self.resource_budget = None
+        self.sample_series = False
+        try:
+            self.run_calibration(test_command)
+        finally:
+            self.metrics, self.blob_store, self.sample_series, self.resource_budget = hooks
+        self.save_metadata()
+        return self.calibration
+    
+    def run_calibration(self, test_command: List[str]):
+        """Run the null scenarios calibrate_overhead has not run yet"""
+        if self.calibration is None:
+            print("Calibrating harness overhead...")
+            true, sleep = shutil.which("true"), shutil.which("sleep")
+            self.calibration = {
+                "runs": CALIBRATION_RUNS,
+                "noop_ms": self.null_scenario("noop", [true]) if true else None,
+                "harness_overhead_ms": (self.null_scenario("idle", [sleep, "{idle}"], CALIBRATION_IDLE_S)
+                                        if sleep else None),
+                "interpreter_startup_ms": {}
+            }
+        python = test_command[0]
+        startup = self.calibration["interpreter_startup_ms"]
+        if (is_python_command(test_command) and python not in startup
+                and self.calibration["harness_overhead_ms"] is not None):
+            overhead = self.null_scenario(
+                "interpreter", [python, "-c", "import time; time.sleep({idle})"], CALIBRATION_IDLE_S)
+            startup[python] = (round(overhead - self.calibration["harness_overhead_ms"], 2)
+                               if overhead is not None else None)
+    
+    def apply_calibration(self, result: IterationResult, test_command: List[str]):
+        """Add overhead-corrected durations next to the raw duration_ms
+        
+        corrected_duration_ms removes the harness overhead;
+        work_duration_ms additionally removes interpreter startup.
+        """
+        if self.calibration is None or result["status"] != "success":
+            return
+        overhead = self.calibration["harness_overhead_ms"]
+        if overhead is None:
+            return
+        corrected = max(result["duration_ms"] - overhead, 0)
+        result["corrected_duration_ms"] = round(corrected, 2)
+        startup = self.calibration["interpreter_startup_ms"].get(test_command[0])
+        if startup is not None and is_python_command(test_command):
+            result["work_duration_ms"] = round(max(corrected - startup, 0), 2)
+    
+    def save_metadata(self):
+        """Write run metadata (host, options, calibration) next to the results"""
+        metadata = {
+            "results_file": self.results_file.name,
+            "host": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "memory_mb": round(psutil.virtual_memory().total / 1024 / 1024)
+            },
+            "timer": "time.perf_counter",
+            "import_profile": self.import_profile,
+            "memory_profile": self.memory_profile,
+            "resource_budget": self.resource_budget.to_dict() if self.resource_budget else None,
+            "calibration": self.calibration
+        }
+        metadata_file = self.results_file.with_name(
+            self.results_file.name.replace("benchmark_results_", "benchmark_metadata_"))
+        with open(metadata_file, 'w') as f:
+            json.dump(metadata, f, indent=2)
+    
+    def use_checkpoint(self, checkpoint: CampaignCheckpoint):
+        """Record progress in `checkpoint`, restoring results when it was resumed"""
+        self.checkpoint = checkpoint
+        if checkpoint.resumed:
+            self.results = [IterationResult.from_dict(r) for r in checkpoint.results]
+            if checkpoint.results_file:
+                self.results_file = self.output_dir / checkpoint.results_file
+    
     def run_scenario_iterations(self, tool: str, scenario: str, 
-                                test_command: List[str], iterations: int = 10):
-        """Run a scenario multiple times"""
+                                test_command: Optional[List[str]], iterations: int = 10,
+                                suite: Optional[str] = None):
+        """Run a scenario multiple times
+        
+        Scenarios with a `suite` run in the warm Robot Framework worker
+        instead of launching `test_command`. Iterations already recorded in
+        the campaign checkpoint are skipped.
+        """
         print(f"\n{'='*60}")
         print(f"Starting: {tool} - {scenario}")
         print(f"Iterations: {iterations}")
-        print(f"{'='*60}\n")
         
         scenario_results = []
+        pending = list(range(1, iterations + 1))
+        if self.checkpoint:
+            for i in range(1, iterations + 1):
+                done = self.checkpoint.result_for(tool, scenario, i)
+                if done is not None:
+                    scenario_results.append(IterationResult.from_dict(done))
+            pending = [i for i in pending if not self.checkpoint.is_done(tool, scenario, i)]
+            if scenario_results:
+                print(f"Resuming: {len(scenario_results)} iterations already complete")
+        print(f"{'='*60}\n")
+        
+        if suite and pending:
+            try:
+                self.robot_worker()
+            except Exception as e:
+                # run_robot_test retries the start and marks each iteration failed
+                print(f"✗ Robot Framework worker failed to start: {e}")
+        elif pending:
+            self.calibrate_overhead(test_command)
         
-        for i in range(1, iterations + 1):
-            result = self.run_test(tool, scenario, test_command, i)
+        for i in pending:
+            seed = self.checkpoint.seed_for(tool, scenario, i) if self.checkpoint else None
+            if self.metrics:
+                self.metrics.iteration_started(tool, scenario, i)
+            if suite:
+                result = self.run_robot_test(tool, scenario, suite, i)
+            else:
+                result = self.run_test(tool, scenario, test_command, i, seed)
+                self.apply_calibration(result, test_command)
+            if self.metrics:
+                self.metrics.observe_result(result)
             scenario_results.append(result)
             self.results.append(result)
             
             # Save after each iteration
             self.save_results()
+            if self.checkpoint:
+                self.checkpoint.record(result.to_dict(), seed if not suite else None)
             
             # Brief pause between iterations
             time.sleep(1)
         
         # Print summary for this scenario
         self.print_scenario_summary(tool, scenario, scenario_results)
+        return scenario_results
+    
+    def run_budget_sweep(self, tool: str, scenario: str, test_command: List[str],
+                         budgets: List[ResourceBudget], iterations: int,
+                         latency_target_ms: Optional[float] = None,
+                         latency_percentile: float = 95) -> Optional[ResourceBudget]:
+        """Run a scenario under each budget, cheapest first
+        
+        Returns the cheapest budget whose runs all succeeded and whose
+        latency percentile meets the target (None if none qualifies or no
+        target was given).
+        """
+        original_budget = self.resource_budget
+        rows = []
+        best = None
+        try:
+            for budget in sorted(budgets, key=lambda b: b.cost()):
+                self.resource_budget = budget
+                results = self.run_scenario_iterations(
+                    tool, f"{scenario}@{budget.label()}", test_command, iterations)
+                
+                successful = [r for r in results if r["status"] == "success"]
+                latency = (percentile([r["duration_ms"] for r in successful], latency_percentile)
+                           if successful else None)
+                caps = [r["resource_caps"] for r in results if "resource_caps" in r]
+                throttled = [c["throttled_ms"] for c in caps if c["throttled_ms"] is not None]
+                ok = (len(successful) == len(results) and latency is not None
+                      and (latency_target_ms is None or latency <= latency_target_ms))
+                rows.append((budget, len(successful), len(results), latency,
+                             statistics.mean(throttled) if throttled else None,
+                             sum(c["oom_events"] for c in caps), ok))
+                if ok and best is None and latency_target_ms is not None:
+                    best = budget
+        finally:
+            self.resource_budget = original_budget
+        
+        print(f"\n{'='*60}")
+        print(f"Budget Sweep: {tool} - {scenario}")
+        print(f"{'='*60}")
+        print(f"{'Budget':<24} {'Success':<10} {f'p{latency_percentile:g} (ms)':<12} "
+              f"{'Throttled (ms)':<15} {'OOM':<5}")
+        for budget, ok_count, total, latency, throttled, ooms, _ in rows:
+            latency_text = f"{latency:.0f}" if latency is not None else "-"
+            throttled_text = f"{throttled:.1f}" if throttled is not None else "n/a"
+            print(f"{budget.label():<24} {f'{ok_count}/{total}':<10} {latency_text:<12} "
+                  f"{throttled_text:<15} {ooms:<5}")
+        if latency_target_ms is not None:
+            if best is not None:
+                print(f"\nCheapest budget meeting p{latency_percentile:g} <= {latency_target_ms:g} ms: "
+                      f"{best.label()}")
+            else:
+                print(f"\nNo budget met p{latency_percentile:g} <= {latency_target_ms:g} ms")
+        print(f"{'='*60}\n")
+        return best
         
-    def print_scenario_summary(self, tool: str, scenario: str, results: List[Dict]):
+    def print_scenario_summary(self, tool: str, scenario: str, results: List[IterationResult]):
         """Print summary statistics for a scenario"""
         print(f"\n{'='*60}")
         print(f"Summary: {tool} - {scenario}")
@@ -157,6 +662,16 @@ class BenchmarkRunner:
             print(f"  Min: {min(durations)}")
             print(f"  Max: {max(durations)}")
             
+            corrected = [r["corrected_duration_ms"] for r in successful if "corrected_duration_ms" in r]
+            if corrected:
+                print(f"\nCorrected Time (ms, harness overhead "
+                      f"{self.calibration['harness_overhead_ms']:.2f} ms removed):")
+                print(f"  Mean: {statistics.mean(corrected):.2f}")
+                print(f"  Median: {statistics.median(corrected):.2f}")
+                work = [r["work_duration_ms"] for r in successful if "work_duration_ms" in r]
+                if work:
+                    print(f"  Median excluding interpreter startup: {statistics.median(work):.2f}")
+            
             print(f"\nMemory Usage (MB):")
             print(f"  Mean: {statistics.mean(memory):.2f}")
             print(f"  Max: {max(memory):.2f}")
@@ -164,6 +679,48 @@ class BenchmarkRunner:
             print(f"\nCPU Usage (%):")
             print(f"  Mean: {statistics.mean(cpu):.2f}")
             print(f"  Max: {max(cpu):.2f}")
+            
+            profiles = [r["startup_profile"] for r in successful if "startup_profile" in r]
+            if profiles:
+                print(f"\nStartup Breakdown (ms, mean):")
+                print(f"  Interpreter Startup: {statistics.mean(p['interpreter_startup_ms'] for p in profiles):.2f}")
+                print(f"  Imports: {statistics.mean(p['import_ms'] for p in profiles):.2f}")
+                print(f"  Work: {statistics.mean(p['work_ms'] for p in profiles):.2f}")
+                slowest = profiles[-1]["top_imports"][:3]
+                if slowest:
+                    print("  Slowest Imports: " + ", ".join(
+                        f"{i['module']} ({i['cumulative_ms']:.1f})" for i in slowest))
+        
+            memory_profiles = [r["memory_profile"] for r in successful if "memory_profile" in r]
+            if memory_profiles:
+                print(f"\nMemory Profile by Phase (KB, mean):")
+                for phase in memory_profiles[-1]:
+                    stats = [p[phase] for p in memory_profiles if phase in p]
+                    print(f"  {phase}: peak {statistics.mean(s['peak_kb'] for s in stats):.1f}, "
+                          f"retained {statistics.mean(s['retained_kb'] for s in stats):.1f}")
+                    top = memory_profiles[-1][phase]["top_allocations"][:1]
+                    if top:
+                        print(f"    top site: {top[0]['site']} (+{top[0]['size_kb']:.1f} KB)")
+        
+            step_times = [r["step_times_ms"] for r in successful if "step_times_ms" in r]
+            if step_times:
+                print(f"\nStep Times (ms, mean):")
+                for step in step_times[-1]:
+                    values = [st[step] for st in step_times if step in st]
+                    print(f"  {step}: {statistics.mean(values):.2f}")
+            
+            streaming = [r["streaming"] for r in successful if "streaming" in r]
+            if streaming:
+                first_row = [st["time_to_first_row_ms"] for st in streaming
+                             if st["time_to_first_row_ms"] is not None]
+                peak_rss = [st["peak_rss_mb"] for st in streaming if st["peak_rss_mb"] is not None]
+                print(f"\nStreaming Pipeline:")
+                print(f"  Items (mean): {statistics.mean(st['items'] for st in streaming):.0f}")
+                if first_row:
+                    print(f"  Time to First Row (ms): mean {statistics.mean(first_row):.2f}, "
+                          f"max {max(first_row):.2f}")
+                if peak_rss:
+                    print(f"  Peak RSS (MB): max {max(peak_rss):.2f}")
         
         if failed:
             print(f"\nFailed Runs: {len(failed)}")
@@ -173,10 +730,11 @@ class BenchmarkRunner:
         print(f"{'='*60}\n")
     
     def save_results(self):
-        """Save results to JSON file"""
-        output_file = self.output_dir / f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        """Save results to this run's JSON file (replaced atomically)"""
+        tmp_file = self.results_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump([result.to_dict() for result in self.results], f, indent=2)
+        os.replace(tmp_file, self.results_file)
     
     def generate_summary_report(self):
         """Generate overall summary report"""
@@ -210,6 +768,11 @@ class BenchmarkRunner:
         with open(summary_file, 'w') as f:
             f.write("RPA Benchmark Summary Report\n")
             f.write("=" * 60 + "\n\n")
+            if self.calibration:
+                f.write(f"Harness overhead: {self.calibration['harness_overhead_ms']} ms "
+                        f"(no-op process: {self.calibration['noop_ms']} ms)\n")
+                for python, ms in self.calibration["interpreter_startup_ms"].items():
+                    f.write(f"Interpreter startup overhead ({python}): {ms} ms\n")
             for (tool, scenario), results in sorted(by_tool_scenario.items()):
                 f.write(f"\n{tool} - {scenario}\n")
                 f.write("-" * 40 + "\n")
@@ -220,10 +783,104 @@ class BenchmarkRunner:
                     f.write(f"Mean Duration: {statistics.mean(durations):.2f} ms\n")
                     f.write(f"Median Duration: {statistics.median(durations):.2f} ms\n")
                     f.write(f"Std Dev: {statistics.stdev(durations) if len(durations) > 1 else 0:.2f} ms\n")
+                    corrected = [r["corrected_duration_ms"] for r in successful if "corrected_duration_ms" in r]
+                    if corrected:
+                        f.write(f"Corrected Mean Duration: {statistics.mean(corrected):.2f} ms\n")
+                        f.write(f"Corrected Median Duration: {statistics.median(corrected):.2f} ms\n")
+                    profiles = [r["startup_profile"] for r in successful if "startup_profile" in r]
+                    if profiles:
+                        f.write(f"Interpreter Startup: {statistics.mean(p['interpreter_startup_ms'] for p in profiles):.2f} ms\n")
+                        f.write(f"Import Time: {statistics.mean(p['import_ms'] for p in profiles):.2f} ms\n")
+                        f.write(f"Work Time: {statistics.mean(p['work_ms'] for p in profiles):.2f} ms\n")
+            
+            # Step-by-step comparison for scenarios reporting step times
+            # from more than one tool (e.g. robot keywords vs rpa-python steps)
+            by_scenario = {}
+            for (tool, scenario), results in sorted(by_tool_scenario.items()):
+                step_times = [r["step_times_ms"] for r in results
+                              if r["status"] == "success" and "step_times_ms" in r]
+                if step_times:
+                    by_scenario.setdefault(scenario, {})[tool] = step_times
+            for scenario, tools in by_scenario.items():
+                if len(tools) < 2:
+                    continue
+                f.write(f"\nStep Comparison - {scenario} (mean ms)\n")
+                f.write("-" * 40 + "\n")
+                steps = list(dict.fromkeys(step for times in tools.values() for step in times[-1]))
+                f.write(f"{'Step':<36}" + "".join(f"{tool:>18}" for tool in tools) + "\n")
+                for step in steps:
+                    row = f"{step:<36}"
+                    for times in tools.values():
+                        values = [t[step] for t in times if step in t]
+                        row += f"{statistics.mean(values):>18.2f}" if values else f"{'-':>18}"
+                    f.write(row + "\n")
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="RPA Benchmark Test Runner")
+    parser.add_argument("--output-dir", default="results",
+                        help="Directory for JSON results and summary report")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="Run Python scenarios with -X importtime and report "
+                             "startup vs import vs work time per iteration")
+    parser.add_argument("--memory-profile", action="store_true",
+                        help="Enable per-phase tracemalloc snapshots in the tests "
+                             "and store peak/retained allocations per phase")
+    parser.add_argument("--cpus", type=float,
+                        help="CPU quota per iteration in CPUs (cgroup v2 cpu.max)")
+    parser.add_argument("--memory-mb", type=int,
+                        help="Memory limit per iteration in MB (cgroup v2 memory.max, "
+                             "falls back to RLIMIT_AS)")
+    parser.add_argument("--cores", type=int,
+                        help="Number of CPU cores each iteration may run on")
+    parser.add_argument("--budget-sweep", action="append", default=[], metavar="SPEC",
+                        help="Resource budget to sweep, e.g. 'cpus=0.5,memory=256,cores=1'; "
+                             "repeat for each budget")
+    parser.add_argument("--metrics-port", type=int,
+                        help="Serve live Prometheus metrics on this port while running")
+    parser.add_argument("--metrics-host", default="127.0.0.1",
+                        help="Address for the metrics endpoint (default: 127.0.0.1)")
+    parser.add_argument("--blob-store", nargs="?", const="", metavar="DIR",
+                        help="Store stdout/stderr and artifacts deduplicated and compressed "
+                             "in DIR (default: <output-dir>/blobs); results keep digests")
+    parser.add_argument("--no-calibration", dest="calibrate", action="store_false",
+                        help="Skip the null-scenario harness overhead calibration")
+    parser.add_argument("--sample-series", action="store_true",
+                        help="Persist every iteration's full resource sample series as "
+                             "float64 rows in <output-dir>/samples (see sample_buffer.py)")
+    parser.add_argument("--html-report", action="store_true",
+                        help="Update the HTML latency report in <output-dir>/report when done")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the interrupted campaign in --output-dir, skipping "
+                             "finished iterations (without it a new checkpoint is started)")
+    parser.add_argument("--latency-target-ms", type=float,
+                        help="p95 latency target used to pick the cheapest swept budget")
+    return parser.parse_args(argv)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main execution"""
-    runner = BenchmarkRunner()
+    args = parse_args(argv)
+    budget = None
+    if args.cpus is not None or args.memory_mb is not None or args.cores is not None:
+        budget = ResourceBudget(cpus=args.cpus, memory_mb=args.memory_mb, cores=args.cores)
+    metrics_server = None
+    metrics = None
+    if args.metrics_port is not None:
+        metrics = MetricsRegistry()
+        metrics_server = MetricsServer(metrics, args.metrics_host, args.metrics_port).start()
+        print(f"Live metrics: {metrics_server.url}")
+    blob_store = None
+    if args.blob_store is not None:
+        blob_store = BlobStore(args.blob_store or Path(args.output_dir) / "blobs")
+    runner = BenchmarkRunner(output_dir=args.output_dir,
+                             import_profile=args.import_profile,
+                             memory_profile=args.memory_profile,
+                             resource_budget=budget,
+                             metrics=metrics,
+                             blob_store=blob_store,
+                             calibrate=args.calibrate,
+                             sample_series=args.sample_series)
+    sweep_budgets = [ResourceBudget.parse(spec) for spec in args.budget_sweep]
     
     # Example test configuration
     # In practice, you'll add actual test commands for each tool/scenario
@@ -235,22 +892,61 @@ def main():
             "command": ["python3", "implementations/rpa-python/business_workflow_test.py"],
             "iterations": 100
         },
+        {
+            "tool": "rpa-python",
+            "scenario": "business-workflow-streaming",
+            "command": ["python3", "implementations/rpa-python/business_workflow_test.py",
+                        "--streaming", "--pages", "10"],
+            "iterations": 100
+        },
         {
             "tool": "rpa-python",
             "scenario": "excel-automation",
             "command": ["python3", "implementations/rpa-python/excel_test.py"],
             "iterations": 100
         },
+        {
+            "tool": "rpa-python",
+            "scenario": "form-automation",
+            "command": ["python3", "implementations/rpa-python/form_test.py"],
+            "iterations": 100
+        },
+        {
+            "tool": "rpa-python",
+            "scenario": "file-operations",
+            "command": ["python3", "implementations/rpa-python/file_operations_test.py"],
+            "iterations": 100
+        },
+        {
+            "tool": "rpa-python",
+            "scenario": "file-operations-large-inbox",
+            "command": ["python3", "implementations/rpa-python/file_operations_test.py",
+                        "--files", "2000", "--size-kb", "64"],
+            "iterations": 100
+        },
+        {
+            "tool": "rpa-python",
+            "scenario": "api-integration",
+            "command": ["python3", "implementations/rpa-python/api_test.py"],
+            "iterations": 100
+        },
+        {
+            "tool": "rpa-python",
+            "scenario": "error-recovery",
+            "command": ["python3", "implementations/rpa-python/error_recovery_test.py"],
+            "iterations": 10
+        },
         # {
         #     "tool": "robot-framework",
         #     "scenario": "business-workflow",
-        #     "command": ["robot", "--outputdir", "results/robot-logs", "--log", "NONE", "--report", "NONE", "implementations/robot-framework/business_workflow_test.robot"],
+        #     "suite": "implementations/robot-framework/business_workflow_test.robot",
         #     "iterations": 100
         # },
+        # Needs ExcelLibrary (pip install robotframework-excellib)
         # {
         #     "tool": "robot-framework",
         #     "scenario": "excel-automation",
-        #     "command": ["robot", "--outputdir", "results/robot-logs", "--log", "NONE", "--report", "NONE", "implementations/robot-framework/excel_test.robot"],
+        #     "suite": "implementations/robot-framework/excel_test.robot",
         #     "iterations": 100
         # },
     ]
@@ -264,21 +960,75 @@ def main():
         print("    robot-framework/excel_test.robot")
         print("    rpa-python/excel_test.py")
         print("    openrpa/excel_test.xaml")
+        if metrics_server:
+            metrics_server.stop()
+        return 1
+    
+    campaign = {
+        "configs": test_configs,
+        "import_profile": args.import_profile,
+        "memory_profile": args.memory_profile,
+        "resource_budget": budget.to_dict() if budget else None,
+        "budget_sweep": [b.to_dict() for b in sweep_budgets],
+    }
+    try:
+        checkpoint = CampaignCheckpoint(args.output_dir, config_hash(campaign),
+                                        resume=args.resume,
+                                        results_file=runner.results_file.name)
+    except CheckpointMismatch as e:
+        print(f"✗ Cannot resume: {e}")
+        print("  Run without --resume to start a new campaign")
+        if metrics_server:
+            metrics_server.stop()
         return 1
+    runner.use_checkpoint(checkpoint)
+    if checkpoint.resumed:
+        print(f"Resuming campaign from {checkpoint.path} "
+              f"({len(checkpoint.completed)} iterations complete)")
+    runner.save_metadata()
     
     # Run all tests
     for config in test_configs:
         iterations = config.get("iterations", 10)  # Default to 10 if not specified
+        if sweep_budgets:
+            if "command" not in config:
+                print(f"Skipping budget sweep for {config['tool']} - {config['scenario']}: "
+                      "only subprocess scenarios can be capped")
+                continue
+            runner.run_budget_sweep(
+                tool=config["tool"],
+                scenario=config["scenario"],
+                test_command=config["command"],
+                budgets=sweep_budgets,
+                iterations=iterations,
+                latency_target_ms=args.latency_target_ms
+            )
+            continue
         runner.run_scenario_iterations(
             tool=config["tool"],
             scenario=config["scenario"],
-            test_command=config["command"],
-            iterations=iterations
+            test_command=config.get("command"),
+            iterations=iterations,
+            suite=config.get("suite")
         )
+    runner.close()
+    runner.save_metadata()
+    if metrics_server:
+        metrics_server.stop()
     
     # Generate final report
     runner.generate_summary_report()
     
+    if blob_store:
+        stats = blob_store.stats()
+        print(f"\nBlob store: {blob_store.root} ({stats['puts']} blobs, "
+              f"{stats['deduplicated']} deduplicated, {stats['logical_mb']:.2f} MB "
+              f"-> {stats['stored_mb']:.2f} MB stored)")
+    
+    if args.html_report:
+        from report_generator import ReportGenerator
+        print(f"HTML report: {ReportGenerator(args.output_dir).build()}")
+    
     print(f"\nResults saved to: {runner.output_dir}")
     return 0
 
@@ -0,0 +1,19 @@
+"""
+Unit tests for the benchmark harness and the RPA Python helpers
+
+Run from the repository root:
+    python3 -m unittest discover -s tests -t .
+    python3 -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCENARIO_DIR = ROOT / "implementations" / "rpa-python"
+
+# The runner modules and the scenario helpers are flat scripts, imported
+# the way they import each other
+for path in (ROOT, SCENARIO_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
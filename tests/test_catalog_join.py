@@ -0,0 +1,41 @@
+import unittest
+
+from catalog_join import CatalogJoin, item_label, product_key
+
+
+class ProductKeyTest(unittest.TestCase):
+    def test_widget_names_share_a_key(self):
+        self.assertEqual(product_key("Premium Widget A"), "WIDGET A")
+        self.assertEqual(product_key("widget  a "), "WIDGET A")
+        self.assertEqual(product_key("Budget Widget ab12"), "WIDGET AB12")
+
+    def test_other_names_are_normalised(self):
+        self.assertEqual(product_key("  Blue   Gadget "), "BLUE GADGET")
+        self.assertEqual(product_key(None), "")
+        self.assertEqual(product_key(42), "42")
+
+    def test_item_label(self):
+        self.assertEqual([item_label(i) for i in (1, 26, 27, 52, 703)],
+                         ["A", "Z", "AA", "AZ", "AAA"])
+
+
+class CatalogJoinTest(unittest.TestCase):
+    def test_matches_unordered_rows_and_reports_misses_and_duplicates(self):
+        catalog = [(2, {"name": "Premium Widget B"}), (3, {"name": "Widget A"}),
+                   (4, {"name": "Widget A"})]
+        market = [(2, {"item_name": "Widget A"}), (3, {"item_name": "Widget C"}),
+                  (4, {"item_name": "Widget B"}), (5, {"item_name": "Widget A"})]
+        join = CatalogJoin(catalog).probe_all(market)
+
+        self.assertEqual([(key, c_row, m_row) for key, c_row, _, m_row, _ in join.matched_rows()],
+                         [("WIDGET B", 2, 4), ("WIDGET A", 3, 2)])
+        stats = join.stats()
+        self.assertEqual(stats["catalog_rows"], 3)
+        self.assertEqual(stats["market_rows"], 4)
+        self.assertEqual(stats["unmatched_market"], ["WIDGET C"])
+        self.assertEqual(stats["duplicate_catalog_keys"], {"WIDGET A": [3, 4]})
+        self.assertEqual(stats["duplicate_market_keys"], {"WIDGET A": [2, 5]})
+
+
+if __name__ == "__main__":
+    unittest.main()
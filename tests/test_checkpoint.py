@@ -0,0 +1,74 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from checkpoint import CHECKPOINT_FILE, CampaignCheckpoint, CheckpointMismatch
+
+
+def result(iteration, status="success"):
+    return {"tool": "rpa-python", "scenario": "excel-automation",
+            "iteration": iteration, "status": status}
+
+
+class CampaignCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = self.tmp.name
+        self.path = Path(self.output_dir) / CHECKPOINT_FILE
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_restores_completed_iterations_and_seed(self):
+        first = CampaignCheckpoint(self.output_dir, "abc", results_file="results.json")
+        first.record(result(1), seed=first.seed_for("rpa-python", "excel-automation", 1))
+        first.record(result(2))
+
+        resumed = CampaignCheckpoint(self.output_dir, "abc", resume=True)
+        self.assertTrue(resumed.resumed)
+        self.assertEqual(resumed.base_seed, first.base_seed)
+        self.assertEqual(resumed.results_file, "results.json")
+        self.assertTrue(resumed.is_done("rpa-python", "excel-automation", 2))
+        self.assertFalse(resumed.is_done("rpa-python", "excel-automation", 3))
+        self.assertEqual(resumed.result_for("rpa-python", "excel-automation", 1), result(1))
+        self.assertEqual(resumed.seed_for("rpa-python", "excel-automation", 1),
+                         first.seed_for("rpa-python", "excel-automation", 1))
+
+    def test_without_resume_starts_a_new_campaign(self):
+        CampaignCheckpoint(self.output_dir, "abc").record(result(1))
+        fresh = CampaignCheckpoint(self.output_dir, "abc")
+        self.assertFalse(fresh.resumed)
+        self.assertEqual(len(self.path.read_text().splitlines()), 1)
+
+    def test_changed_config_refuses_to_resume(self):
+        CampaignCheckpoint(self.output_dir, "abc")
+        with self.assertRaises(CheckpointMismatch):
+            CampaignCheckpoint(self.output_dir, "def", resume=True)
+
+    def test_torn_final_line_is_truncated(self):
+        checkpoint = CampaignCheckpoint(self.output_dir, "abc")
+        checkpoint.record(result(1))
+        with open(self.path, "a") as f:
+            f.write('{"type": "iteration", "tool": "rpa-py')
+
+        resumed = CampaignCheckpoint(self.output_dir, "abc", resume=True)
+        self.assertTrue(resumed.resumed)
+        self.assertEqual(list(resumed.completed), [("rpa-python", "excel-automation", 1)])
+
+        resumed.record(result(2))
+        lines = self.path.read_text().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[-1])["iteration"], 2)
+
+    def test_empty_or_torn_header_starts_a_new_campaign(self):
+        for content in ("", '{"type": "campaign", "config_'):
+            self.path.write_text(content)
+            checkpoint = CampaignCheckpoint(self.output_dir, "abc", resume=True)
+            self.assertFalse(checkpoint.resumed)
+            header = json.loads(self.path.read_text())
+            self.assertEqual(header["config_hash"], "abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+
+from test_runner import BenchmarkRunner, parse_importtime
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       154 |        154 |   _io
+import time:       346 |        914 | _frozen_importlib_external
+import time:       120 |        120 |     openpyxl.compat
+import time:       800 |       2400 |   openpyxl.cell
+import time:      1500 |       5000 | openpyxl
+import time:       300 |        300 | scenario_helpers
+Traceback (most recent call last):
+import time: not a number | 12 | broken
+import time:       10 |        10 |
+✗ Error during test: boom
+"""
+
+
+class ParseImporttimeTest(unittest.TestCase):
+    def test_only_top_level_modules_are_counted(self):
+        top_level, _ = parse_importtime(STDERR)
+        # Nested modules are already inside their parent's cumulative time
+        self.assertEqual(top_level, [("_frozen_importlib_external", 914),
+                                     ("openpyxl", 5000), ("scenario_helpers", 300)])
+
+    def test_header_and_importtime_lines_are_removed_from_stderr(self):
+        _, remaining = parse_importtime(STDERR)
+        self.assertNotIn("self [us]", remaining)
+        self.assertNotIn("openpyxl", remaining)
+
+    def test_malformed_and_other_lines_are_kept_as_stderr(self):
+        top_level, remaining = parse_importtime(STDERR)
+        self.assertNotIn("broken", [name for name, _ in top_level])
+        self.assertEqual(remaining.splitlines(), [
+            "Traceback (most recent call last):",
+            "import time: not a number | 12 | broken",
+            "import time:       10 |        10 |",
+            "✗ Error during test: boom",
+        ])
+
+    def test_empty_stderr(self):
+        self.assertEqual(parse_importtime(""), ([], ""))
+
+
+class StartupBreakdownTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.runner = BenchmarkRunner(output_dir=self.tmp.name)
+        # Known baseline instead of launching the interpreter
+        self.runner._interpreter_baselines["python3"] = {
+            "startup_ms": 20.0, "modules": {"_frozen_importlib_external"}}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_scenario_imports_exclude_interpreter_startup_modules(self):
+        profile, remaining = self.runner.startup_breakdown("python3", STDERR, duration_ms=100.0)
+        self.assertEqual(profile["interpreter_startup_ms"], 20.0)
+        self.assertEqual(profile["import_ms"], 5.3)
+        self.assertEqual(profile["work_ms"], 74.7)
+        self.assertEqual(profile["top_imports"], [
+            {"module": "openpyxl", "cumulative_ms": 5.0},
+            {"module": "scenario_helpers", "cumulative_ms": 0.3},
+        ])
+        self.assertTrue(remaining.endswith("✗ Error during test: boom\n"))
+
+    def test_work_time_is_never_negative(self):
+        profile, _ = self.runner.startup_breakdown("python3", STDERR, duration_ms=10.0)
+        self.assertEqual(profile["work_ms"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from phase_executor import PhaseExecutor
+
+
+class PhaseExecutorTest(unittest.TestCase):
+    def test_runs_phases_after_their_inputs(self):
+        order = []
+        executor = PhaseExecutor(max_workers=1)
+        executor.add("report", lambda: order.append("report") or True, inputs=["analysis"])
+        executor.add("analyse", lambda: order.append("analyse") or True,
+                     inputs=["catalog"], outputs=["analysis"])
+        executor.add("setup", lambda: order.append("setup") or True, outputs=["catalog"])
+
+        self.assertTrue(executor.run())
+        self.assertEqual(order, ["setup", "analyse", "report"])
+        self.assertEqual(executor.critical_path(), ["setup", "analyse", "report"])
+
+    def test_cycle_is_rejected_before_anything_runs(self):
+        ran = []
+        executor = PhaseExecutor()
+        executor.add("a", lambda: ran.append("a") or True, inputs=["y"], outputs=["x"])
+        executor.add("b", lambda: ran.append("b") or True, inputs=["x"], outputs=["y"])
+
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            executor.run()
+        self.assertEqual(ran, [])
+
+    def test_missing_and_duplicate_producers_are_rejected(self):
+        executor = PhaseExecutor().add("a", lambda: True, inputs=["nowhere"])
+        with self.assertRaisesRegex(ValueError, "no phase produces"):
+            executor.dependencies()
+
+        executor = PhaseExecutor().add("a", lambda: True, outputs=["x"])
+        executor.add("b", lambda: True, outputs=["x"])
+        with self.assertRaisesRegex(ValueError, "produced by both"):
+            executor.dependencies()
+        with self.assertRaises(ValueError):
+            executor.add("a", lambda: True)
+
+    def test_failure_skips_dependents_but_not_independent_phases(self):
+        def broken():
+            raise RuntimeError("site down")
+
+        executor = PhaseExecutor(max_workers=1)
+        executor.add("scrape", broken, outputs=["market"])
+        executor.add("merge", lambda: True, inputs=["market"], outputs=["analysis"])
+        executor.add("verify", lambda: True, inputs=["analysis"])
+        executor.add("setup", lambda: True, outputs=["catalog"])
+
+        self.assertFalse(executor.run())
+        self.assertEqual(executor.failed_phase(), "scrape")
+        statuses = {name: t["status"] for name, t in executor.timings.items()}
+        self.assertEqual(statuses, {"scrape": "failed", "merge": "skipped",
+                                    "verify": "skipped", "setup": "passed"})
+
+    def test_overhead_is_excluded_from_the_schedule(self):
+        executor = PhaseExecutor(max_workers=1)
+        executor.add("setup", lambda: True, outputs=["catalog"], overhead=lambda: 0.0)
+        executor.add("report", lambda: True, inputs=["catalog"], overhead=lambda: 5.0)
+        executor.run()
+
+        schedule = executor.schedule()
+        self.assertEqual(schedule["excluded_ms"], 5.0)
+        self.assertEqual(schedule["phases"]["report"]["excluded_ms"], 5.0)
+        self.assertEqual(schedule["phases"]["report"]["duration_ms"], 0.0)
+        self.assertNotIn("excluded_ms", schedule["phases"]["setup"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+from retry_policy import RetryPolicy
+
+
+class Flaky:
+    """Operation failing with `error` for its first `failures` calls"""
+
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error(f"attempt {self.calls}")
+        return "ok"
+
+
+@mock.patch("retry_policy.time.sleep")
+class RetryPolicyTest(unittest.TestCase):
+    def test_backoff_doubles_up_to_the_cap(self, sleep):
+        policy = RetryPolicy(backoff_s=0.25, max_backoff_s=1.0, jitter=0)
+        self.assertEqual([policy.delay(retry) for retry in range(1, 6)],
+                         [0.25, 0.5, 1.0, 1.0, 1.0])
+
+    def test_jitter_stays_within_bounds_and_is_seeded(self, sleep):
+        first = RetryPolicy(backoff_s=1.0, jitter=0.1, seed=7)
+        second = RetryPolicy(backoff_s=1.0, jitter=0.1, seed=7)
+        delays = [first.delay(1) for _ in range(50)]
+        self.assertTrue(all(0.9 <= d <= 1.1 for d in delays))
+        self.assertEqual(delays, [second.delay(1) for _ in range(50)])
+
+    def test_recovers_and_logs_the_retries(self, sleep):
+        policy = RetryPolicy(attempts=3, backoff_s=0.25, jitter=0)
+        operation = Flaky(failures=2)
+
+        self.assertEqual(policy.call(operation, "GET /page/1/"), "ok")
+        self.assertEqual(operation.calls, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.25, 0.5])
+        event = policy.events[0]
+        self.assertEqual(event["errors"], ["ConnectionError", "ConnectionError"])
+        self.assertEqual(event["attempts"], 3)
+        self.assertTrue(event["recovered"])
+        self.assertEqual(event["backoff_ms"], 750.0)
+
+    def test_gives_up_after_the_last_attempt(self, sleep):
+        policy = RetryPolicy(attempts=2, jitter=0)
+        with self.assertRaises(ConnectionError):
+            policy.call(Flaky(failures=5), "GET /")
+        summary = policy.summary()
+        self.assertEqual(summary["unrecovered"], 1)
+        self.assertEqual(summary["retries"], 1)
+
+    def test_non_transient_errors_are_not_retried(self, sleep):
+        policy = RetryPolicy(attempts=3)
+        operation = Flaky(failures=1, error=ValueError)
+        with self.assertRaises(ValueError):
+            policy.call(operation, "parse", retry_on=lambda e: isinstance(e, ConnectionError))
+        self.assertEqual(operation.calls, 1)
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sample_buffer import SampleBuffer, load_series
+
+FIELDS = ("elapsed_s", "memory_mb")
+
+
+class SampleBufferTest(unittest.TestCase):
+    def test_wrapped_ring_keeps_recent_rows_and_full_statistics(self):
+        buffer = SampleBuffer(FIELDS, capacity=3)
+        for i in range(1, 6):
+            buffer.append(i, i * 10)
+
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.recent("memory_mb"), [30.0, 40.0, 50.0])
+        self.assertEqual(buffer.mean("memory_mb"), 30.0)
+        self.assertEqual(buffer.min("memory_mb"), 10.0)
+        self.assertEqual(buffer.max("elapsed_s"), 5.0)
+
+    def test_empty_buffer(self):
+        buffer = SampleBuffer(FIELDS)
+        self.assertEqual((buffer.mean("memory_mb"), buffer.max("memory_mb")), (0.0, 0.0))
+        self.assertEqual(buffer.recent("memory_mb"), [])
+
+    def test_spill_persists_the_complete_series(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "series.f64"
+            with open(path, "wb") as spill:
+                buffer = SampleBuffer(FIELDS, capacity=2, spill=spill)
+                for i in range(1, 6):
+                    buffer.append(i, i * 10)
+                self.assertEqual(buffer.recent("elapsed_s"), [5.0])
+                buffer.close()
+
+            series = load_series(path, FIELDS)
+            self.assertEqual(list(series["elapsed_s"]), [1.0, 2.0, 3.0, 4.0, 5.0])
+            self.assertEqual(list(series["memory_mb"]), [10.0, 20.0, 30.0, 40.0, 50.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.test_xlsx_reader import openpyxl, write_workbook
+from xlsx_fingerprint import diff, fingerprint
+
+
+@unittest.skipIf(openpyxl is None, "openpyxl is not installed")
+class XlsxDiffTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.a = Path(self.tmp.name) / "a.xlsx"
+        self.b = Path(self.tmp.name) / "b.xlsx"
+        write_workbook(self.a)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_identical_workbooks_need_no_decompression(self):
+        result = diff(self.a, self.a)
+        self.assertTrue(result["identical"])
+        self.assertEqual(result["sheets"]["Catalog"]["how"], "zip crc")
+
+    def test_changed_cells_are_listed(self):
+        write_workbook(self.b, price=24.5)
+        result = diff(self.a, self.b)
+        self.assertFalse(result["identical"])
+        catalog = result["sheets"]["Catalog"]
+        self.assertEqual(catalog["changed_rows"], 1)
+        self.assertEqual(catalog["cells"], [{"cell": "B2", "a": 19.99, "b": 24.5}])
+        self.assertEqual(result["sheets"]["Notes"]["status"], "identical")
+
+    def test_saved_fingerprint_points_at_changed_rows(self):
+        golden = fingerprint(self.a, row_hashes=True)
+        write_workbook(self.b, price=24.5)
+        result = diff(golden, self.b)
+        self.assertEqual(result["sheets"]["Catalog"]["how"], "row hashes")
+        self.assertEqual(result["sheets"]["Catalog"]["rows"], [2])
+        self.assertTrue(diff(golden, self.a)["identical"])
+
+
+if __name__ == "__main__":
+    unittest.main()
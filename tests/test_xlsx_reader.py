@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from xlsx_reader import XlsxReader, column_index
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+
+def write_workbook(path, price=19.99):
+    """Two-sheet workbook with strings, numbers, a bool, a formula and gaps"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Catalog"
+    ws.append(["Product", "Price", "Stock", "Active", "Total"])
+    ws.append(["Widget A", price, 12, True, "=B2*C2"])
+    ws.append([])
+    ws["A4"] = "Widget B"
+    ws["C4"] = 0
+    wb.create_sheet("Notes").append(["unchanged"])
+    wb.save(path)
+
+
+class ColumnIndexTest(unittest.TestCase):
+    def test_column_index(self):
+        self.assertEqual([column_index(ref) for ref in ("A1", "Z9", "AA1", "AB12")],
+                         [0, 25, 26, 27])
+
+
+@unittest.skipIf(openpyxl is None, "openpyxl is not installed")
+class XlsxReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "book.xlsx"
+        write_workbook(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reader_converts_values_like_openpyxl(self):
+        with XlsxReader(self.path) as book:
+            self.assertEqual(book.sheetnames, ["Catalog", "Notes"])
+            rows = list(book.rows("Catalog"))
+        self.assertEqual(rows[0], ("Product", "Price", "Stock", "Active", "Total"))
+        self.assertEqual(rows[1], ("Widget A", 19.99, 12, True, "=B2*C2"))
+        self.assertIsInstance(rows[1][2], int)
+        # The empty row stays visible, and skipped cells come back as None
+        self.assertEqual(rows[2], ())
+        self.assertEqual(rows[3], ("Widget B", None, 0))
+
+    def test_small_chunks_give_the_same_rows(self):
+        with XlsxReader(self.path) as book:
+            self.assertEqual(list(book.rows("Catalog", chunk_size=7)),
+                             list(book.rows("Catalog")))
+
+
+if __name__ == "__main__":
+    unittest.main()